@@ -0,0 +1,98 @@
+"""Compare request throughput of the legacy and pooled API client transports.
+
+The legacy side opens a new ClientSession, and so a new connection, with
+per-call headers and ClientTimeout for every request, as the config flow
+probes did before pooling. The pooled side is MosaicAPIClient with its
+keep-alive connector. Each worker requests its own display, the stub sends no
+ETags and the client's response cache is off, so every call is a real
+request and neither single-flight sharing nor 304s inflate the result.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_transport --requests 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+import aiohttp
+
+from custom_components.mosaic.api import MosaicAPIClient
+
+from .stub_server import StubAddon
+
+
+async def _legacy_get(url: str, api_key: str) -> Any:
+    """Request the way the integration did before pooling (session, headers and timeout per call)."""
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    async with aiohttp.ClientSession() as session:
+        async with session.request(
+            "GET", url, json=None, headers=headers, ssl=True,
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            return await resp.json()
+
+
+async def _run(requests: int, concurrency: int, call: Callable[[int], Awaitable[Any]]) -> float:
+    """Issue requests with bounded concurrency and return requests per second.
+
+    ``call`` receives the worker index, so workers can use distinct endpoints.
+    """
+    remaining = requests
+
+    async def worker(index: int) -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await call(index)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int, api_key: str) -> Dict[str, Any]:
+    """Benchmark both transports against a local stub add-on."""
+    stub = StubAddon(displays=concurrency, etag=False)
+    base_url = await stub.start()
+    try:
+        legacy = await _run(
+            requests,
+            concurrency,
+            lambda index: _legacy_get(f"{base_url}/api/displays/display_{index}", api_key),
+        )
+        legacy_served = stub.request_count
+
+        stub.reset_counters()
+        client = MosaicAPIClient(base_url, api_key=api_key, cache_size=0)
+        try:
+            pooled = await _run(requests, concurrency, lambda index: client.get_display(f"display_{index}"))
+        finally:
+            await client.close()
+        pooled_served = stub.request_count
+    finally:
+        await stub.stop()
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "legacy_rps": round(legacy, 1),
+        "pooled_rps": round(pooled, 1),
+        "legacy_served": legacy_served,
+        "pooled_served": pooled_served,
+        "speedup": round(pooled / legacy, 3),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--api-key", default="benchmark")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main(args.requests, args.concurrency, args.api_key)), indent=2))
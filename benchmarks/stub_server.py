@@ -0,0 +1,242 @@
+"""Local aiohttp stand-in for the Mosaic add-on."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StubAddon:
+    """Simulated Mosaic add-on API served from memory.
+
+    ``latency`` and ``jitter`` (seconds) delay every response by
+    ``latency ± jitter``; ``error_rate`` is the fraction of requests answered
+    with HTTP 500. GET responses carry an ETag and honour If-None-Match when
+    ``etag`` is enabled. ``/api/events`` serves server-sent events queued with
+    ``publish()`` while ``events`` is enabled, and answers 404 otherwise.
+    ``/api/displays/batch`` is only served when ``batch`` is enabled.
+    """
+
+    def __init__(
+        self,
+        displays: int = 4,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        etag: bool = True,
+        events: bool = True,
+        seed: Optional[int] = None,
+        batch: bool = False,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.etag = etag
+        self.events = events
+        self.batch = batch
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.error_count = 0
+        self.requests_by_route: Dict[str, int] = {}
+        self.notifications: List[Dict[str, Any]] = []
+        self._random = random.Random(seed)
+        self.displays: Dict[str, Dict[str, Any]] = {
+            f"display_{i}": {
+                "id": f"display_{i}",
+                "name": f"Display {i}",
+                "width": 64,
+                "height": 32,
+                "brightness": 80,
+                "power": True,
+                "current_app": "clock",
+            }
+            for i in range(displays)
+        }
+        self.rotations: Dict[str, Dict[str, Any]] = {
+            display_id: {"enabled": True, "apps": ["clock", "weather", "calendar"]}
+            for display_id in self.displays
+        }
+        self._subscribers: List["asyncio.Queue[Optional[bytes]]"] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        """Return the URL the stub is listening on."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stream_clients(self) -> int:
+        """Return the number of connected event stream clients."""
+        return len(self._subscribers)
+
+    def publish(self, event: str, data: Any) -> None:
+        """Send a server-sent event to every connected stream client."""
+        self.publish_raw(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+
+    def publish_raw(self, chunk: bytes) -> None:
+        """Send raw bytes to every connected stream client."""
+        for queue in self._subscribers:
+            queue.put_nowait(chunk)
+
+    def disconnect_streams(self) -> None:
+        """End every open event stream, as an add-on restart would."""
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    def reset_counters(self) -> None:
+        """Zero the request counters."""
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.error_count = 0
+        self.requests_by_route = {}
+
+    def _app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/status", self._status)
+        app.router.add_get("/api/events", self._events)
+        app.router.add_get("/api/displays", self._list_displays)
+        if self.batch:
+            app.router.add_post("/api/displays/batch", self._apply_batch)
+        app.router.add_get("/api/displays/{id}", self._get_display)
+        app.router.add_get("/api/displays/{id}/rotation", self._get_rotation)
+        app.router.add_put("/api/displays/{id}/rotation", self._set_rotation)
+        app.router.add_put("/api/displays/{id}/brightness", self._set_field("brightness"))
+        app.router.add_put("/api/displays/{id}/power", self._set_field("power"))
+        app.router.add_post("/api/displays/{id}/skip", self._skip)
+        app.router.add_post("/api/notify", self._notify)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.request_count += 1
+        resource = request.match_info.route.resource
+        route = resource.canonical if resource is not None else request.path
+        key = f"{request.method} {route}"
+        self.requests_by_route[key] = self.requests_by_route.get(key, 0) + 1
+
+        if self.latency or self.jitter:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            await asyncio.sleep(max(0.0, delay))
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.error_count += 1
+            raise web.HTTPInternalServerError(text="injected error")
+        return await handler(request)
+
+    async def start(self) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        self.disconnect_streams()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _json(self, request: web.Request, body: Any) -> web.Response:
+        """Return JSON, or 304 if the client already has this representation."""
+        text = json.dumps(body)
+        if not self.etag or request.method != "GET":
+            return web.Response(text=text, content_type="application/json")
+        etag = f'"{hashlib.md5(text.encode()).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified_count += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(text=text, content_type="application/json", headers={"ETag": etag})
+
+    def _display_or_404(self, request: web.Request) -> Dict[str, Any]:
+        display = self.displays.get(request.match_info["id"])
+        if display is None:
+            raise web.HTTPNotFound(text="display not found")
+        return display
+
+    async def _status(self, request: web.Request) -> web.Response:
+        return self._json(request, {"status": "ok", "version": "stub", "display": {"width": 64, "height": 32}})
+
+    async def _events(self, request: web.Request) -> web.StreamResponse:
+        if not self.events:
+            raise web.HTTPNotFound(text="event stream not supported")
+        response = web.StreamResponse(headers={"Cache-Control": "no-cache"})
+        response.content_type = "text/event-stream"
+        await response.prepare(request)
+        queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+        self._subscribers.append(queue)
+        try:
+            await response.write(b": connected\n\n")
+            while (chunk := await queue.get()) is not None:
+                await response.write(chunk)
+        finally:
+            self._subscribers.remove(queue)
+        return response
+
+    async def _list_displays(self, request: web.Request) -> web.Response:
+        return self._json(request, list(self.displays.values()))
+
+    async def _get_display(self, request: web.Request) -> web.Response:
+        return self._json(request, self._display_or_404(request))
+
+    async def _get_rotation(self, request: web.Request) -> web.Response:
+        display = self._display_or_404(request)
+        return self._json(request, self.rotations[display["id"]])
+
+    async def _set_rotation(self, request: web.Request) -> web.Response:
+        display = self._display_or_404(request)
+        body = await request.json()
+        rotation = self.rotations[display["id"]]
+        rotation["enabled"] = bool(body.get("enabled", rotation["enabled"]))
+        display["rotation_enabled"] = rotation["enabled"]
+        return self._json(request, rotation)
+
+    async def _apply_batch(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        results = []
+        for change in body.get("changes", []):
+            display_id = change.get("display_id")
+            display = self.displays.get(display_id)
+            if display is None:
+                error = "display not found"
+                results.append({"display_id": display_id, "success": False, "error": error})
+                continue
+            for field in ("brightness", "power"):
+                if field in change:
+                    display[field] = change[field]
+            if "rotation_enabled" in change:
+                self.rotations[display_id]["enabled"] = bool(change["rotation_enabled"])
+                display["rotation_enabled"] = self.rotations[display_id]["enabled"]
+            results.append({"display_id": display_id, "success": True, "error": None})
+        return self._json(request, {"results": results})
+
+    def _set_field(self, field: str):
+        async def handler(request: web.Request) -> web.Response:
+            display = self._display_or_404(request)
+            body = await request.json()
+            display[field] = body[field]
+            return self._json(request, display)
+
+        return handler
+
+    async def _skip(self, request: web.Request) -> web.Response:
+        display = self._display_or_404(request)
+        apps = self.rotations[display["id"]]["apps"]
+        index = (apps.index(display["current_app"]) + 1) % len(apps) if display["current_app"] in apps else 0
+        display["current_app"] = apps[index]
+        return self._json(request, {"current_app": display["current_app"]})
+
+    async def _notify(self, request: web.Request) -> web.Response:
+        self.notifications.append(await request.json())
+        return self._json(request, {"status": "queued"})
@@ -0,0 +1,195 @@
+"""Benchmark the API client and coordinator against a simulated add-on.
+
+Run from the repository root:
+
+    python -m benchmarks.suite --displays 12 --cycles 50 --latency 0.02 --jitter 0.01
+
+Prints a JSON report (or writes it with --output) so results can be compared
+between commits.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.mosaic.api import MosaicAPIClient, MosaicAPIError
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+
+from .stub_server import StubAddon
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """Summarise latency samples in milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pick(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    return {
+        "min_ms": round(ordered[0] * 1000, 3),
+        "p50_ms": round(pick(0.50) * 1000, 3),
+        "p90_ms": round(pick(0.90) * 1000, 3),
+        "p99_ms": round(pick(0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+async def bench_refresh(coordinator: MosaicDataUpdateCoordinator, stub: StubAddon, cycles: int) -> Dict[str, Any]:
+    """Time full coordinator refresh cycles."""
+    samples = []
+    failures = 0
+    stub.reset_counters()
+    for _ in range(cycles):
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        samples.append(time.perf_counter() - start)
+        if not coordinator.last_update_success:
+            failures += 1
+    return {
+        "cycles": cycles,
+        "failures": failures,
+        "latency": percentiles(samples),
+        "requests_per_cycle": round(stub.request_count / cycles, 3),
+        "not_modified_per_cycle": round(stub.not_modified_count / cycles, 3),
+        "requests_by_route": dict(sorted(stub.requests_by_route.items())),
+    }
+
+
+async def bench_client_commands(api: MosaicAPIClient, stub: StubAddon, commands: int, concurrency: int) -> Dict[str, Any]:
+    """Measure raw set_brightness throughput through the API client."""
+    display_ids = list(stub.displays)
+    remaining = commands
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            try:
+                await api.set_brightness(display_ids[remaining % len(display_ids)], remaining % 100)
+            except MosaicAPIError:
+                errors += 1
+
+    stub.reset_counters()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "commands": commands,
+        "concurrency": concurrency,
+        "errors": errors,
+        "commands_per_second": round(commands / elapsed, 1),
+        "requests": stub.request_count,
+    }
+
+
+async def bench_coordinator_commands(
+    coordinator: MosaicDataUpdateCoordinator, stub: StubAddon, commands: int
+) -> Dict[str, Any]:
+    """Fire a slider-style burst of brightness commands at every display."""
+    display_ids = list(stub.displays)
+    stub.reset_counters()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            coordinator.async_set_brightness(display_id, step % 100)
+            for step in range(commands)
+            for display_id in display_ids
+        )
+    )
+    elapsed = time.perf_counter() - start
+    issued = commands * len(display_ids)
+    final_ok = all(
+        stub.displays[display_id]["brightness"] == (commands - 1) % 100 for display_id in display_ids
+    )
+    return {
+        "commands": issued,
+        "commands_per_second": round(issued / elapsed, 1),
+        "requests": stub.request_count,
+        "requests_per_command": round(stub.request_count / issued, 4),
+        "final_state_matches": final_ok,
+    }
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run every benchmark and return the report."""
+    stub = StubAddon(
+        displays=args.displays,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    base_url = await stub.start()
+
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        api = MosaicAPIClient(base_url)
+        coordinator = MosaicDataUpdateCoordinator(hass, api)
+        try:
+            refresh = await bench_refresh(coordinator, stub, args.cycles)
+            client_commands = await bench_client_commands(api, stub, args.commands, args.concurrency)
+            coordinator_commands = await bench_coordinator_commands(coordinator, stub, args.burst)
+        finally:
+            await coordinator.async_shutdown()
+            await api.close()
+            await stub.stop()
+            await hass.async_stop(force=True)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "benchmark": "mosaic",
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "config": {
+            "displays": args.displays,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+            "seed": args.seed,
+        },
+        "refresh": refresh,
+        "client_commands": client_commands,
+        "coordinator_commands": coordinator_commands,
+        "peak_memory_bytes": peak,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--displays", type=int, default=12)
+    parser.add_argument("--cycles", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="± seconds of random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--commands", type=int, default=1000, help="client set_brightness calls")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--burst", type=int, default=20, help="coordinator commands per display")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    report = asyncio.run(main(arguments))
+    text = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
@@ -1,15 +1,63 @@
 """Mosaic LED Display integration for Home Assistant."""
 
+import asyncio
 import logging
-from typing import Final
+from typing import Any, Dict, Final, List, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from .api import MosaicAPIClient
-from .const import CONF_API_KEY, CONF_URL, CONF_VERIFY_SSL, DATA_API, DATA_COORDINATOR, DOMAIN
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    CONF_API_KEY,
+    CONF_BURST_INTERVAL,
+    CONF_DISPLAY_TIMEOUT,
+    CONF_IDLE_INTERVAL,
+    CONF_MAX_BACKOFF,
+    CONF_POLL_INTERVAL,
+    CONF_REFRESH_CONCURRENCY,
+    CONF_RETRIES,
+    CONF_ROTATION_INTERVAL,
+    CONF_URL,
+    CONF_VERIFY_SSL,
+    DATA_API,
+    DATA_COORDINATOR,
+    DATA_SCHEDULER,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_DISPLAY_TIMEOUT,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_BACKOFF,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_REFRESH_CONCURRENCY,
+    DEFAULT_RETRIES,
+    DEFAULT_ROTATION_INTERVAL,
+    DOMAIN,
+    IMAGE_DEFAULT_COLORS,
+    PRIORITY_NORMAL,
+    PROFILE_DEFAULT_SECONDS,
+    SERVICE_APPLY,
+    SERVICE_PUSH_ANIMATION,
+    SERVICE_PROFILE,
+    SERVICE_PUSH_IMAGE,
+    STORAGE_VERSION,
+)
 from .coordinator import MosaicDataUpdateCoordinator
+from .journal import CommandJournal
+from .polling import AdaptivePollPolicy
+from .profiler import async_profile
+from .scheduler import MosaicScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,32 +67,111 @@ PLATFORMS: Final = [Platform.LIGHT, Platform.SWITCH, Platform.SENSOR]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Mosaic from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    options = {**entry.data, **entry.options}
+    scheduler = hass.data[DOMAIN].get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DOMAIN][DATA_SCHEDULER] = MosaicScheduler()
 
+    verify_ssl = options.get(CONF_VERIFY_SSL, True)
     api = MosaicAPIClient(
-        base_url=entry.data[CONF_URL],
-        api_key=entry.data.get(CONF_API_KEY),
-        verify_ssl=entry.data.get(CONF_VERIFY_SSL, True),
+        base_url=options[CONF_URL],
+        api_key=options.get(CONF_API_KEY) or None,
+        verify_ssl=verify_ssl,
+        session=async_get_clientsession(hass, verify_ssl=verify_ssl),
+        retries=options.get(CONF_RETRIES, DEFAULT_RETRIES),
+        request_limit=scheduler.request_limit,
     )
 
-    coordinator = MosaicDataUpdateCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    journal = CommandJournal(Store(hass, STORAGE_VERSION, _journal_storage_key(entry)))
+    await journal.async_load()
+
+    coordinator = MosaicDataUpdateCoordinator(
+        hass,
+        api,
+        refresh_concurrency=options.get(CONF_REFRESH_CONCURRENCY, DEFAULT_REFRESH_CONCURRENCY),
+        display_timeout=options.get(CONF_DISPLAY_TIMEOUT, DEFAULT_DISPLAY_TIMEOUT),
+        poll_policy=AdaptivePollPolicy(
+            interval=options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
+            burst_interval=options.get(CONF_BURST_INTERVAL, DEFAULT_BURST_INTERVAL),
+            idle_interval=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+            max_backoff=options.get(CONF_MAX_BACKOFF, DEFAULT_MAX_BACKOFF),
+        ),
+        store=Store(hass, STORAGE_VERSION, _storage_key(entry)),
+        rotation_interval=options.get(CONF_ROTATION_INTERVAL, DEFAULT_ROTATION_INTERVAL),
+        scheduler=scheduler,
+        journal=journal,
+    )
+    if await coordinator.async_load_cached():
+        # Create entities from the last known state, confirm it without blocking startup
+        hass.async_create_background_task(
+            coordinator.async_refresh(), name=f"{DOMAIN} first refresh"
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            # Give the scheduler slot back before Home Assistant retries setup
+            await coordinator.async_shutdown()
+            raise
+    coordinator.async_start_stream()
 
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_API: api,
         DATA_COORDINATOR: coordinator,
     }
 
+    await _async_migrate_unique_ids(hass, entry)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     await async_setup_services(hass, entry)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+async def _async_migrate_unique_ids(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Scope display entity unique IDs to the entry, keeping registry customizations.
+
+    Before several add-ons were supported they were ``mosaic_{display_id}...``,
+    which collides between add-ons that have a display with the same ID.
+    """
+    prefix = f"{DOMAIN}_{entry.entry_id}_"
+
+    @callback
+    def _migrate(entity_entry: er.RegistryEntry) -> Optional[Dict[str, Any]]:
+        if entity_entry.unique_id.startswith(prefix):
+            return None
+        return {"new_unique_id": prefix + entity_entry.unique_id.removeprefix(f"{DOMAIN}_")}
+
+    await er.async_migrate_entries(hass, entry.entry_id, _migrate)
+
+
+def _storage_key(entry: ConfigEntry) -> str:
+    """Return the storage key for an entry's persisted display state."""
+    return f"{DOMAIN}.{entry.entry_id}"
+
+
+def _journal_storage_key(entry: ConfigEntry) -> str:
+    """Return the storage key for an entry's offline command journal."""
+    return f"{_storage_key(entry)}.journal"
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted state when a config entry is deleted."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry)).async_remove()
+    await Store(hass, STORAGE_VERSION, _journal_storage_key(entry)).async_remove()
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload Mosaic config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Mosaic config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        await hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR].async_shutdown()
         api = hass.data[DOMAIN][entry.entry_id][DATA_API]
         await api.close()
         hass.data[DOMAIN].pop(entry.entry_id)
@@ -52,21 +179,103 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+def _coordinators(hass: HomeAssistant) -> List[MosaicDataUpdateCoordinator]:
+    """Return the coordinators of all loaded entries."""
+    return [
+        data[DATA_COORDINATOR]
+        for data in hass.data.get(DOMAIN, {}).values()
+        if isinstance(data, dict) and DATA_COORDINATOR in data
+    ]
+
+
+def _coordinator_for(
+    hass: HomeAssistant, display_id: Optional[str], entry_id: Optional[str] = None
+) -> MosaicDataUpdateCoordinator:
+    """Return the entry's coordinator, else the one owning the display, else the first."""
+    if entry_id:
+        data = hass.data.get(DOMAIN, {}).get(entry_id)
+        if not isinstance(data, dict) or DATA_COORDINATOR not in data:
+            raise HomeAssistantError(f"Mosaic add-on {entry_id} is not loaded")
+        return data[DATA_COORDINATOR]
+    coordinators = _coordinators(hass)
+    if not coordinators:
+        raise HomeAssistantError("No Mosaic add-on is loaded")
+    if display_id:
+        owners = [
+            coordinator for coordinator in coordinators
+            if coordinator.get_snapshot(display_id) is not None
+        ]
+        if len(owners) > 1:
+            raise HomeAssistantError(
+                f"Several Mosaic add-ons have a display {display_id}, "
+                f"set {ATTR_CONFIG_ENTRY_ID} to choose one"
+            )
+        if owners:
+            return owners[0]
+    return coordinators[0]
+
+
 async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Set up services."""
-    coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    """Set up services, routed to the entry that owns the target display."""
 
     async def handle_push_text(call) -> None:
         text = call.data.get("text", "")
-        duration = call.data.get("duration", 10)
+        duration = call.data.get("duration")
         color = call.data.get("color", "#FFFFFF")
         display_id = call.data.get("display_id")
-        await coordinator.async_push_text(text, duration, color, display_id)
+        priority = call.data.get("priority", PRIORITY_NORMAL)
+        font = call.data.get("font")
+        coordinator = _coordinator_for(hass, display_id, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        await coordinator.async_push_text(text, duration, color, display_id, priority, font)
+
+    async def handle_push_image(call) -> None:
+        image = call.data.get("image", "")
+        duration = call.data.get("duration", 10)
+        display_id = call.data.get("display_id")
+        priority = call.data.get("priority", PRIORITY_NORMAL)
+        colors = call.data.get("colors", IMAGE_DEFAULT_COLORS)
+        coordinator = _coordinator_for(hass, display_id, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        await coordinator.async_push_image(image, duration, display_id, priority, colors)
+
+    async def handle_push_animation(call) -> None:
+        animation = call.data.get("animation", "")
+        duration = call.data.get("duration", 10)
+        display_id = call.data.get("display_id")
+        priority = call.data.get("priority", PRIORITY_NORMAL)
+        colors = call.data.get("colors", IMAGE_DEFAULT_COLORS)
+        coordinator = _coordinator_for(hass, display_id, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        await coordinator.async_push_animation(animation, duration, display_id, priority, colors)
 
     async def handle_skip(call) -> None:
         display_id = call.data.get("display_id")
+        coordinator = _coordinator_for(hass, display_id, call.data.get(ATTR_CONFIG_ENTRY_ID))
         await coordinator.async_skip(display_id)
 
+    async def handle_apply(call: ServiceCall) -> ServiceResponse:
+        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+        grouped: Dict[MosaicDataUpdateCoordinator, List[Dict[str, Any]]] = {}
+        for change in call.data.get("changes", []):
+            if isinstance(change, dict) and change.get("display_id"):
+                coordinator = _coordinator_for(hass, change["display_id"], entry_id)
+                grouped.setdefault(coordinator, []).append(dict(change))
+        results: Dict[str, Any] = {}
+        for outcome in await asyncio.gather(
+            *(coordinator.async_apply(changes) for coordinator, changes in grouped.items())
+        ):
+            results.update(outcome)
+        return {"results": results}
+
+    async def handle_profile(call: ServiceCall) -> ServiceResponse:
+        return await async_profile(hass, call.data.get("seconds", PROFILE_DEFAULT_SECONDS))
+
     hass.services.async_register(DOMAIN, "push_text", handle_push_text)
+    hass.services.async_register(DOMAIN, SERVICE_PUSH_IMAGE, handle_push_image)
+    hass.services.async_register(DOMAIN, SERVICE_PUSH_ANIMATION, handle_push_animation)
     hass.services.async_register(DOMAIN, "skip", handle_skip)
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY, handle_apply, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, handle_profile, supports_response=SupportsResponse.OPTIONAL
+    )
     _LOGGER.info("Mosaic services registered")
@@ -2,59 +2,445 @@
 
 import aiohttp
 import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import random
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from .circuit import CircuitBreaker
+from .const import DEFAULT_FRAME_FPS, DEFAULT_RETRIES
+from .frames import FrameStream
+from .metrics import APIMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_REQUEST_TIMEOUT = 10
+CONNECTOR_LIMIT = 32
+CONNECTOR_LIMIT_PER_HOST = 8
+CONNECTOR_KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+RESPONSE_CACHE_SIZE = 64
+RETRY_METHODS = ("GET", "PUT")
+RETRY_STATUSES = (502, 503, 504)
+RETRY_BACKOFF = 0.25
+
+STREAM_ENDPOINT = "/api/events"
+STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=90)
+FRAME_CONNECT_TIMEOUT = 10
+
+# Statuses meaning the add-on does not implement an optional endpoint
+UNSUPPORTED_STATUSES = (404, 405, 501)
+
 
 class MosaicAPIError(Exception):
     """Mosaic API error."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class MosaicConnectionError(MosaicAPIError):
+    """The add-on could not be reached."""
     pass
 
 
+class MosaicTimeoutError(MosaicConnectionError):
+    """The add-on did not answer in time."""
+    pass
+
+
+class MosaicCircuitOpenError(MosaicConnectionError):
+    """Requests are refused because the add-on keeps failing."""
+    pass
+
+
+class MosaicStreamUnsupportedError(MosaicAPIError):
+    """The add-on does not offer a server-sent event stream."""
+    pass
+
+
+class _CachedResponse:
+    """Validators and parsed body of a cacheable GET response."""
+
+    __slots__ = ("validators", "body", "invalidated")
+
+    def __init__(self, validators: Dict[str, str], body: Any):
+        self.validators = validators
+        self.body = body
+        # Set when a write to the resource started, the body may predate it
+        self.invalidated = False
+
+
 class MosaicAPIClient:
-    """Client for Mosaic add-on API."""
+    """Client for Mosaic add-on API.
+
+    GET responses carrying an ETag or Last-Modified header are cached and
+    revalidated with conditional requests; a 304 returns the cached object.
+    Concurrent identical GETs share a single in-flight request and parsed
+    result. Returned data is shared with the cache and with other callers and
+    must be treated as read-only.
 
-    def __init__(self, base_url: str, api_key: Optional[str] = None, verify_ssl: bool = True):
+    GET and PUT requests are retried with jittered backoff on connection
+    errors and 502/503/504. A circuit breaker fails requests fast while the
+    add-on keeps failing; pass ``use_circuit_breaker=False`` to disable it.
+
+    ``request_limit`` is an optional semaphore shared between clients to cap
+    concurrent outbound requests; the event stream does not count against it.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        verify_ssl: bool = True,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        cache_size: int = RESPONSE_CACHE_SIZE,
+        connect_timeout: Optional[float] = None,
+        retries: int = DEFAULT_RETRIES,
+        use_circuit_breaker: bool = True,
+        request_limit: Optional[asyncio.Semaphore] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.verify_ssl = verify_ssl
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session = session
+        self._owns_session = session is None
+
+        # Request options are fixed for the client's lifetime, build them once
+        self._ssl = self.verify_ssl if self.verify_ssl else False
+        self._timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=connect_timeout)
+        self._headers = {"Content-Type": "application/json"}
+        self._stream_headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        self._frame_headers: Dict[str, str] = {}
+        if self.api_key:
+            self._headers["Authorization"] = f"Bearer {self.api_key}"
+            self._stream_headers["Authorization"] = f"Bearer {self.api_key}"
+            self._frame_headers["Authorization"] = f"Bearer {self.api_key}"
+
+        self._cache: "OrderedDict[str, _CachedResponse]" = OrderedDict()
+        self._cache_size = cache_size
+        self.metrics = APIMetrics()
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.retries = max(0, retries)
+        self.circuit_breaker: Optional[CircuitBreaker] = CircuitBreaker() if use_circuit_breaker else None
+        self.request_limit = request_limit
 
     async def close(self):
-        """Close the session."""
-        if self._session and not self._session.closed:
+        """Close the session if this client created it."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTOR_LIMIT,
+                limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
         return self._session
 
-    async def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Any:
-        """Make an API request."""
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Make an API request, sharing one in-flight request between identical GETs.
+
+        ``limit`` is held and ``timeout`` enforced inside the shared request, so
+        a caller's concurrency slot stays taken until the request really ends.
+        """
+        if method != "GET":
+            self._forget_inflight(endpoint)
+            return await self._async_request_bounded(method, endpoint, data, limit, timeout)
+
+        task = self._inflight.get(endpoint)
+        if task is None:
+            task = asyncio.ensure_future(self._async_request_bounded(method, endpoint, None, limit, timeout))
+            self._inflight[endpoint] = task
+            task.add_done_callback(lambda done: self._inflight_done(endpoint, done))
+        else:
+            self.metrics.stats(method, endpoint).shared += 1
+        # Shielded so one caller giving up doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, endpoint: str, task: "asyncio.Future[Any]") -> None:
+        """Forget a finished shared request."""
+        if self._inflight.get(endpoint) is task:
+            del self._inflight[endpoint]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved in case every caller went away
+
+    def _forget_inflight(self, endpoint: str) -> None:
+        """Stop sharing in-flight GETs that a write to endpoint may make stale."""
+        for inflight_endpoint in list(self._inflight):
+            if endpoint == inflight_endpoint or endpoint.startswith(f"{inflight_endpoint}/"):
+                del self._inflight[inflight_endpoint]
+
+    async def _async_request_bounded(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Make an API request while holding limit, cancelling it after timeout seconds."""
+        if limit is not None:
+            async with limit:
+                return await self._async_request_bounded(method, endpoint, data, None, timeout)
+        if timeout is None:
+            return await self._async_request_with_retry(method, endpoint, data)
+        try:
+            return await asyncio.wait_for(self._async_request_with_retry(method, endpoint, data), timeout)
+        except asyncio.TimeoutError:
+            raise MosaicTimeoutError(f"Request timeout after {timeout}s")
+
+    async def _async_request_with_retry(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Any:
+        """Make an API request, retrying idempotent methods on transient failures."""
+        breaker = self.circuit_breaker
+        probe = None
+        if breaker is not None:
+            allowed, probe = breaker.allow_request()
+            if not allowed:
+                raise MosaicCircuitOpenError(f"Circuit open for {self.base_url}")
+
+        retries = self.retries if method in RETRY_METHODS else 0
+        if probe is not None:
+            retries = 0  # A half-open probe gets exactly one attempt
+
+        attempt = 0
+        try:
+            while True:
+                try:
+                    result = await self._async_request_limited(method, endpoint, data)
+                except MosaicAPIError as err:
+                    transient = isinstance(err, MosaicConnectionError) or err.status in RETRY_STATUSES
+                    # Timeouts already waited out the full request timeout, don't repeat that
+                    if transient and attempt < retries and not isinstance(err, MosaicTimeoutError):
+                        attempt += 1
+                        await asyncio.sleep(random.uniform(0, RETRY_BACKOFF * 2 ** attempt))
+                        continue
+                    if breaker is not None:
+                        if transient or (err.status or 0) >= 500:
+                            breaker.record_failure(probe)
+                        else:
+                            breaker.record_success(probe)
+                    raise
+                if breaker is not None:
+                    breaker.record_success(probe)
+                return result
+        finally:
+            if probe is not None:
+                # Cancelled or unexpected errors must not leave a probe hanging
+                breaker.release_probe(probe)
+
+    async def _async_request_limited(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Any:
+        """Make a single API request once the shared request limit allows it."""
+        if self.request_limit is None:
+            return await self._async_request_once(method, endpoint, data)
+        async with self.request_limit:
+            return await self._async_request_once(method, endpoint, data)
+
+    async def _async_request_once(
+        self, method: str, endpoint: str, data: Optional[Dict] = None, conditional: bool = True
+    ) -> Any:
+        """Make a single API request."""
         url = f"{self.base_url}{endpoint}"
         session = await self._get_session()
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
 
+        headers = self._headers
+        cached = None
+        if method != "GET":
+            self._invalidate(endpoint)
+        elif conditional:
+            cached = self._cache.get(endpoint)
+            if cached is not None:
+                headers = {**self._headers, **cached.validators}
+
+        stats = self.metrics.stats(method, endpoint)
+        stats.requests += 1
+        stats.in_flight += 1
+        start = time.monotonic()
         try:
             async with session.request(
                 method, url, json=data, headers=headers,
-                ssl=self.verify_ssl if self.verify_ssl else False,
-                timeout=aiohttp.ClientTimeout(total=10),
+                ssl=self._ssl, timeout=self._timeout,
             ) as resp:
-                if resp.status == 200:
-                    return await resp.json()
+                if resp.status == 304 and cached is not None:
+                    stats.not_modified += 1
+                    if not cached.invalidated:
+                        # Evicted meanwhile or not, the server confirmed the body is current
+                        if self._cache.get(endpoint) is cached:
+                            self._cache.move_to_end(endpoint)
+                        return cached.body
                 else:
+                    raw = await resp.read()
+                    stats.bytes_received += len(raw)
+                    if resp.status == 200:
+                        try:
+                            body = json.loads(raw)
+                        except ValueError as e:
+                            raise MosaicAPIError(f"Invalid JSON response: {e}", resp.status)
+                        if method == "GET":
+                            self._store(endpoint, resp, body)
+                        return body
+                    else:
+                        text = raw.decode("utf-8", "replace")
+                        raise MosaicAPIError(f"API error {resp.status}: {text}", resp.status)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise MosaicTimeoutError("Request timeout")
+        except aiohttp.ClientError as e:
+            stats.errors += 1
+            raise MosaicConnectionError(f"Connection error: {e}")
+        except MosaicAPIError:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.latency.observe(time.monotonic() - start)
+
+        # A write started while this GET was in flight, the cached body may predate it
+        return await self._async_request_once(method, endpoint, data, conditional=False)
+
+    def _store(self, endpoint: str, resp: aiohttp.ClientResponse, body: Any) -> None:
+        """Remember a GET response if the server sent cache validators."""
+        validators = {}
+        if etag := resp.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := resp.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        if not validators:
+            self._cache.pop(endpoint, None)
+            return
+
+        self._cache[endpoint] = _CachedResponse(validators, body)
+        self._cache.move_to_end(endpoint)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Drop cached responses for a written resource and its parents."""
+        for cached_endpoint in list(self._cache):
+            if endpoint == cached_endpoint or endpoint.startswith(f"{cached_endpoint}/"):
+                self._cache.pop(cached_endpoint).invalidated = True
+
+    async def subscribe_events(
+        self, on_connect: Optional[Callable[[], None]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield display events pushed by the add-on over server-sent events.
+
+        Each event is a dict with ``event`` (the SSE event name) and ``data``
+        (the decoded JSON payload). Raises MosaicStreamUnsupportedError when
+        the add-on has no event stream, MosaicAPIError when the stream drops.
+        """
+        url = f"{self.base_url}{STREAM_ENDPOINT}"
+        session = await self._get_session()
+
+        try:
+            async with session.get(
+                url, headers=self._stream_headers, ssl=self._ssl, timeout=STREAM_TIMEOUT,
+            ) as resp:
+                if resp.status in UNSUPPORTED_STATUSES:
+                    raise MosaicStreamUnsupportedError(
+                        f"Event stream not supported ({resp.status})", resp.status
+                    )
+                if resp.status != 200:
                     text = await resp.text()
-                    raise MosaicAPIError(f"API error {resp.status}: {text}")
+                    raise MosaicAPIError(f"API error {resp.status}: {text}", resp.status)
+                if resp.content_type != "text/event-stream":
+                    raise MosaicStreamUnsupportedError(
+                        f"Unexpected stream content type {resp.content_type}"
+                    )
+
+                if on_connect is not None:
+                    on_connect()
+
+                event_name = "message"
+                data_lines: List[str] = []
+                async for raw_line in resp.content:
+                    line = raw_line.decode("utf-8", "replace").rstrip("\r\n")
+                    if not line:
+                        if data_lines:
+                            try:
+                                payload = json.loads("\n".join(data_lines))
+                            except ValueError:
+                                _LOGGER.debug(f"Ignoring malformed {event_name} event")
+                            else:
+                                yield {"event": event_name, "data": payload}
+                        event_name = "message"
+                        data_lines = []
+                    elif line.startswith(":"):
+                        continue  # Comment / keep-alive
+                    else:
+                        field, _, value = line.partition(":")
+                        value = value[1:] if value.startswith(" ") else value
+                        if field == "event":
+                            event_name = value
+                        elif field == "data":
+                            data_lines.append(value)
+
+                raise MosaicAPIError("Event stream closed by server")
+        except asyncio.TimeoutError:
+            raise MosaicTimeoutError("Event stream timeout")
+        except aiohttp.ClientError as e:
+            raise MosaicConnectionError(f"Connection error: {e}")
+
+    async def open_frame_stream(
+        self, display_id: str, width: int, height: int, fps: float = DEFAULT_FRAME_FPS
+    ) -> FrameStream:
+        """Open a WebSocket to stream raw RGB24 frames to a display.
+
+        The first message announces the format and geometry as JSON; every
+        following binary message is one ``width * height * 3`` byte frame.
+        Raises MosaicStreamUnsupportedError when the add-on has no frame
+        endpoint. The returned stream is already started.
+        """
+        url = f"{self.base_url}/api/displays/{display_id}/frames"
+        session = await self._get_session()
+        try:
+            # ws_connect's own timeout only bounds closing the socket
+            async with asyncio.timeout(FRAME_CONNECT_TIMEOUT):
+                ws = await session.ws_connect(
+                    url,
+                    headers=self._frame_headers,
+                    ssl=self._ssl,
+                    compress=0,
+                )
+        except aiohttp.WSServerHandshakeError as e:
+            if e.status in UNSUPPORTED_STATUSES:
+                raise MosaicStreamUnsupportedError(f"Frame streaming not supported ({e.status})", e.status)
+            raise MosaicAPIError(f"Frame stream rejected: {e}", e.status)
         except asyncio.TimeoutError:
-            raise MosaicAPIError("Request timeout")
+            raise MosaicTimeoutError("Frame stream connect timeout")
         except aiohttp.ClientError as e:
-            raise MosaicAPIError(f"Connection error: {e}")
+            raise MosaicConnectionError(f"Connection error: {e}")
+
+        async def _send(frame: memoryview) -> None:
+            if ws.closed:
+                raise MosaicConnectionError("Frame stream closed by server")
+            await ws.send_bytes(frame)
+
+        stream = FrameStream(display_id, width, height, _send, fps, close=ws.close)
+        try:
+            await ws.send_json(
+                {"format": "rgb24", "width": width, "height": height, "fps": stream.target_fps}
+            )
+        except (aiohttp.ClientError, ConnectionError) as e:
+            await ws.close()
+            raise MosaicConnectionError(f"Connection error: {e}")
+        stream.start()
+        return stream
 
     # -------------------------------------------------------------------------
     # Status
@@ -93,13 +479,26 @@ class MosaicAPIClient:
         """Set power state."""
         return await self._request("PUT", f"/api/displays/{display_id}/power", {"power": power})
 
+    async def apply_batch(self, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply changes to several displays in one request.
+
+        Each change is ``{"display_id": ..., "brightness"?, "power"?, "rotation_enabled"?}``.
+        Add-ons without batch support answer with one of UNSUPPORTED_STATUSES.
+        """
+        return await self._request("POST", "/api/displays/batch", {"changes": changes})
+
     async def skip(self, display_id: str) -> Dict[str, Any]:
         """Skip to next app."""
         return await self._request("POST", f"/api/displays/{display_id}/skip")
 
-    async def get_rotation(self, display_id: str) -> Dict[str, Any]:
-        """Get rotation config."""
-        return await self._request("GET", f"/api/displays/{display_id}/rotation")
+    async def get_rotation(
+        self,
+        display_id: str,
+        limit: Optional[asyncio.Semaphore] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get rotation config, optionally holding limit and giving up after timeout seconds."""
+        return await self._request("GET", f"/api/displays/{display_id}/rotation", limit=limit, timeout=timeout)
 
     async def set_rotation_enabled(self, display_id: str, enabled: bool) -> Dict[str, Any]:
         """Enable/disable rotation."""
@@ -109,7 +508,15 @@ class MosaicAPIClient:
     # Notifications
     # -------------------------------------------------------------------------
 
-    async def push_text(self, text: str, duration: int = 10, color: str = "#FFFFFF", display_id: str = None) -> Dict[str, Any]:
+    async def push_text(
+        self,
+        text: str,
+        duration: int = 10,
+        color: str = "#FFFFFF",
+        display_id: str = None,
+        priority: Optional[str] = None,
+        font: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Push text notification to a specific display or first display."""
         payload = {
             "text": text,
@@ -118,6 +525,48 @@ class MosaicAPIClient:
         }
         if display_id:
             payload["display_id"] = display_id
+        if priority:
+            payload["priority"] = priority
+        if font:
+            payload["font"] = font
+        return await self._request("POST", "/api/notify", payload)
+
+    async def push_image(
+        self,
+        image: Dict[str, Any],
+        duration: int = 10,
+        display_id: str = None,
+        priority: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Push a pre-rendered image payload to a specific display or first display."""
+        payload = {
+            "type": "image",
+            "image": image,
+            "duration": duration,
+        }
+        if display_id:
+            payload["display_id"] = display_id
+        if priority:
+            payload["priority"] = priority
+        return await self._request("POST", "/api/notify", payload)
+
+    async def push_animation(
+        self,
+        animation: Dict[str, Any],
+        duration: int = 10,
+        display_id: str = None,
+        priority: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Push a pre-rendered, delta-encoded animation to a specific display or first display."""
+        payload = {
+            "type": "animation",
+            "animation": animation,
+            "duration": duration,
+        }
+        if display_id:
+            payload["display_id"] = display_id
+        if priority:
+            payload["priority"] = priority
         return await self._request("POST", "/api/notify", payload)
 
     async def show_app(self, app_id: str, duration: int = 30) -> Dict[str, Any]:
@@ -0,0 +1,82 @@
+"""Circuit breaker guarding requests to one Mosaic add-on."""
+
+import time
+from typing import Optional, Tuple
+
+from .const import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while an add-on keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are refused for ``reset_timeout`` seconds. It then goes
+    half-open and lets a single probe through: success closes the circuit,
+    failure opens it again. The probe is identified by the token returned
+    from ``allow_request()``, so requests sent before the circuit opened
+    can't end it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._probe: Optional[object] = None
+
+    def allow_request(self) -> Tuple[bool, Optional[object]]:
+        """Return whether a request may be sent now, and a token if it is the probe."""
+        if self.state == STATE_CLOSED:
+            return True, None
+        if self.state == STATE_OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False, None
+            self.state = STATE_HALF_OPEN
+        if self._probe is not None:
+            return False, None
+        self._probe = object()
+        return True, self._probe
+
+    @property
+    def probing(self) -> bool:
+        """Return True while a half-open probe is in flight."""
+        return self._probe is not None
+
+    def record_success(self, probe: Optional[object] = None) -> None:
+        """Record a request that reached a healthy add-on."""
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.release_probe(probe)
+
+    def record_failure(self, probe: Optional[object] = None) -> None:
+        """Record a request that failed because the add-on is unhealthy."""
+        self.failures += 1
+        self.release_probe(probe)
+        if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                self.opened += 1
+            self.state = STATE_OPEN
+            self._opened_at = time.monotonic()
+
+    def release_probe(self, probe: Optional[object]) -> None:
+        """Allow a new probe once the current one has ended, with or without a verdict."""
+        if probe is not None and probe is self._probe:
+            self._probe = None
+
+    def as_dict(self) -> dict:
+        """Return a JSON-serialisable summary."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.opened,
+        }
@@ -0,0 +1,95 @@
+"""Latest-wins coalescing of repeated display commands."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+SendFunc = Callable[[Any], Awaitable[Any]]
+
+
+class _Slot:
+    """Pending state for one display attribute."""
+
+    __slots__ = ("value", "send", "waiters", "task")
+
+    def __init__(self) -> None:
+        self.value: Any = None
+        self.send: Optional[SendFunc] = None
+        self.waiters: List[asyncio.Future] = []
+        self.task: Optional[asyncio.Task] = None
+
+
+class CommandCoalescer:
+    """Collapse bursts of writes per key into the most recent value.
+
+    Writes for the same key (e.g. ``(display_id, "brightness")``) that arrive
+    within ``window`` seconds, or while a previous write for that key is still
+    in flight, are merged: only the last value is sent and every caller in the
+    burst receives that request's outcome. At most one request per key is in
+    flight at any time.
+    """
+
+    def __init__(self, window: float) -> None:
+        self._window = window
+        self._slots: Dict[Hashable, _Slot] = {}
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Return True if a newer write for key is waiting to be sent."""
+        slot = self._slots.get(key)
+        return slot is not None and bool(slot.waiters)
+
+    async def async_submit(self, key: Hashable, value: Any, send: SendFunc) -> Any:
+        """Queue a write and wait for the request that carries it."""
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _Slot()
+        slot.value = value
+        slot.send = send
+        waiter = asyncio.get_running_loop().create_future()
+        slot.waiters.append(waiter)
+        if slot.task is None:
+            slot.task = asyncio.create_task(self._async_drain(key, slot))
+        return await waiter
+
+    async def _async_drain(self, key: Hashable, slot: _Slot) -> None:
+        """Send the latest value for a key until no writes are pending."""
+        waiters: List[asyncio.Future] = []
+        try:
+            while slot.waiters:
+                await asyncio.sleep(self._window)
+                value, send, waiters = slot.value, slot.send, slot.waiters
+                slot.waiters = []
+                if len(waiters) > 1:
+                    _LOGGER.debug(f"Coalesced {len(waiters)} writes for {key}")
+                try:
+                    result = await send(value)
+                except Exception as err:  # noqa: BLE001 - handed to every waiter
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(result)
+        except asyncio.CancelledError:
+            # Nothing will send these writes any more, don't leave their callers waiting
+            for waiter in waiters + slot.waiters:
+                waiter.cancel()
+            slot.waiters = []
+            raise
+        finally:
+            slot.task = None
+            if not slot.waiters:
+                self._slots.pop(key, None)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending writes."""
+        slots, self._slots = list(self._slots.values()), {}
+        for slot in slots:
+            for waiter in slot.waiters:
+                waiter.cancel()
+            slot.waiters = []
+            if slot.task is not None:
+                slot.task.cancel()
@@ -1,20 +1,58 @@
 """Config flow for Mosaic integration."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components.zeroconf import ZeroconfServiceInfo
 from homeassistant.const import CONF_NAME, CONF_URL
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import MosaicAPIClient, MosaicAPIError
-from .const import CONF_API_KEY, CONF_AUTO_DETECT, CONF_VERIFY_SSL, DEFAULT_NAME, DOMAIN
+from .const import (
+    CONF_API_KEY,
+    CONF_AUTO_DETECT,
+    CONF_BURST_INTERVAL,
+    CONF_DISPLAY_TIMEOUT,
+    CONF_IDLE_INTERVAL,
+    CONF_MAX_BACKOFF,
+    CONF_POLL_INTERVAL,
+    CONF_REFRESH_CONCURRENCY,
+    CONF_RETRIES,
+    CONF_ROTATION_INTERVAL,
+    CONF_VERIFY_SSL,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_DISPLAY_TIMEOUT,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_BACKOFF,
+    DEFAULT_NAME,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_REFRESH_CONCURRENCY,
+    DEFAULT_RETRIES,
+    DEFAULT_ROTATION_INTERVAL,
+    DOMAIN,
+    PROBE_CONNECT_TIMEOUT,
+    PROBE_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Common add-on URLs - hostnames vary by installation method
+AUTO_DETECT_URLS = [
+    "http://localhost:8176",
+    "http://127.0.0.1:8176",
+    "http://homeassistant.local:8176",
+    "http://homeassistant:8176",
+    "http://mosaic:8176",  # Docker network name
+    "http://addon_mosaic:8176",
+    "http://a0d7b954-mosaic:8176",  # Repository-based slug
+]
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_AUTO_DETECT, default=True): bool,
@@ -30,6 +68,11 @@ STEP_MANUAL_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _unique_id(url: str) -> str:
+    """Return the unique ID for an add-on URL; one entry per add-on."""
+    return url.strip().rstrip("/").lower()
+
+
 class MosaicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Mosaic."""
 
@@ -40,10 +83,6 @@ class MosaicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is None:
             return self.async_show_form(step_id="user", data_schema=STEP_USER_DATA_SCHEMA)
 
-        # Check if already configured
-        await self.async_set_unique_id(DOMAIN)
-        self._abort_if_unique_id_configured()
-
         if user_input.get(CONF_AUTO_DETECT, True):
             return await self.async_step_auto_detect()
         else:
@@ -54,56 +93,123 @@ class MosaicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Try to auto-detect the add-on."""
         if user_input is None:
-            # Try common URLs - add-on hostnames vary by installation method
-            urls_to_try = [
-                "http://localhost:8176",
-                "http://127.0.0.1:8176",
-                "http://homeassistant.local:8176",
-                "http://homeassistant:8176",
-                "http://mosaic:8176",  # Docker network name
-                "http://addon_mosaic:8176",
-                "http://a0d7b954-mosaic:8176",  # Repository-based slug
+            # Add-ons announced over mDNS are tried alongside the common URLs
+            discovered = [
+                flow["context"][CONF_URL]
+                for flow in self._async_in_progress(include_uninitialized=True)
+                if CONF_URL in flow["context"]
             ]
-            
-            for url in urls_to_try:
-                try:
-                    api = MosaicAPIClient(url)
-                    status = await api.get_status()
-                    await api.close()
-
-                    _LOGGER.info(f"Auto-detected Mosaic at {url}")
-                    return self.async_create_entry(
-                        title=DEFAULT_NAME,
-                        data={
-                            CONF_URL: url,
-                            CONF_API_KEY: None,
-                            CONF_VERIFY_SSL: True,
-                        },
-                    )
-                except MosaicAPIError as e:
-                    _LOGGER.debug(f"Could not connect to {url}: {e}")
-                    continue
-                except Exception as e:
-                    _LOGGER.debug(f"Error trying {url}: {e}")
-                    continue
+            configured = {_unique_id(entry.data[CONF_URL]) for entry in self._async_current_entries()}
+            candidates = [
+                url for url in discovered + AUTO_DETECT_URLS if _unique_id(url) not in configured
+            ]
+            url = await self._async_probe_first(candidates)
+            if url is not None:
+                _LOGGER.info(f"Auto-detected Mosaic at {url}")
+                await self.async_set_unique_id(_unique_id(url))
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=DEFAULT_NAME,
+                    data={
+                        CONF_URL: url,
+                        CONF_API_KEY: None,
+                        CONF_VERIFY_SSL: True,
+                    },
+                )
 
             _LOGGER.warning("Could not auto-detect Mosaic add-on")
             return await self.async_step_manual()
 
+    async def async_step_zeroconf(self, discovery_info: ZeroconfServiceInfo) -> FlowResult:
+        """Handle an add-on announced over zeroconf/mDNS."""
+        url = f"http://{discovery_info.host}:{discovery_info.port or DEFAULT_PORT}"
+        # The unique ID is only claimed on confirmation so a pending discovery
+        # does not block the user flow, which reuses this URL as a candidate
+        self._async_abort_entries_match({CONF_URL: url})
+        # Repeated announcements arrive while the first flow is still probing
+        if self._async_in_progress(include_uninitialized=True, match_context={CONF_URL: url}):
+            return self.async_abort(reason="already_in_progress")
+        self.context[CONF_URL] = url
+
+        if await self._async_probe_first([url]) is None:
+            return self.async_abort(reason="cannot_connect")
+        return await self.async_step_zeroconf_confirm()
+
+    async def async_step_zeroconf_confirm(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Confirm setup of a discovered add-on."""
+        url = self.context[CONF_URL]
+        if user_input is None:
+            self._set_confirm_only()
+            return self.async_show_form(
+                step_id="zeroconf_confirm",
+                description_placeholders={"url": url},
+            )
+
+        await self.async_set_unique_id(_unique_id(url))
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=DEFAULT_NAME,
+            data={
+                CONF_URL: url,
+                CONF_API_KEY: None,
+                CONF_VERIFY_SSL: True,
+            },
+        )
+
+    async def _async_probe(self, url: str) -> str:
+        """Return url if it answers /api/status within the probe timeout."""
+        api = MosaicAPIClient(
+            url,
+            session=async_get_clientsession(self.hass),
+            timeout=PROBE_TIMEOUT,
+            connect_timeout=PROBE_CONNECT_TIMEOUT,
+            retries=0,
+            use_circuit_breaker=False,
+        )
+        status = await api.get_status()
+        if not isinstance(status, dict):
+            raise MosaicAPIError(f"Unexpected status response from {url}")
+        return url
+
+    async def _async_probe_first(self, urls: List[str]) -> Optional[str]:
+        """Probe all URLs concurrently and return the first that answers."""
+        tasks = [asyncio.create_task(self._async_probe(url)) for url in dict.fromkeys(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except MosaicAPIError as e:
+                    _LOGGER.debug(f"Auto-detect probe failed: {e}")
+                except Exception as e:
+                    _LOGGER.debug(f"Auto-detect probe error: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None
+
     async def async_step_manual(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle manual configuration."""
         errors = {}
 
         if user_input is not None:
+            # Entries created before unique IDs were per URL still carry the domain
+            self._async_abort_entries_match({CONF_URL: user_input[CONF_URL]})
+            await self.async_set_unique_id(_unique_id(user_input[CONF_URL]))
+            self._abort_if_unique_id_configured()
+
             # Validate the connection
             try:
+                verify_ssl = user_input.get(CONF_VERIFY_SSL, True)
                 api = MosaicAPIClient(
                     base_url=user_input[CONF_URL],
                     api_key=user_input.get(CONF_API_KEY),
-                    verify_ssl=user_input.get(CONF_VERIFY_SSL, True),
+                    verify_ssl=verify_ssl,
+                    session=async_get_clientsession(self.hass, verify_ssl=verify_ssl),
+                    use_circuit_breaker=False,
                 )
-                status = await api.get_status()
-                await api.close()
+                await api.get_status()
 
                 return self.async_create_entry(
                     title=user_input.get(CONF_NAME, DEFAULT_NAME),
@@ -138,26 +244,58 @@ class MosaicOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = {**self.config_entry.data, **self.config_entry.options}
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Optional(
                         CONF_URL,
-                        default=self.config_entry.data.get(CONF_URL),
+                        default=options.get(CONF_URL),
                     ): str,
                     vol.Optional(
                         CONF_API_KEY,
-                        default=self.config_entry.data.get(CONF_API_KEY, ""),
+                        default=options.get(CONF_API_KEY) or "",
                     ): str,
                     vol.Optional(
                         CONF_VERIFY_SSL,
-                        default=self.config_entry.data.get(CONF_VERIFY_SSL, True),
+                        default=options.get(CONF_VERIFY_SSL, True),
                     ): bool,
+                    vol.Optional(
+                        CONF_REFRESH_CONCURRENCY,
+                        default=options.get(CONF_REFRESH_CONCURRENCY, DEFAULT_REFRESH_CONCURRENCY),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+                    vol.Optional(
+                        CONF_DISPLAY_TIMEOUT,
+                        default=options.get(CONF_DISPLAY_TIMEOUT, DEFAULT_DISPLAY_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+                    vol.Optional(
+                        CONF_RETRIES,
+                        default=options.get(CONF_RETRIES, DEFAULT_RETRIES),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+                    vol.Optional(
+                        CONF_POLL_INTERVAL,
+                        default=options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_BURST_INTERVAL,
+                        default=options.get(CONF_BURST_INTERVAL, DEFAULT_BURST_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                    vol.Optional(
+                        CONF_IDLE_INTERVAL,
+                        default=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=86400)),
+                    vol.Optional(
+                        CONF_MAX_BACKOFF,
+                        default=options.get(CONF_MAX_BACKOFF, DEFAULT_MAX_BACKOFF),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=86400)),
+                    vol.Optional(
+                        CONF_ROTATION_INTERVAL,
+                        default=options.get(CONF_ROTATION_INTERVAL, DEFAULT_ROTATION_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=86400)),
                 }
             ),
         )
-
-    async def async_step_init_submit(self, user_input: Dict[str, Any]) -> FlowResult:
-        """Handle options submission."""
-        return self.async_abort(reason="reconfigure_successful")
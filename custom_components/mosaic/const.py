@@ -4,12 +4,43 @@ DOMAIN = "mosaic"
 DEFAULT_PORT = 8176
 DEFAULT_NAME = "Mosaic"
 DEFAULT_POLL_INTERVAL = 30
+DEFAULT_BURST_INTERVAL = 2
+DEFAULT_IDLE_INTERVAL = 300
+DEFAULT_MAX_BACKOFF = 600
+DEFAULT_ROTATION_INTERVAL = 900
+POLL_BURST_DURATION = 20
+POLL_IDLE_AFTER = 600
+DEFAULT_REFRESH_CONCURRENCY = 4
+DEFAULT_DISPLAY_TIMEOUT = 5
+DEFAULT_STREAM_POLL_INTERVAL = 300
+STREAM_BACKOFF_MIN = 1
+STREAM_BACKOFF_MAX = 120
+DISPLAY_RETIRE_REFRESHES = 3
+DISPLAY_RETIRE_AFTER = 3600
+COMMAND_COALESCE_WINDOW = 0.15
+REQUEST_REFRESH_COOLDOWN = 0.5
+DEFAULT_RETRIES = 2
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RESET_TIMEOUT = 30
+PROBE_TIMEOUT = 2.0
+PROBE_CONNECT_TIMEOUT = 0.5
+DEFAULT_MAX_REQUESTS = 8
+DEFAULT_FRAME_FPS = 20
+MAX_FRAME_FPS = 60
 
 # Config keys
 CONF_URL = "url"
 CONF_VERIFY_SSL = "verify_ssl"
 CONF_API_KEY = "api_key"
 CONF_AUTO_DETECT = "auto_detect"
+CONF_REFRESH_CONCURRENCY = "refresh_concurrency"
+CONF_DISPLAY_TIMEOUT = "display_timeout"
+CONF_POLL_INTERVAL = "poll_interval"
+CONF_BURST_INTERVAL = "burst_interval"
+CONF_IDLE_INTERVAL = "idle_interval"
+CONF_MAX_BACKOFF = "max_backoff"
+CONF_ROTATION_INTERVAL = "rotation_interval"
+CONF_RETRIES = "retries"
 
 # Entity naming
 ENTITY_LIGHT = "light"
@@ -22,6 +53,9 @@ ENTITY_NUMBER_DWELL = "number_dwell"
 # Service names
 SERVICE_PUSH_TEXT = "push_text"
 SERVICE_PUSH_IMAGE = "push_image"
+SERVICE_PUSH_ANIMATION = "push_animation"
+SERVICE_APPLY = "apply"
+SERVICE_PROFILE = "profile"
 SERVICE_SHOW_APP = "show_app"
 SERVICE_CLEAR = "clear"
 
@@ -42,6 +76,33 @@ PRIORITY_HIGH = "high"
 PRIORITY_STICKY = "sticky"
 PRIORITY_OPTIONS = [PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH, PRIORITY_STICKY]
 
+# Notification queue
+NOTIFY_QUEUE_SIZE = 20
+NOTIFY_MERGE_WINDOW = 2.0
+NOTIFY_MERGE_SEPARATOR = " · "
+NOTIFY_MAX_MERGED_LENGTH = 120
+
+# Text layout
+DEFAULT_FONT = "tb-8"
+TEXT_SCROLL_SPEED = 20  # pixels per second, the add-on's marquee speed
+TEXT_MIN_DURATION = 3  # seconds
+TEXT_MAX_DURATION = 60  # seconds per notification before text is split
+TEXT_ELLIPSIS = "..."
+
+# Image rendering
+IMAGE_CACHE_SIZE = 32
+IMAGE_DEFAULT_COLORS = 64
+IMAGE_FETCH_TIMEOUT = 15
+IMAGE_MAX_BYTES = 16 * 1024 * 1024
+IMAGE_READ_CHUNK = 64 * 1024
+ANIMATION_MAX_FRAMES = 200
+ANIMATION_DEFAULT_FRAME_MS = 100
+
+# Profiling
+PROFILE_DEFAULT_SECONDS = 30
+DEFAULT_DISPLAY_WIDTH = 64
+DEFAULT_DISPLAY_HEIGHT = 32
+
 # Status values
 STATUS_CONNECTED = "connected"
 STATUS_DISCONNECTED = "disconnected"
@@ -51,9 +112,20 @@ STATUS_UNKNOWN = "unknown"
 DATA_COORDINATOR = "coordinator"
 DATA_DISPLAYS = "displays"
 DATA_API = "api"
+DATA_SCHEDULER = "scheduler"
+DATA_PROFILER = "profiler"
+
+# Persisted last-known state
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # seconds
+
+# Offline command journal
+JOURNAL_MAX_ENTRIES = 200
+JOURNAL_NOTIFY_TTL = 600  # seconds a missed notification is still worth showing
 
 # Attributes
 ATTR_BRIGHTNESS = "brightness"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
 ATTR_POWER = "power"
 ATTR_ROTATION = "rotation"
 ATTR_STATUS = "status"
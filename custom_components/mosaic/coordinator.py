@@ -1,89 +1,825 @@
 """Data update coordinator for Mosaic."""
 
+import asyncio
 import logging
+import random
+import time
 from datetime import timedelta
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
 
+import aiohttp
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import MosaicAPIClient, MosaicAPIError
-from .const import DOMAIN, DEFAULT_POLL_INTERVAL
+from .api import (
+    MosaicAPIClient,
+    MosaicAPIError,
+    MosaicConnectionError,
+    MosaicStreamUnsupportedError,
+    MosaicTimeoutError,
+    UNSUPPORTED_STATUSES,
+)
+from .coalescer import CommandCoalescer
+from .const import (
+    COMMAND_COALESCE_WINDOW,
+    DEFAULT_DISPLAY_HEIGHT,
+    DEFAULT_DISPLAY_TIMEOUT,
+    DEFAULT_DISPLAY_WIDTH,
+    DEFAULT_FONT,
+    DEFAULT_FRAME_FPS,
+    DEFAULT_REFRESH_CONCURRENCY,
+    DEFAULT_ROTATION_INTERVAL,
+    DOMAIN,
+    IMAGE_DEFAULT_COLORS,
+    IMAGE_FETCH_TIMEOUT,
+    IMAGE_MAX_BYTES,
+    IMAGE_READ_CHUNK,
+    PRIORITY_NORMAL,
+    REQUEST_REFRESH_COOLDOWN,
+    STORAGE_SAVE_DELAY,
+    STREAM_BACKOFF_MAX,
+    STREAM_BACKOFF_MIN,
+)
+from .frames import FrameStream
+from .image import ImageRenderer, ImageTooLargeError
+from .journal import CommandJournal
+from .metrics import LatencyHistogram
+from .models import DisplaySnapshot
+from .notify import NotificationScheduler
+from .polling import AdaptivePollPolicy, RefreshTier
+from .scheduler import MosaicScheduler
+from .text import layout_text
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_ROTATION: Dict[str, Any] = {"enabled": True, "apps": []}
+BULK_FIELDS = ("brightness", "power", "rotation_enabled")
+
+
+def _valid_display(data: Any) -> bool:
+    """Return True if a pushed display payload has the shape of an API display."""
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get("id", "default"), str)
+        and isinstance(data.get("rotation") or {}, dict)
+    )
+
+
+def _read_file(path: Path) -> bytes:
+    """Read a local image file of at most IMAGE_MAX_BYTES."""
+    size = path.stat().st_size
+    if size > IMAGE_MAX_BYTES:
+        raise ImageTooLargeError(f"{size} bytes, the limit is {IMAGE_MAX_BYTES}")
+    return path.read_bytes()
+
 
 class MosaicDataUpdateCoordinator(DataUpdateCoordinator):
     """Data update coordinator for Mosaic."""
 
-    def __init__(self, hass: HomeAssistant, api: MosaicAPIClient):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: MosaicAPIClient,
+        refresh_concurrency: int = DEFAULT_REFRESH_CONCURRENCY,
+        display_timeout: float = DEFAULT_DISPLAY_TIMEOUT,
+        poll_policy: Optional[AdaptivePollPolicy] = None,
+        store: Optional[Store] = None,
+        rotation_interval: float = DEFAULT_ROTATION_INTERVAL,
+        scheduler: Optional[MosaicScheduler] = None,
+        journal: Optional[CommandJournal] = None,
+    ):
+        self.poll_policy = poll_policy or AdaptivePollPolicy()
+        self._scheduler = scheduler
+        self._release_slot = scheduler.register(self) if scheduler is not None else None
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL),
+            update_interval=self._next_interval(),
+            # Collapse refresh requests from a multi-entity scene into one refresh
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.api = api
+        self._refresh_concurrency = max(1, refresh_concurrency)
+        self._display_timeout = display_timeout
+        self._stream_task: Optional[asyncio.Task] = None
+        self.streaming = False
+        self._coalescer = CommandCoalescer(COMMAND_COALESCE_WINDOW)
+        self._notifiers: Dict[Optional[str], NotificationScheduler] = {}
+        self.image_renderer = ImageRenderer()
+        self.frame_streams: Dict[str, FrameStream] = {}
+        self.journal = journal or CommandJournal()
+        self._replay_task: Optional[asyncio.Task] = None
+        self.refresh_duration = LatencyHistogram()
+        self._batch_supported = True
+        # Volatile fields come with every display list, rotation configs rarely change
+        self.display_tier = RefreshTier("displays", self.poll_policy.interval)
+        self.rotation_tier = RefreshTier("rotation", rotation_interval)
+        self._store = store
+        # False while data only comes from the store and no live refresh succeeded
+        self.confirmed = False
+        self.live_refreshes = 0
 
     async def _async_update_data(self) -> Dict[str, Any]:
-        """Update data from Mosaic."""
+        """Update data from Mosaic, recording how long the refresh took."""
+        start = time.monotonic()
+        try:
+            return await self._async_fetch_data()
+        finally:
+            self.refresh_duration.observe(time.monotonic() - start)
+
+    async def _async_fetch_data(self) -> Dict[str, Any]:
+        """Fetch displays, and rotation configs that are due or invalidated."""
         try:
             displays = await self.api.get_displays()
-            
-            # Build display data with rotation info
-            display_data = {}
-            for disp in displays:
-                display_id = disp.get("id", "default")
-                try:
-                    rotation = await self.api.get_rotation(display_id)
-                    disp["rotation"] = rotation
-                except MosaicAPIError:
-                    disp["rotation"] = {"enabled": True, "apps": []}
-                display_data[display_id] = disp
-            
-            return {"displays": display_data}
         except MosaicAPIError as err:
+            self.poll_policy.note_failure()
+            self.update_interval = self._next_interval()
             raise UpdateFailed(f"Error communicating with Mosaic: {err}")
 
-    def get_display(self, display_id: str) -> Dict[str, Any]:
-        """Get display data by ID."""
-        displays = self.data.get("displays", {})
-        return displays.get(display_id, {})
+        previous = self.data.get("displays", {}) if self.data else {}
+        display_ids = [disp.get("id", "default") for disp in displays]
+        for display_id in display_ids:
+            self.display_tier.mark_fresh(display_id)
+        self.display_tier.retain(display_ids)
+        self.rotation_tier.retain(display_ids)
+
+        # Fetch rotation info concurrently, only for displays whose tier is due
+        now = time.monotonic()
+        due = [
+            display_id for display_id in display_ids
+            if display_id not in previous
+            or "rotation" not in previous[display_id].raw
+            or self.rotation_tier.is_due(display_id, now)
+        ]
+        semaphore = asyncio.Semaphore(self._refresh_concurrency)
+        rotations = dict(zip(due, await asyncio.gather(
+            *(self._async_fetch_rotation(semaphore, display_id) for display_id in due)
+        )))
+
+        display_data = {}
+        for display_id, disp in zip(display_ids, displays):
+            if display_id in rotations:
+                rotation = rotations[display_id]
+            else:
+                rotation = previous[display_id].raw["rotation"]
+            # API results may be shared with the response cache, copy before adding to them
+            display_data[display_id] = DisplaySnapshot.from_dict(
+                display_id, {**disp, "rotation": rotation}, previous.get(display_id)
+            )
+
+        data = {"displays": display_data}
+        changed = data != self.data
+        self.poll_policy.note_success(
+            changed=changed,
+            all_off=bool(display_data) and not any(
+                snapshot.power for snapshot in display_data.values()
+            ),
+        )
+        self.update_interval = self._next_interval()
+        self.confirmed = True
+        self.live_refreshes += 1
+        if changed:
+            self._async_schedule_save()
+        if len(self.journal) and (self._replay_task is None or self._replay_task.done()):
+            self._replay_task = self.hass.async_create_background_task(
+                self._async_replay_journal(), name=f"{DOMAIN} journal replay"
+            )
+        return data
+
+    async def async_load_cached(self) -> bool:
+        """Seed data from the last persisted state; return False if there is none."""
+        if self._store is None:
+            return False
+        try:
+            stored = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning(f"Ignoring unreadable Mosaic state cache: {err}")
+            return False
+        displays = stored.get("displays") if isinstance(stored, dict) else None
+        if not isinstance(displays, dict) or not displays:
+            return False
+        self.data = {
+            "displays": {
+                display_id: DisplaySnapshot.from_dict(display_id, dict(display))
+                for display_id, display in displays.items()
+                if isinstance(display, dict)
+            }
+        }
+        return True
+
+    def _async_schedule_save(self) -> None:
+        """Persist display data after a change; the delay batches bursts of changes."""
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    def _data_to_store(self) -> Dict[str, Any]:
+        """Return the display data to persist."""
+        displays = self.data.get("displays", {}) if self.data else {}
+        return {"displays": {display_id: snapshot.as_dict() for display_id, snapshot in displays.items()}}
+
+    async def _async_fetch_rotation(
+        self, semaphore: asyncio.Semaphore, display_id: str
+    ) -> Dict[str, Any]:
+        """Fetch rotation config for one display, keeping last-known data on failure.
+
+        The semaphore is held by the request itself, so a timed-out fetch keeps
+        its slot until the request has actually been cancelled.
+        """
+        try:
+            rotation = await self.api.get_rotation(display_id, semaphore, self._display_timeout)
+            self.rotation_tier.mark_fresh(display_id)
+            return rotation
+        except MosaicTimeoutError:
+            _LOGGER.debug(f"Timed out fetching rotation for {display_id}")
+        except MosaicAPIError as err:
+            _LOGGER.debug(f"Failed to fetch rotation for {display_id}: {err}")
+
+        if self.data:
+            previous = self.data.get("displays", {}).get(display_id)
+            if previous is not None and "rotation" in previous.raw:
+                return previous.raw["rotation"]
+        return dict(DEFAULT_ROTATION)
+
+    # -------------------------------------------------------------------------
+    # Push updates
+    # -------------------------------------------------------------------------
+
+    def async_start_stream(self) -> None:
+        """Start consuming the add-on event stream in the background."""
+        if self._stream_task is None or self._stream_task.done():
+            self._stream_task = self.hass.async_create_background_task(
+                self._async_stream_loop(), name=f"{DOMAIN} event stream"
+            )
+
+    async def async_stop_stream(self) -> None:
+        """Stop the event stream and go back to plain polling."""
+        task, self._stream_task = self._stream_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._set_streaming(False)
+
+    async def async_shutdown(self) -> None:
+        """Stop background work owned by the coordinator."""
+        await self.async_stop_stream()
+        if self._replay_task is not None and not self._replay_task.done():
+            self._replay_task.cancel()
+        await self._coalescer.async_shutdown()
+        for notifier in self._notifiers.values():
+            await notifier.async_shutdown()
+        for display_id in list(self.frame_streams):
+            await self.async_close_frame_stream(display_id)
+        if self._release_slot is not None:
+            self._release_slot()
+            self._release_slot = None
+        await super().async_shutdown()
+
+    def _set_streaming(self, streaming: bool) -> None:
+        """Switch between stream-backed and plain polling intervals."""
+        self.streaming = streaming
+        self.poll_policy.streaming = streaming
+        self.update_interval = self._next_interval()
+
+    def _next_interval(self) -> timedelta:
+        """Return the policy's next interval, snapped to this entry's scheduler slot."""
+        interval = self.poll_policy.next_interval()
+        if self._scheduler is None or self.poll_policy.failures:
+            # Keep backoff jitter intact while the add-on is failing
+            return interval
+        return self._scheduler.align(self, interval)
+
+    def _note_command(self) -> None:
+        """Poll quickly for a while to confirm a command took effect."""
+        self.poll_policy.note_command()
+        self.update_interval = self._next_interval()
+
+    async def _async_stream_loop(self) -> None:
+        """Consume pushed events, reconnecting with backoff until unsupported."""
+        backoff = STREAM_BACKOFF_MIN
+        while True:
+            try:
+                async for event in self.api.subscribe_events(
+                    on_connect=lambda: self._set_streaming(True)
+                ):
+                    backoff = STREAM_BACKOFF_MIN
+                    self._async_apply_event(event["event"], event["data"])
+            except MosaicStreamUnsupportedError as err:
+                _LOGGER.info(f"Mosaic event stream unavailable, polling instead: {err}")
+                self._set_streaming(False)
+                return
+            except MosaicAPIError as err:
+                _LOGGER.debug(f"Mosaic event stream disconnected: {err}")
+            except Exception:  # noqa: BLE001 - keep the stream alive, polling covers the gap
+                _LOGGER.exception("Unexpected error in Mosaic event stream, reconnecting")
+
+            if self.streaming:
+                # Catch up on anything missed while the stream was down
+                self._set_streaming(False)
+                await self.async_request_refresh()
+
+            await asyncio.sleep(backoff * random.uniform(0.8, 1.2))
+            backoff = min(backoff * 2, STREAM_BACKOFF_MAX)
+
+    def _async_apply_event(self, event: str, data: Any) -> None:
+        """Apply a pushed display event to the coordinator data."""
+        if self.data is None:
+            return
+        displays = dict(self.data.get("displays", {}))
+
+        if event == "display" and _valid_display(data):
+            display_id = data.get("id", "default")
+            current = displays.get(display_id)
+            if current is None:
+                displays[display_id] = DisplaySnapshot.from_dict(
+                    display_id, {"rotation": dict(DEFAULT_ROTATION), **data}
+                )
+            else:
+                displays[display_id] = current.merge(data)
+        elif (
+            event == "rotation"
+            and isinstance(data, dict)
+            and isinstance(data.get("id"), str)
+            and isinstance(data.get("rotation", {}), dict)
+        ):
+            display_id = data["id"]
+            if display_id not in displays:
+                return
+            displays[display_id] = displays[display_id].merge({"rotation": data.get("rotation", {})})
+            self.rotation_tier.mark_fresh(display_id)
+        elif event == "displays" and isinstance(data, list) and all(map(_valid_display, data)):
+            previous, displays = displays, {}
+            for disp in data:
+                display_id = disp.get("id", "default")
+                current = previous.get(display_id)
+                rotation = current.raw.get("rotation", DEFAULT_ROTATION) if current else DEFAULT_ROTATION
+                displays[display_id] = DisplaySnapshot.from_dict(
+                    display_id, {"rotation": dict(rotation), **disp}, current
+                )
+        elif event == "display_removed" and isinstance(data, dict):
+            if displays.pop(data.get("id"), None) is None:
+                return
+        else:
+            _LOGGER.debug(f"Ignoring unknown or malformed Mosaic event {event}")
+            return
+
+        self.async_set_updated_data({**self.data, "displays": displays})
+        self._async_schedule_save()
+
+    def get_snapshot(self, display_id: str) -> Optional[DisplaySnapshot]:
+        """Get the current snapshot for a display, or None if it is unknown."""
+        if not self.data:
+            return None
+        return self.data.get("displays", {}).get(display_id)
+
+    def get_display(self, display_id: str) -> Mapping[str, Any]:
+        """Get the raw display payload by ID."""
+        snapshot = self.get_snapshot(display_id)
+        return snapshot.raw if snapshot is not None else {}
 
     def get_display_ids(self) -> List[str]:
         """Get list of display IDs."""
         return list(self.data.get("displays", {}).keys())
 
-    async def async_set_brightness(self, display_id: str, brightness: int) -> None:
-        """Set brightness."""
+    # -------------------------------------------------------------------------
+    # Targeted updates
+    # -------------------------------------------------------------------------
+
+    def _async_update_display(self, display_id: str, changes: Dict[str, Any]) -> None:
+        """Merge changes into a single display and notify listeners."""
+        if not self.data or not changes:
+            return
+        displays = self.data.get("displays", {})
+        if display_id not in displays:
+            return
+        updated = displays[display_id].merge(changes)
+        if updated is displays[display_id]:
+            return
+        self.async_set_updated_data(
+            {**self.data, "displays": {**displays, display_id: updated}}
+        )
+        self._async_schedule_save()
+
+    def _response_changes(self, display_id: str, response: Any, requested: Dict[str, Any]) -> Dict[str, Any]:
+        """Return display fields confirmed by a write response, or the requested values."""
+        if not isinstance(response, dict):
+            return requested
+        display = self.get_display(display_id)
+        confirmed = {
+            key: value for key, value in response.items()
+            if key in requested or key in display
+        }
+        confirmed.pop("id", None)
+        return {**requested, **confirmed}
+
+    def _async_note_unreachable(self, err: MosaicAPIError) -> None:
+        """Mark entities unavailable right away when the add-on can't be reached."""
+        if isinstance(err, MosaicConnectionError) and self.last_update_success:
+            self.async_set_update_error(err)
+
+    async def async_refresh_display(self, display_id: str) -> None:
+        """Re-fetch a single display instead of refreshing the whole fleet."""
         try:
-            await self.api.set_brightness(display_id, brightness)
-            await self.async_request_refresh()
+            display = await self.api.get_display(display_id)
         except MosaicAPIError as err:
-            _LOGGER.error(f"Failed to set brightness: {err}")
+            _LOGGER.debug(f"Failed to refresh display {display_id}: {err}")
+            self._async_note_unreachable(err)
+            return
+        if isinstance(display, dict):
+            self.display_tier.mark_fresh(display_id)
+            self._async_update_display(
+                display_id, {key: value for key, value in display.items() if key != "id"}
+            )
+
+    async def async_set_brightness(self, display_id: str, brightness: int) -> None:
+        """Set brightness, coalescing rapid changes into the latest value."""
+        await self._async_coalesced_write(display_id, "brightness", brightness, self.api.set_brightness)
 
     async def async_set_power(self, display_id: str, power: bool) -> None:
-        """Set power state."""
+        """Set power state, coalescing rapid changes into the latest value."""
+        await self._async_coalesced_write(display_id, "power", power, self.api.set_power)
+
+    async def _async_coalesced_write(
+        self,
+        display_id: str,
+        attribute: str,
+        value: Any,
+        write: Callable[[str, Any], Awaitable[Any]],
+    ) -> None:
+        """Write one display attribute through the coalescer."""
+        key = (display_id, attribute)
+
+        async def _send(latest: Any) -> Any:
+            # Runs once per request however many callers were coalesced into it
+            try:
+                response = await write(display_id, latest)
+            except MosaicAPIError as err:
+                _LOGGER.error(f"Failed to set {attribute}: {err}")
+                if isinstance(err, MosaicConnectionError):
+                    self.journal.record_write(display_id, attribute, latest)
+                if not self._coalescer.is_pending(key):
+                    await self.async_refresh_display(display_id)
+                raise
+            self.journal.discard_write(display_id, attribute)
+            if not self._coalescer.is_pending(key):
+                # Only reconcile once no newer value is waiting behind this one
+                self._async_update_display(
+                    display_id, self._response_changes(display_id, response, {attribute: latest})
+                )
+            return response
+
+        self._note_command()
+        self._async_update_display(display_id, {attribute: value})
         try:
-            await self.api.set_power(display_id, power)
-            await self.async_request_refresh()
+            await self._coalescer.async_submit(key, value, _send)
+        except MosaicAPIError:
+            pass  # Logged, journaled and reconciled by the request that failed
+
+    async def async_apply(self, changes: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Apply brightness/power/rotation changes to many displays at once.
+
+        Uses the add-on batch endpoint when available, otherwise per-display
+        writes with bounded parallelism, then reconciles with one refresh.
+        Returns ``{display_id: {"success": bool, "error": str | None}}``.
+        """
+        self._note_command()
+        changes = [change for change in changes if change.get("display_id")]
+        if self.data:
+            displays = dict(self.data.get("displays", {}))
+            for change in changes:
+                display_id = change["display_id"]
+                if display_id in displays:
+                    fields = {key: value for key, value in change.items() if key in BULK_FIELDS}
+                    displays[display_id] = displays[display_id].merge(fields)
+            self.async_set_updated_data({**self.data, "displays": displays})
+
+        for change in changes:
+            if "rotation_enabled" in change:
+                self.rotation_tier.invalidate(change["display_id"])
+
+        results = None
+        if self._batch_supported:
+            results = await self._async_apply_batch(changes)
+        if results is None:
+            semaphore = asyncio.Semaphore(self._refresh_concurrency)
+            outcomes = await asyncio.gather(
+                *(self._async_apply_one(semaphore, change) for change in changes)
+            )
+            results = dict(zip((change["display_id"] for change in changes), outcomes))
+
+        await self.async_refresh()
+        return results
+
+    async def _async_apply_batch(self, changes: List[Dict[str, Any]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Send changes through the batch endpoint; None if it isn't available."""
+        try:
+            response = await self.api.apply_batch(changes)
         except MosaicAPIError as err:
-            _LOGGER.error(f"Failed to set power: {err}")
+            if err.status in UNSUPPORTED_STATUSES:
+                _LOGGER.debug("Mosaic add-on has no batch endpoint, sending per-display writes")
+                self._batch_supported = False
+                return None
+            _LOGGER.error(f"Failed to apply batch: {err}")
+            if isinstance(err, MosaicConnectionError):
+                for change in changes:
+                    self._journal_change(change)
+            self._async_note_unreachable(err)
+            return {change["display_id"]: {"success": False, "error": str(err)} for change in changes}
+
+        results = {change["display_id"]: {"success": True, "error": None} for change in changes}
+        if isinstance(response, dict):
+            for result in response.get("results", []):
+                if isinstance(result, dict) and result.get("display_id") in results:
+                    results[result["display_id"]] = {
+                        "success": bool(result.get("success", True)),
+                        "error": result.get("error"),
+                    }
+        return results
+
+    async def _async_apply_one(self, semaphore: asyncio.Semaphore, change: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply one display's changes with individual writes."""
+        display_id = change["display_id"]
+        async with semaphore:
+            try:
+                if change.get("power") is True:
+                    await self.api.set_power(display_id, True)
+                if "brightness" in change:
+                    await self.api.set_brightness(display_id, change["brightness"])
+                if "rotation_enabled" in change:
+                    await self.api.set_rotation_enabled(display_id, change["rotation_enabled"])
+                if change.get("power") is False:
+                    await self.api.set_power(display_id, False)
+            except MosaicAPIError as err:
+                _LOGGER.error(f"Failed to apply changes to {display_id}: {err}")
+                if isinstance(err, MosaicConnectionError):
+                    self._journal_change(change)
+                return {"success": False, "error": str(err)}
+        for attribute in BULK_FIELDS:
+            if attribute in change:
+                self.journal.discard_write(display_id, attribute)
+        return {"success": True, "error": None}
+
+    def _journal_change(self, change: Dict[str, Any]) -> None:
+        """Journal the fields of a bulk change that couldn't be delivered."""
+        for attribute in BULK_FIELDS:
+            if attribute in change:
+                self.journal.record_write(change["display_id"], attribute, change[attribute])
+
+    async def _async_replay_journal(self) -> None:
+        """Replay journaled commands once the add-on answers its status endpoint."""
+        try:
+            await self.api.get_status()
+        except MosaicAPIError as err:
+            _LOGGER.debug(f"Not replaying journal yet: {err}")
+            return
+
+        writes: Dict[str, List[Dict[str, Any]]] = {}
+        for write in self.journal.pending_writes():
+            writes.setdefault(write["display_id"], []).append(write)
+        if writes:
+            _LOGGER.info(f"Replaying {sum(map(len, writes.values()))} journaled Mosaic commands")
+            semaphore = asyncio.Semaphore(self._refresh_concurrency)
+            delivered = await asyncio.gather(
+                *(self._async_replay_display(semaphore, display_writes) for display_writes in writes.values())
+            )
+            if not all(delivered):
+                return  # Lost the add-on again; the rest stays journaled
+
+        for note in self.journal.take_notifications():
+            self.get_notifier(note["display_id"]).enqueue(
+                note["text"], note["duration"], note["color"], note["priority"], note.get("font")
+            )
+        if writes:
+            await self.async_request_refresh()
+
+    async def _async_replay_display(self, semaphore: asyncio.Semaphore, writes: List[Dict[str, Any]]) -> bool:
+        """Replay one display's journaled writes in order; False if the add-on went away."""
+        # Power on first and off last, like a bulk apply
+        writes = sorted(writes, key=lambda write: (
+            0 if write["attribute"] == "power" and write["value"] else
+            2 if write["attribute"] == "power" else 1
+        ))
+        senders = {
+            "power": self.api.set_power,
+            "brightness": self.api.set_brightness,
+            "rotation_enabled": self.api.set_rotation_enabled,
+        }
+        async with semaphore:
+            for write in writes:
+                if not self.journal.is_pending(write):
+                    continue  # A live command reached the add-on since, don't undo it
+                send = senders.get(write["attribute"])
+                if send is not None:
+                    try:
+                        await send(write["display_id"], write["value"])
+                    except MosaicConnectionError:
+                        return False
+                    except MosaicAPIError as err:
+                        _LOGGER.warning(f"Dropping journaled {write['attribute']} for {write['display_id']}: {err}")
+                self.journal.complete_write(write)
+        return True
 
     async def async_set_rotation_enabled(self, display_id: str, enabled: bool) -> None:
         """Set rotation enabled."""
+        rotation = {**self.get_display(display_id).get("rotation", DEFAULT_ROTATION), "enabled": enabled}
+        self._note_command()
+        self._async_update_display(display_id, {"rotation_enabled": enabled, "rotation": rotation})
         try:
-            await self.api.set_rotation_enabled(display_id, enabled)
-            await self.async_request_refresh()
+            response = await self.api.set_rotation_enabled(display_id, enabled)
         except MosaicAPIError as err:
             _LOGGER.error(f"Failed to set rotation: {err}")
+            if isinstance(err, MosaicConnectionError):
+                self.journal.record_write(display_id, "rotation_enabled", enabled)
+            self.rotation_tier.invalidate(display_id)
+            await self.async_refresh_display(display_id)
+            return
+        self.journal.discard_write(display_id, "rotation_enabled")
+        if isinstance(response, dict) and "enabled" in response:
+            # The rotation endpoint answers with the rotation config itself
+            rotation = {**rotation, **response}
+            self.rotation_tier.mark_fresh(display_id)
+            self._async_update_display(
+                display_id, {"rotation_enabled": rotation["enabled"], "rotation": rotation}
+            )
+        else:
+            self.rotation_tier.invalidate(display_id)
+
+    @property
+    def notifiers(self) -> Dict[Optional[str], NotificationScheduler]:
+        """Return the notification queues created so far, keyed by display ID."""
+        return self._notifiers
+
+    def get_notifier(self, display_id: Optional[str]) -> NotificationScheduler:
+        """Get the notification queue for a display, creating it on first use."""
+        notifier = self._notifiers.get(display_id)
+        if notifier is None:
+            async def _send(text: str, duration: int, color: str, priority: str, font: Optional[str]) -> Any:
+                try:
+                    return await self.api.push_text(text, duration, color, display_id, priority, font)
+                except MosaicConnectionError:
+                    self.journal.record_notification(display_id, text, duration, color, priority, font)
+                    raise
+
+            notifier = self._notifiers[display_id] = NotificationScheduler(
+                display_id, _send, display_width=lambda: self._text_width(display_id)
+            )
+        return notifier
+
+    def _text_width(self, display_id: Optional[str]) -> int:
+        """Return the width text is laid out for on a display."""
+        snapshot = self.get_snapshot(display_id) if display_id else None
+        return (snapshot.width if snapshot else None) or DEFAULT_DISPLAY_WIDTH
+
+    async def async_push_text(
+        self,
+        text: str,
+        duration: Optional[int] = None,
+        color: str = "#FFFFFF",
+        display_id: str = None,
+        priority: str = PRIORITY_NORMAL,
+        font: Optional[str] = None,
+    ) -> None:
+        """Queue a text notification for a specific display or first display.
+
+        Without an explicit duration the text is laid out for the display's
+        width: it stays as long as it takes to scroll through, and text too
+        long for one notification is split into several.
+        """
+        if not display_id:
+            display_ids = self.get_display_ids()
+            if display_ids:
+                display_id = display_ids[0]
+        notifier = self.get_notifier(display_id)
+        if duration is not None:
+            notifier.enqueue(text, duration, color, priority, font)
+            return
+        # Pages of one split must not be merged back into one too long to show
+        group = object()
+        for page in layout_text(text, self._text_width(display_id), font or DEFAULT_FONT):
+            notifier.enqueue(page.text, page.duration, color, priority, font, group)
+
+    async def async_push_image(
+        self,
+        image: str,
+        duration: int = 10,
+        display_id: str = None,
+        priority: str = PRIORITY_NORMAL,
+        colors: int = IMAGE_DEFAULT_COLORS,
+    ) -> None:
+        """Render an image for a display's geometry locally and push it."""
+        if not display_id:
+            display_ids = self.get_display_ids()
+            if display_ids:
+                display_id = display_ids[0]
+        display = self.get_display(display_id)
+        width = display.get("width") or DEFAULT_DISPLAY_WIDTH
+        height = display.get("height") or DEFAULT_DISPLAY_HEIGHT
+
+        try:
+            data = await self._async_read_image(image)
+            rendered = await self.hass.async_add_executor_job(
+                self.image_renderer.render, data, width, height, colors
+            )
+        except ImageTooLargeError as err:
+            raise HomeAssistantError(f"Failed to load image {image}: {err}") from err
+        except (OSError, ValueError, aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error(f"Failed to load image {image}: {err}")
+            return
+
+        try:
+            await self.api.push_image(rendered.as_payload(), duration, display_id, priority)
+        except MosaicAPIError as err:
+            _LOGGER.error(f"Failed to push image: {err}")
+            self._async_note_unreachable(err)
+
+    async def async_push_animation(
+        self,
+        animation: str,
+        duration: int = 10,
+        display_id: str = None,
+        priority: str = PRIORITY_NORMAL,
+        colors: int = IMAGE_DEFAULT_COLORS,
+    ) -> None:
+        """Render a GIF/APNG for a display's geometry locally and push it."""
+        if not display_id:
+            display_ids = self.get_display_ids()
+            if display_ids:
+                display_id = display_ids[0]
+        display = self.get_display(display_id)
+        width = display.get("width") or DEFAULT_DISPLAY_WIDTH
+        height = display.get("height") or DEFAULT_DISPLAY_HEIGHT
 
-    async def async_push_text(self, text: str, duration: int = 10, color: str = "#FFFFFF", display_id: str = None) -> None:
-        """Push text notification to a specific display or first display."""
         try:
-            await self.api.push_text(text, duration, color, display_id)
+            data = await self._async_read_image(animation)
+            rendered = await self.hass.async_add_executor_job(
+                self.image_renderer.render_animation, data, width, height, colors
+            )
+        except ImageTooLargeError as err:
+            raise HomeAssistantError(f"Failed to load animation {animation}: {err}") from err
+        except (OSError, ValueError, aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error(f"Failed to load animation {animation}: {err}")
+            return
+
+        try:
+            await self.api.push_animation(rendered.as_payload(), duration, display_id, priority)
         except MosaicAPIError as err:
-            _LOGGER.error(f"Failed to push text: {err}")
+            _LOGGER.error(f"Failed to push animation: {err}")
+            self._async_note_unreachable(err)
+
+    async def async_open_frame_stream(self, display_id: str, fps: float = DEFAULT_FRAME_FPS) -> FrameStream:
+        """Open a frame stream sized to a display, replacing any existing one."""
+        await self.async_close_frame_stream(display_id)
+        snapshot = self.get_snapshot(display_id)
+        width = (snapshot.width if snapshot else None) or DEFAULT_DISPLAY_WIDTH
+        height = (snapshot.height if snapshot else None) or DEFAULT_DISPLAY_HEIGHT
+        stream = self.frame_streams[display_id] = await self.api.open_frame_stream(
+            display_id, width, height, fps
+        )
+        stream.async_on_stop(lambda: self._async_forget_frame_stream(display_id, stream))
+        return stream
+
+    def _async_forget_frame_stream(self, display_id: str, stream: FrameStream) -> None:
+        """Drop a stream whose sender died, unless it was replaced already."""
+        if self.frame_streams.get(display_id) is stream:
+            del self.frame_streams[display_id]
+
+    async def async_close_frame_stream(self, display_id: str) -> None:
+        """Close a display's frame stream if one is open."""
+        stream = self.frame_streams.pop(display_id, None)
+        if stream is not None:
+            await stream.async_close()
+
+    async def _async_read_image(self, source: str) -> bytes:
+        """Read up to IMAGE_MAX_BYTES of image bytes from a URL or an allowed local path."""
+        if source.startswith(("http://", "https://")):
+            session = async_get_clientsession(self.hass)
+            async with session.get(
+                source, timeout=aiohttp.ClientTimeout(total=IMAGE_FETCH_TIMEOUT)
+            ) as resp:
+                resp.raise_for_status()
+                if resp.content_length is not None and resp.content_length > IMAGE_MAX_BYTES:
+                    raise ImageTooLargeError(f"{resp.content_length} bytes, the limit is {IMAGE_MAX_BYTES}")
+                data = bytearray()
+                # Content-Length may be missing or wrong, enforce the limit while reading
+                async for chunk in resp.content.iter_chunked(IMAGE_READ_CHUNK):
+                    data += chunk
+                    if len(data) > IMAGE_MAX_BYTES:
+                        raise ImageTooLargeError(f"more than {IMAGE_MAX_BYTES} bytes")
+                return bytes(data)
+
+        if not self.hass.config.is_allowed_path(source):
+            raise ValueError(f"Path {source} is not in allowlist_external_dirs")
+        return await self.hass.async_add_executor_job(_read_file, Path(source))
 
     async def async_skip(self, display_id: str = None) -> None:
         """Skip to next app on a specific display or first display."""
@@ -92,8 +828,14 @@ class MosaicDataUpdateCoordinator(DataUpdateCoordinator):
             display_ids = self.get_display_ids()
             if display_ids:
                 display_id = display_ids[0]
+        self._note_command()
         try:
-            await self.api.skip(display_id)
-            await self.async_request_refresh()
+            response = await self.api.skip(display_id)
         except MosaicAPIError as err:
             _LOGGER.error(f"Failed to skip: {err}")
+            self._async_note_unreachable(err)
+            return
+        if isinstance(response, dict) and "current_app" in response:
+            self._async_update_display(display_id, {"current_app": response["current_app"]})
+        else:
+            await self.async_refresh_display(display_id)
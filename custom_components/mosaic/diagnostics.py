@@ -0,0 +1,70 @@
+"""Diagnostics support for Mosaic."""
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, DATA_API, DATA_COORDINATOR, DATA_SCHEDULER, DOMAIN
+
+TO_REDACT = {CONF_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    api = hass.data[DOMAIN][entry.entry_id][DATA_API]
+    coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    scheduler = hass.data[DOMAIN][DATA_SCHEDULER]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval else None,
+            "confirmed": coordinator.confirmed,
+            "streaming": coordinator.streaming,
+            "consecutive_failures": coordinator.poll_policy.failures,
+            "refresh_duration": coordinator.refresh_duration.as_dict(),
+            "tiers": {
+                tier.name: tier.as_dict()
+                for tier in (coordinator.display_tier, coordinator.rotation_tier)
+            },
+        },
+        "scheduler": {
+            **scheduler.as_dict(),
+            "phase": scheduler.phase(coordinator),
+        },
+        "api": {
+            "base_url": api.base_url,
+            "retries": api.retries,
+            "circuit_breaker": api.circuit_breaker.as_dict() if api.circuit_breaker else None,
+            "endpoints": api.metrics.as_dict(),
+        },
+        "notifications": {
+            str(display_id): {
+                "depth": notifier.depth,
+                "sent": notifier.sent,
+                "merged": notifier.merged,
+                "deduplicated": notifier.deduplicated,
+                "dropped": notifier.dropped,
+            }
+            for display_id, notifier in coordinator.notifiers.items()
+        },
+        "journal": coordinator.journal.as_dict(),
+        "frame_streams": {
+            display_id: stream.as_dict() for display_id, stream in coordinator.frame_streams.items()
+        },
+        "image_cache": {
+            "hits": coordinator.image_renderer.hits,
+            "misses": coordinator.image_renderer.misses,
+        },
+        "displays": {
+            display_id: snapshot.as_dict()
+            for display_id, snapshot in coordinator.data.get("displays", {}).items()
+        } if coordinator.data else {},
+    }
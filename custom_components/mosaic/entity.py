@@ -0,0 +1,109 @@
+"""Base entity for per-display Mosaic entities."""
+
+import time
+from typing import Callable, Dict, List, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DISPLAY_RETIRE_AFTER, DISPLAY_RETIRE_REFRESHES
+from .coordinator import MosaicDataUpdateCoordinator
+from .models import DisplaySnapshot
+
+
+@callback
+def async_track_display_entities(
+    coordinator: MosaicDataUpdateCoordinator,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    factory: Callable[[MosaicDataUpdateCoordinator, str], List[Entity]],
+) -> None:
+    """Add entities for every display now and for displays that appear later.
+
+    Entities of a missing display turn unavailable. They are removed from the
+    entity registry, and with it any user customizations, only once the
+    display has been missing from ``DISPLAY_RETIRE_REFRESHES`` consecutive
+    live refreshes spanning at least ``DISPLAY_RETIRE_AFTER`` seconds, so a
+    display that is offline or rebooting keeps its entities.
+    """
+    tracked: Dict[str, List[Entity]] = {}
+    # display_id -> (live refresh count, monotonic time) when it was first missed
+    missing: Dict[str, Tuple[int, float]] = {}
+
+    @callback
+    def _async_reconcile() -> None:
+        display_ids = coordinator.get_display_ids() if coordinator.data else []
+        new_entities = []
+        for display_id in display_ids:
+            if display_id not in tracked:
+                tracked[display_id] = factory(coordinator, display_id)
+                new_entities.extend(tracked[display_id])
+        if new_entities:
+            async_add_entities(new_entities)
+
+        if not coordinator.confirmed or not coordinator.last_update_success:
+            # Stored or failed data may be out of date, only retire on live data
+            return
+        for display_id in set(missing).intersection(display_ids):
+            del missing[display_id]
+        registry = er.async_get(coordinator.hass)
+        now = time.monotonic()
+        for display_id in set(tracked) - set(display_ids):
+            first_refresh, since = missing.setdefault(display_id, (coordinator.live_refreshes, now))
+            if (
+                coordinator.live_refreshes - first_refresh + 1 < DISPLAY_RETIRE_REFRESHES
+                or now - since < DISPLAY_RETIRE_AFTER
+            ):
+                continue
+            del missing[display_id]
+            for entity in tracked.pop(display_id):
+                if entity.entity_id and registry.async_get(entity.entity_id):
+                    registry.async_remove(entity.entity_id)
+
+    _async_reconcile()
+    entry.async_on_unload(coordinator.async_add_listener(_async_reconcile))
+
+
+class MosaicDisplayEntity(CoordinatorEntity[MosaicDataUpdateCoordinator]):
+    """Entity bound to one display's snapshot.
+
+    State is only written when the display's snapshot or the entity's
+    availability changed since the last write, so a refresh that touches one
+    display doesn't rewrite every entity. Entities created from persisted
+    state stay unavailable until a live refresh confirms it.
+    """
+
+    def __init__(self, coordinator: MosaicDataUpdateCoordinator, display_id: str) -> None:
+        super().__init__(coordinator)
+        self._display_id = display_id
+        snapshot = coordinator.get_snapshot(display_id)
+        self._present = snapshot is not None
+        self._display = snapshot or DisplaySnapshot.from_dict(display_id, {})
+        self._written = (self._display, self.available)
+        self._update_from_snapshot(self._display)
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._present and self.coordinator.confirmed
+
+    def _update_from_snapshot(self, snapshot: DisplaySnapshot) -> None:
+        """Refresh cached ``_attr_`` values from a new snapshot."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        snapshot = self.coordinator.get_snapshot(self._display_id)
+        self._present = snapshot is not None
+        if snapshot is None:
+            snapshot = self._display
+        state = (snapshot, self.available)
+        if state == self._written:
+            return
+        if snapshot is not self._display:
+            self._display = snapshot
+            self._update_from_snapshot(snapshot)
+        self._written = state
+        self.async_write_ha_state()
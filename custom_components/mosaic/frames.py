@@ -0,0 +1,167 @@
+"""Raw RGB frame streaming to a Mosaic display."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .const import DEFAULT_FRAME_FPS, MAX_FRAME_FPS
+
+_LOGGER = logging.getLogger(__name__)
+
+FPS_WINDOW = 1.0  # seconds over which achieved fps is measured
+
+
+class FrameStream:
+    """Send RGB24 frames to one display at a target frame rate.
+
+    Three preallocated buffers rotate between roles, so no frame is copied
+    on our side: the producer fills the back buffer in place through
+    ``frame_buffer()`` and calls ``publish()``; the sender transmits the
+    latest published frame once per frame period. A frame published while
+    the previous one is still waiting is dropped rather than queued, so a
+    slow link never builds up latency. When a send fails the channel is
+    closed and the ``async_on_stop`` listeners are called.
+    """
+
+    def __init__(
+        self,
+        display_id: str,
+        width: int,
+        height: int,
+        send: Callable[[memoryview], Awaitable[None]],
+        fps: float = DEFAULT_FRAME_FPS,
+        close: Optional[Callable[[], Awaitable[Any]]] = None,
+    ):
+        self.display_id = display_id
+        self.width = width
+        self.height = height
+        self.frame_size = width * height * 3
+        self.target_fps = min(max(fps, 1.0), MAX_FRAME_FPS)
+        self._send = send
+        self._close = close
+        self._buffers = [bytearray(self.frame_size) for _ in range(3)]
+        self._views = [memoryview(buffer) for buffer in self._buffers]
+        self._back, self._ready, self._front = 0, 1, 2
+        self._pending = False
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stop_listeners: List[Callable[[], None]] = []
+        self.sent = 0
+        self.dropped = 0
+        self._fps = 0.0
+        self.error: Optional[BaseException] = None
+        self._window_start = time.monotonic()
+        self._window_frames = 0
+
+    @property
+    def running(self) -> bool:
+        """Return True while the sender is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def fps(self) -> float:
+        """Return the achieved frame rate over the last measurement window."""
+        if time.monotonic() - self._window_start > 2 * FPS_WINDOW:
+            return 0.0
+        return self._fps
+
+    def async_on_stop(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener when the sender stops on an error; returns a remover."""
+        self._stop_listeners.append(listener)
+        return lambda: self._stop_listeners.remove(listener)
+
+    def frame_buffer(self) -> memoryview:
+        """Return the writable back buffer (row-major RGB24) for the next frame.
+
+        Call again for every frame; buffers change roles on ``publish()``.
+        """
+        return self._views[self._back]
+
+    def publish(self) -> None:
+        """Mark the back buffer as the latest frame, dropping an unsent one."""
+        if self._pending:
+            self.dropped += 1
+        self._back, self._ready = self._ready, self._back
+        self._pending = True
+        self._wake.set()
+
+    def publish_from(self, frame: Any) -> None:
+        """Copy a complete bytes-like frame into the back buffer and publish it."""
+        self._views[self._back][:] = frame
+        self.publish()
+
+    def start(self) -> None:
+        """Start sending published frames."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._async_run())
+
+    async def async_close(self) -> None:
+        """Stop sending and close the channel."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._close is not None:
+            await self._close()
+
+    async def _async_run(self) -> None:
+        """Send the latest frame once per period, never catching up on missed ticks."""
+        period = 1.0 / self.target_fps
+        deadline = time.monotonic()
+        try:
+            while True:
+                if not self._pending:
+                    self._wake.clear()
+                    await self._wake.wait()
+                    deadline = max(deadline, time.monotonic())
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self._ready, self._front = self._front, self._ready
+                self._pending = False
+                await self._send(self._views[self._front])
+                self.sent += 1
+                self._note_sent()
+                # A late send skips ticks instead of bursting to catch up
+                deadline = max(deadline + period, time.monotonic())
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            _LOGGER.debug(f"Frame stream to {self.display_id} stopped: {err}")
+            self.error = err
+            close, self._close = self._close, None
+            if close is not None:
+                try:
+                    await close()
+                except Exception as close_err:
+                    _LOGGER.debug(f"Error closing frame stream to {self.display_id}: {close_err}")
+            for listener in list(self._stop_listeners):
+                listener()
+
+    def _note_sent(self) -> None:
+        """Update the achieved frame rate."""
+        self._window_frames += 1
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= FPS_WINDOW:
+            self._fps = self._window_frames / elapsed
+            self._window_start = now
+            self._window_frames = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "target_fps": self.target_fps,
+            "fps": round(self.fps, 1),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "running": self.running,
+            "error": str(self.error) if self.error else None,
+        }
@@ -0,0 +1,275 @@
+"""Local image rendering for Mosaic displays."""
+
+import base64
+import hashlib
+import io
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+from .const import (
+    ANIMATION_DEFAULT_FRAME_MS,
+    ANIMATION_MAX_FRAMES,
+    IMAGE_CACHE_SIZE,
+    IMAGE_DEFAULT_COLORS,
+)
+
+# Delta runs address pixels with 16-bit offsets; larger displays get key frames only
+DELTA_MAX_PIXELS = 0xFFFF
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ImageTooLargeError(Exception):
+    """The image is too large to download or decode."""
+
+
+class RenderedImage:
+    """An image fitted and color-quantized to one display geometry."""
+
+    __slots__ = ("width", "height", "bits", "palette", "pixels")
+
+    def __init__(self, width: int, height: int, bits: int, palette: bytes, pixels: bytes):
+        self.width = width
+        self.height = height
+        self.bits = bits
+        self.palette = palette
+        self.pixels = pixels
+
+    def as_payload(self) -> Dict[str, Any]:
+        """Return the JSON payload sent to the add-on.
+
+        ``palette`` is packed RGB triplets, ``pixels`` the palette indices in
+        row-major order packed MSB-first at ``bits`` bits per pixel.
+        """
+        return {
+            "format": "indexed",
+            "width": self.width,
+            "height": self.height,
+            "bits": self.bits,
+            "palette": base64.b64encode(self.palette).decode("ascii"),
+            "pixels": base64.b64encode(self.pixels).decode("ascii"),
+        }
+
+
+class RenderedAnimation:
+    """An animation fitted to one display geometry with a shared palette.
+
+    The first frame is a key frame; later frames are deltas against the
+    previous frame unless a key frame is smaller. Identical consecutive
+    frames are merged by adding up their durations.
+    """
+
+    __slots__ = ("width", "height", "bits", "palette", "frames", "source_frames", "_payload")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        bits: int,
+        palette: bytes,
+        frames: List[Dict[str, Any]],
+        source_frames: int,
+    ):
+        self.width = width
+        self.height = height
+        self.bits = bits
+        self.palette = palette
+        self.frames = frames
+        self.source_frames = source_frames
+        self._payload: Optional[Dict[str, Any]] = None
+
+    def as_payload(self) -> Dict[str, Any]:
+        """Return the JSON payload sent to the add-on, encoded once per animation.
+
+        Key frames carry ``pixels`` like an indexed image. Delta frames carry
+        ``runs``, little-endian uint16 (offset, length) pairs in pixel units,
+        and ``pixels``, the packed indices of just those runs in order.
+        """
+        if self._payload is None:
+            self._payload = self._encode()
+        return self._payload
+
+    def _encode(self) -> Dict[str, Any]:
+        """Build the payload, base64-encoding binary frame fields."""
+        return {
+            "format": "indexed-animation",
+            "width": self.width,
+            "height": self.height,
+            "bits": self.bits,
+            "palette": base64.b64encode(self.palette).decode("ascii"),
+            "frames": [
+                {
+                    key: base64.b64encode(value).decode("ascii") if isinstance(value, bytes) else value
+                    for key, value in frame.items()
+                }
+                for frame in self.frames
+            ],
+        }
+
+
+def open_image(data: bytes) -> Image.Image:
+    """Open image bytes, refusing decompression bombs."""
+    try:
+        return Image.open(io.BytesIO(data))
+    except Image.DecompressionBombError as err:
+        raise ImageTooLargeError(str(err)) from err
+
+
+def fit_rgb(image: Image.Image, width: int, height: int) -> np.ndarray:
+    """Resize an image to fit width x height, letterboxed on black, as an RGB array."""
+    rgba = image.convert("RGBA")
+    scale = min(width / rgba.width, height / rgba.height)
+    size = (max(1, round(rgba.width * scale)), max(1, round(rgba.height * scale)))
+    resample = Image.Resampling.BOX if scale < 1 else Image.Resampling.NEAREST
+    resized = np.asarray(rgba.resize(size, resample), dtype=np.uint16)
+
+    # Composite onto black in one pass: rgb * alpha / 255
+    rgb = ((resized[..., :3] * resized[..., 3:4] + 127) // 255).astype(np.uint8)
+
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+    top = (height - size[1]) // 2
+    left = (width - size[0]) // 2
+    canvas[top:top + size[1], left:left + size[0]] = rgb
+    return canvas
+
+
+def pack_indices(indices: np.ndarray, bits: int) -> bytes:
+    """Pack palette indices MSB-first at the given bit depth."""
+    shifts = np.arange(bits - 1, -1, -1, dtype=np.uint8)
+    unpacked = (indices.reshape(-1, 1) >> shifts) & 1
+    return np.packbits(unpacked.astype(np.uint8)).tobytes()
+
+
+def quantize_rgb(rgb: np.ndarray, colors: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce an RGB array to at most ``colors`` colors; returns (indices, palette)."""
+    quantized = Image.fromarray(rgb, "RGB").quantize(
+        colors=colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE
+    )
+    indices = np.asarray(quantized, dtype=np.uint8)
+    used = int(indices.max()) + 1
+    palette = np.asarray(quantized.getpalette()[: used * 3], dtype=np.uint8)
+    return indices, palette
+
+
+def render_image(data: bytes, width: int, height: int, colors: int = IMAGE_DEFAULT_COLORS) -> RenderedImage:
+    """Decode, fit and quantize image bytes for a width x height display."""
+    with open_image(data) as source:
+        rgb = fit_rgb(source, width, height)
+    indices, palette = quantize_rgb(rgb, colors)
+    bits = max(1, int(len(palette) // 3 - 1).bit_length())
+    return RenderedImage(width, height, bits, palette.tobytes(), pack_indices(indices, bits))
+
+
+def decode_frames(data: bytes, width: int, height: int) -> Tuple[np.ndarray, List[int]]:
+    """Decode GIF/APNG (or still) frames once, fitted to width x height.
+
+    Returns an (n, height, width, 3) array and per-frame durations in ms.
+    """
+    frames = []
+    durations = []
+    with open_image(data) as source:
+        for frame in ImageSequence.Iterator(source):
+            frames.append(fit_rgb(frame, width, height))
+            durations.append(int(frame.info.get("duration") or ANIMATION_DEFAULT_FRAME_MS))
+            if len(frames) >= ANIMATION_MAX_FRAMES:
+                _LOGGER.debug(f"Animation truncated to {ANIMATION_MAX_FRAMES} frames")
+                break
+    return np.stack(frames), durations
+
+
+def delta_runs(previous: np.ndarray, current: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (runs, indices) for pixels that changed between two flat index arrays.
+
+    ``runs`` is an (n, 2) array of (offset, length); ``indices`` the changed
+    pixels' palette indices, run after run.
+    """
+    changed = np.concatenate(([False], previous != current, [False]))
+    edges = np.flatnonzero(changed[1:] != changed[:-1])
+    starts, ends = edges[0::2], edges[1::2]
+    runs = np.stack((starts, ends - starts), axis=1)
+    return runs, current[np.flatnonzero(changed[1:-1])]
+
+
+def render_animation(
+    data: bytes, width: int, height: int, colors: int = IMAGE_DEFAULT_COLORS
+) -> RenderedAnimation:
+    """Decode, fit, quantize with one palette and delta-encode an animation."""
+    rgb, durations = decode_frames(data, width, height)
+    count = len(rgb)
+
+    # Quantize every frame against one palette by stacking them into one tall image
+    indices, palette = quantize_rgb(rgb.reshape(count * height, width, 3), colors)
+    indices = indices.reshape(count, height * width)
+    bits = max(1, int(len(palette) // 3 - 1).bit_length())
+
+    # Merge identical consecutive frames
+    keep = np.concatenate(([True], (indices[1:] != indices[:-1]).any(axis=1)))
+    groups = np.cumsum(keep) - 1
+    merged_durations = np.bincount(groups, weights=durations).astype(int)
+    indices = indices[keep]
+
+    frames: List[Dict[str, Any]] = []
+    for position, frame in enumerate(indices):
+        key = {"duration": int(merged_durations[position]), "pixels": pack_indices(frame, bits)}
+        if position == 0 or frame.size > DELTA_MAX_PIXELS:
+            frames.append(key)
+            continue
+        runs, changed = delta_runs(indices[position - 1], frame)
+        encoded_runs = runs.astype("<u2").tobytes()
+        pixels = pack_indices(changed, bits)
+        if len(encoded_runs) + len(pixels) < len(key["pixels"]):
+            frames.append({"duration": key["duration"], "runs": encoded_runs, "pixels": pixels})
+        else:
+            frames.append(key)
+
+    return RenderedAnimation(width, height, bits, palette.tobytes(), frames, count)
+
+
+class ImageRenderer:
+    """Render images and animations, caching results by content hash and geometry."""
+
+    def __init__(self, cache_size: int = IMAGE_CACHE_SIZE):
+        self._cache: "OrderedDict[Tuple[str, str, int, int, int], Any]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, data: bytes, width: int, height: int, colors: int = IMAGE_DEFAULT_COLORS) -> RenderedImage:
+        """Return the rendered image, reusing a cached result when possible.
+
+        Runs CPU-bound work; call from an executor.
+        """
+        return self._cached("image", render_image, data, width, height, colors)
+
+    def render_animation(
+        self, data: bytes, width: int, height: int, colors: int = IMAGE_DEFAULT_COLORS
+    ) -> RenderedAnimation:
+        """Return the rendered animation, reusing a cached result when possible.
+
+        Runs CPU-bound work; call from an executor.
+        """
+        return self._cached("animation", render_animation, data, width, height, colors)
+
+    def _cached(self, kind: str, render: Callable[..., Any], data: bytes, width: int, height: int, colors: int) -> Any:
+        """Look up a render result by content hash, rendering it on a miss."""
+        key = (kind, hashlib.sha256(data).hexdigest(), width, height, colors)
+        with self._lock:
+            rendered = self._cache.get(key)
+            if rendered is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return rendered
+            self.misses += 1
+
+        rendered = render(data, width, height, colors)
+        with self._lock:
+            self._cache[key] = rendered
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return rendered
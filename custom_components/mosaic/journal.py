@@ -0,0 +1,161 @@
+"""Persistent journal of commands that failed while the add-on was unreachable."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import JOURNAL_MAX_ENTRIES, JOURNAL_NOTIFY_TTL, STORAGE_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandJournal:
+    """Remember writes and notifications to replay once the add-on is back.
+
+    Writes are compacted to the last value per display and attribute, so a
+    slider moved ten times during an outage replays once. Notifications
+    expire after ``notify_ttl`` seconds. When the journal holds more than
+    ``max_entries`` the oldest notifications, then the oldest writes, are
+    dropped. Timestamps are wall-clock so they survive restarts.
+    """
+
+    def __init__(
+        self,
+        store: Optional[Store] = None,
+        max_entries: int = JOURNAL_MAX_ENTRIES,
+        notify_ttl: float = JOURNAL_NOTIFY_TTL,
+    ):
+        self._store = store
+        self.max_entries = max_entries
+        self.notify_ttl = notify_ttl
+        self._writes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._notifications: List[Dict[str, Any]] = []
+        self.recorded = 0
+        self.replayed = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._writes) + len(self._notifications)
+
+    async def async_load(self) -> None:
+        """Load journal entries saved before a restart."""
+        if self._store is None:
+            return
+        try:
+            stored = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning(f"Ignoring unreadable Mosaic command journal: {err}")
+            return
+        if not isinstance(stored, dict):
+            return
+        for write in stored.get("writes", []):
+            if isinstance(write, dict) and {"display_id", "attribute", "value"} <= write.keys():
+                self._writes[(write["display_id"], write["attribute"])] = write
+        self._notifications = [
+            note for note in stored.get("notifications", []) if isinstance(note, dict) and "text" in note
+        ]
+        self._expire()
+
+    def record_write(self, display_id: str, attribute: str, value: Any) -> None:
+        """Journal a write, replacing any older value for the same attribute."""
+        key = (display_id, attribute)
+        self._writes.pop(key, None)  # Re-insert so dict order stays oldest first
+        self._writes[key] = {
+            "display_id": display_id,
+            "attribute": attribute,
+            "value": value,
+            "time": time.time(),
+        }
+        self.recorded += 1
+        self._enforce_cap()
+        self._async_save()
+
+    def record_notification(
+        self,
+        display_id: Optional[str],
+        text: str,
+        duration: int,
+        color: str,
+        priority: str,
+        font: Optional[str] = None,
+    ) -> None:
+        """Journal a text notification until it expires."""
+        self._notifications.append({
+            "display_id": display_id,
+            "text": text,
+            "duration": duration,
+            "color": color,
+            "priority": priority,
+            "font": font,
+            "expires": time.time() + self.notify_ttl,
+        })
+        self.recorded += 1
+        self._enforce_cap()
+        self._async_save()
+
+    def discard_write(self, display_id: str, attribute: str) -> None:
+        """Forget a journaled write superseded by one that reached the add-on."""
+        if self._writes.pop((display_id, attribute), None) is not None:
+            self._async_save()
+
+    def pending_writes(self) -> List[Dict[str, Any]]:
+        """Return journaled writes, oldest first."""
+        return list(self._writes.values())
+
+    def take_notifications(self) -> List[Dict[str, Any]]:
+        """Remove and return unexpired notifications, oldest first."""
+        self._expire()
+        notifications, self._notifications = self._notifications, []
+        if notifications:
+            self._async_save()
+        return notifications
+
+    def is_pending(self, write: Dict[str, Any]) -> bool:
+        """Return True if write is still the journaled value for its attribute."""
+        return self._writes.get((write["display_id"], write["attribute"])) is write
+
+    def complete_write(self, write: Dict[str, Any]) -> None:
+        """Remove a replayed write unless a newer value was journaled meanwhile."""
+        if self.is_pending(write):
+            del self._writes[(write["display_id"], write["attribute"])]
+            self.replayed += 1
+            self._async_save()
+
+    def _expire(self) -> None:
+        """Drop notifications past their expiry."""
+        now = time.time()
+        before = len(self._notifications)
+        self._notifications = [note for note in self._notifications if note.get("expires", 0) > now]
+        self.dropped += before - len(self._notifications)
+
+    def _enforce_cap(self) -> None:
+        """Keep the journal within max_entries, dropping the oldest entries."""
+        self._expire()
+        while len(self) > self.max_entries:
+            if self._notifications:
+                self._notifications.pop(0)
+            else:
+                del self._writes[next(iter(self._writes))]
+            self.dropped += 1
+
+    def _async_save(self) -> None:
+        """Schedule persisting the journal."""
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    def _data_to_store(self) -> Dict[str, Any]:
+        """Return the journal contents to persist."""
+        return {"writes": list(self._writes.values()), "notifications": self._notifications}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {
+            "pending_writes": len(self._writes),
+            "pending_notifications": len(self._notifications),
+            "recorded": self.recorded,
+            "replayed": self.replayed,
+            "dropped": self.dropped,
+        }
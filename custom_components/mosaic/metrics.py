@@ -0,0 +1,124 @@
+"""Lightweight request and refresh instrumentation for Mosaic."""
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Tuple
+
+# Upper bounds in seconds; the final bucket catches everything slower
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_DISPLAY_PATH = re.compile(r"^/api/displays/(?!batch(?:/|$))[^/]+")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "count", "total", "max", "last")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one sample."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, fraction: float) -> float:
+        """Return the bucket upper bound containing the given quantile."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        buckets = {f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "last": self.last,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": buckets,
+        }
+
+
+class EndpointStats:
+    """Counters for one endpoint template."""
+
+    __slots__ = (
+        "latency",
+        "requests",
+        "in_flight",
+        "shared",
+        "errors",
+        "timeouts",
+        "not_modified",
+        "bytes_received",
+    )
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.in_flight = 0
+        self.shared = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "shared": self.shared,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "not_modified": self.not_modified,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class APIMetrics:
+    """Per-endpoint statistics keyed by template, e.g. ``GET /api/displays/{id}/rotation``."""
+
+    def __init__(self) -> None:
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self._keys: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def stats(self, method: str, endpoint: str) -> EndpointStats:
+        """Return the stats bucket for a concrete request."""
+        stats = self._keys.get((method, endpoint))
+        if stats is None:
+            template = f"{method} {_DISPLAY_PATH.sub('/api/displays/{id}', endpoint)}"
+            stats = self.endpoints.get(template)
+            if stats is None:
+                stats = self.endpoints[template] = EndpointStats()
+            self._keys[(method, endpoint)] = stats
+        return stats
+
+    @property
+    def total_errors(self) -> int:
+        """Return errors and timeouts across all endpoints."""
+        return sum(stats.errors + stats.timeouts for stats in self.endpoints.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {template: stats.as_dict() for template, stats in sorted(self.endpoints.items())}
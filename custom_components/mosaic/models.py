@@ -0,0 +1,71 @@
+"""Immutable display state shared by the coordinator and entities."""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+DEFAULT_BRIGHTNESS = 80
+
+
+@dataclass(frozen=True, slots=True)
+class DisplaySnapshot:
+    """One display's state as of a coordinator update.
+
+    Snapshots are built once per update and never mutated, so entities can
+    compare the one they last wrote with the current one and skip unchanged
+    state writes. Only ``raw`` takes part in equality; the other fields are
+    derived from it.
+    """
+
+    display_id: str
+    raw: Mapping[str, Any]
+    name: Optional[str] = field(compare=False)
+    brightness: Optional[int] = field(compare=False)
+    ha_brightness: int = field(compare=False)
+    power: bool = field(compare=False)
+    rotation_enabled: bool = field(compare=False)
+    current_app: Optional[str] = field(compare=False)
+    width: Optional[int] = field(compare=False)
+    height: Optional[int] = field(compare=False)
+    rotation: Mapping[str, Any] = field(compare=False)
+
+    @classmethod
+    def from_dict(
+        cls,
+        display_id: str,
+        data: Dict[str, Any],
+        previous: Optional["DisplaySnapshot"] = None,
+    ) -> "DisplaySnapshot":
+        """Build a snapshot from a display payload, reusing ``previous`` if identical.
+
+        The snapshot takes ownership of ``data``; callers pass a fresh dict.
+        """
+        if previous is not None and previous.raw == data:
+            return previous
+        brightness = data.get("brightness")
+        return cls(
+            display_id=display_id,
+            raw=MappingProxyType(data),
+            name=data.get("name"),
+            brightness=brightness,
+            ha_brightness=int((DEFAULT_BRIGHTNESS if brightness is None else brightness) * 255 / 100),
+            power=data.get("power", True),
+            rotation_enabled=data.get("rotation_enabled", True),
+            current_app=data.get("current_app"),
+            width=data.get("width"),
+            height=data.get("height"),
+            rotation=MappingProxyType(data.get("rotation") or {}),
+        )
+
+    def merge(self, changes: Dict[str, Any]) -> "DisplaySnapshot":
+        """Return a snapshot with ``changes`` applied, or self if nothing changed."""
+        if all(key in self.raw and self.raw[key] == value for key, value in changes.items()):
+            return self
+        return DisplaySnapshot.from_dict(self.display_id, {**self.raw, **changes})
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the display payload as a plain dict."""
+        data = dict(self.raw)
+        if "rotation" in data:
+            data["rotation"] = dict(self.rotation)
+        return data
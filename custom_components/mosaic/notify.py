@@ -0,0 +1,204 @@
+"""Per-display notification scheduling for Mosaic."""
+
+import asyncio
+import heapq
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from .api import MosaicAPIError
+from .const import (
+    DEFAULT_DISPLAY_WIDTH,
+    DEFAULT_FONT,
+    NOTIFY_MAX_MERGED_LENGTH,
+    NOTIFY_MERGE_SEPARATOR,
+    NOTIFY_MERGE_WINDOW,
+    NOTIFY_QUEUE_SIZE,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    PRIORITY_STICKY,
+    TEXT_MAX_DURATION,
+)
+from .text import measure, scroll_duration
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower rank is sent first
+PRIORITY_RANK = {PRIORITY_STICKY: 0, PRIORITY_HIGH: 1, PRIORITY_NORMAL: 2, PRIORITY_LOW: 3}
+
+SendFunc = Callable[[str, int, str, str, Optional[str]], Awaitable[object]]
+
+
+class _Notification:
+    """A pending notification."""
+
+    __slots__ = ("text", "duration", "color", "priority", "font", "group", "created")
+
+    def __init__(
+        self,
+        text: str,
+        duration: int,
+        color: str,
+        priority: str,
+        font: Optional[str] = None,
+        group: Optional[object] = None,
+    ):
+        self.text = text
+        self.duration = duration
+        self.color = color
+        self.priority = priority
+        self.font = font
+        self.group = group
+        self.created = time.monotonic()
+
+
+class NotificationScheduler:
+    """Priority queue of notifications for one display.
+
+    Pending messages are sent highest priority first. Identical pending
+    messages are dropped, messages of the same priority, color and font arriving
+    within a short window are merged into one, and a message is only sent
+    once the previous one has had its full display duration. High and sticky
+    messages skip that wait.
+
+    A merged message stays long enough to scroll through on the display and
+    is never longer than ``TEXT_MAX_DURATION``. Messages enqueued with the
+    same ``group``, the pages of one split text, are never merged together.
+    """
+
+    def __init__(
+        self,
+        display_id: Optional[str],
+        send: SendFunc,
+        max_queue: int = NOTIFY_QUEUE_SIZE,
+        merge_window: float = NOTIFY_MERGE_WINDOW,
+        display_width: Callable[[], int] = lambda: DEFAULT_DISPLAY_WIDTH,
+    ):
+        self.display_id = display_id
+        self._send = send
+        self._display_width = display_width
+        self._max_queue = max_queue
+        self._merge_window = merge_window
+        self._heap: List[Tuple[int, int, _Notification]] = []
+        self._seq = 0
+        self._ready_at = 0.0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[], None]] = []
+        self.sent = 0
+        self.dropped = 0
+        self.deduplicated = 0
+        self.merged = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of pending notifications."""
+        return len(self._heap)
+
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener whenever the queue changes; returns a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify_listeners(self) -> None:
+        for listener in list(self._listeners):
+            listener()
+
+    def enqueue(
+        self,
+        text: str,
+        duration: int,
+        color: str,
+        priority: str = PRIORITY_NORMAL,
+        font: Optional[str] = None,
+        group: Optional[object] = None,
+    ) -> bool:
+        """Queue a notification; returns False if it was deduplicated or dropped."""
+        if priority not in PRIORITY_RANK:
+            priority = PRIORITY_NORMAL
+        rank = PRIORITY_RANK[priority]
+        now = time.monotonic()
+
+        for _, _, pending in self._heap:
+            if (pending.text, pending.color, pending.priority, pending.font) == (text, color, priority, font):
+                self.deduplicated += 1
+                self._notify_listeners()
+                return False
+
+        if priority != PRIORITY_STICKY:
+            for _, _, pending in self._heap:
+                if (
+                    pending.priority != priority
+                    or pending.color != color
+                    or pending.font != font
+                    or (group is not None and pending.group is group)
+                    or now - pending.created > self._merge_window
+                    or len(pending.text) + len(text) >= NOTIFY_MAX_MERGED_LENGTH
+                ):
+                    continue
+                merged = f"{pending.text}{NOTIFY_MERGE_SEPARATOR}{text}"
+                merged_duration = max(
+                    pending.duration,
+                    duration,
+                    scroll_duration(measure(merged, font or DEFAULT_FONT), self._display_width()),
+                )
+                if merged_duration <= TEXT_MAX_DURATION:
+                    pending.text = merged
+                    pending.duration = merged_duration
+                    self.merged += 1
+                    self._notify_listeners()
+                    return True
+
+        if len(self._heap) >= self._max_queue:
+            worst = max(self._heap)
+            if worst[0] <= rank:
+                self.dropped += 1
+                self._notify_listeners()
+                return False
+            self._heap.remove(worst)
+            heapq.heapify(self._heap)
+            self.dropped += 1
+
+        self._seq += 1
+        heapq.heappush(self._heap, (rank, self._seq, _Notification(text, duration, color, priority, font, group)))
+        if rank <= PRIORITY_RANK[PRIORITY_HIGH]:
+            self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._async_run())
+        self._notify_listeners()
+        return True
+
+    async def _async_run(self) -> None:
+        """Send queued notifications, pacing them by display duration."""
+        while self._heap:
+            delay = self._ready_at - time.monotonic()
+            if delay > 0 and self._heap[0][0] > PRIORITY_RANK[PRIORITY_HIGH]:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, note = heapq.heappop(self._heap)
+            self._notify_listeners()
+            try:
+                await self._send(note.text, note.duration, note.color, note.priority, note.font)
+            except MosaicAPIError as err:
+                _LOGGER.error(f"Failed to push text: {err}")
+                continue
+            self.sent += 1
+            self._ready_at = time.monotonic() + max(note.duration, 0)
+            self._notify_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Drop pending notifications and stop sending."""
+        self._heap.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
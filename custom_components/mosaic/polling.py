@@ -0,0 +1,131 @@
+"""Adaptive poll interval policy for the Mosaic coordinator."""
+
+import random
+import time
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from .const import (
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_BACKOFF,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_STREAM_POLL_INTERVAL,
+    POLL_BURST_DURATION,
+    POLL_IDLE_AFTER,
+)
+
+
+class AdaptivePollPolicy:
+    """Pick the next poll interval from recent activity.
+
+    - burst: poll quickly for a short time after a command
+    - idle: poll slowly when every display is off or nothing has changed
+    - backoff: jittered exponential backoff while updates fail
+    - streaming: only a slow safety poll while pushed events arrive
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        burst_interval: float = DEFAULT_BURST_INTERVAL,
+        idle_interval: float = DEFAULT_IDLE_INTERVAL,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        burst_duration: float = POLL_BURST_DURATION,
+        idle_after: float = POLL_IDLE_AFTER,
+    ):
+        self.interval = interval
+        self.burst_interval = min(burst_interval, interval)
+        self.idle_interval = max(idle_interval, interval)
+        self.max_backoff = max(max_backoff, interval)
+        self.burst_duration = burst_duration
+        self.idle_after = idle_after
+        self.streaming = False
+        self._failures = 0
+        self._all_off = False
+        self._burst_until = 0.0
+        self._last_change = time.monotonic()
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failed updates."""
+        return self._failures
+
+    def note_command(self) -> None:
+        """Start burst polling to confirm a user action."""
+        self._burst_until = time.monotonic() + self.burst_duration
+
+    def note_success(self, changed: bool, all_off: bool) -> None:
+        """Record a successful update."""
+        self._failures = 0
+        self._all_off = all_off
+        if changed:
+            self._last_change = time.monotonic()
+
+    def note_failure(self) -> None:
+        """Record a failed update."""
+        self._failures += 1
+
+    def next_interval(self) -> timedelta:
+        """Return the interval until the next poll."""
+        now = time.monotonic()
+        if self._failures:
+            backoff = min(self.max_backoff, self.interval * 2 ** (self._failures - 1))
+            seconds = backoff * random.uniform(0.75, 1.25)
+        elif self.streaming:
+            seconds = max(DEFAULT_STREAM_POLL_INTERVAL, self.idle_interval)
+        elif now < self._burst_until:
+            seconds = self.burst_interval
+        elif self._all_off or now - self._last_change >= self.idle_after:
+            seconds = self.idle_interval
+        else:
+            seconds = self.interval
+        return timedelta(seconds=seconds)
+
+
+class RefreshTier:
+    """Track per-display freshness of data refreshed on its own interval."""
+
+    def __init__(self, name: str, interval: float):
+        self.name = name
+        self.interval = interval
+        self.refreshes = 0
+        self._refreshed: Dict[str, float] = {}
+
+    def is_due(self, display_id: str, now: Optional[float] = None) -> bool:
+        """Return True if a display's data is missing, invalidated or too old."""
+        refreshed = self._refreshed.get(display_id)
+        if refreshed is None:
+            return True
+        return (time.monotonic() if now is None else now) - refreshed >= self.interval
+
+    def mark_fresh(self, display_id: str) -> None:
+        """Record that a display's data was just confirmed."""
+        self._refreshed[display_id] = time.monotonic()
+        self.refreshes += 1
+
+    def invalidate(self, display_id: str) -> None:
+        """Force a display's data to be fetched on the next refresh."""
+        self._refreshed.pop(display_id, None)
+
+    def retain(self, display_ids: Iterable[str]) -> None:
+        """Forget displays that no longer exist."""
+        keep = set(display_ids)
+        for display_id in [key for key in self._refreshed if key not in keep]:
+            del self._refreshed[display_id]
+
+    def age(self, display_id: str) -> Optional[float]:
+        """Return seconds since a display's data was confirmed, if ever."""
+        refreshed = self._refreshed.get(display_id)
+        return None if refreshed is None else time.monotonic() - refreshed
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        now = time.monotonic()
+        ages = {display_id: round(now - refreshed, 1) for display_id, refreshed in self._refreshed.items()}
+        return {
+            "interval": self.interval,
+            "refreshes": self.refreshes,
+            "age": ages,
+            "stale": sorted(display_id for display_id, age in ages.items() if age >= self.interval),
+        }
@@ -0,0 +1,234 @@
+"""On-demand profiling of the Mosaic integration's hot paths."""
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import time
+import tracemalloc
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity import Entity
+
+from .api import MosaicAPIClient
+from .const import DATA_PROFILER, DOMAIN
+from .coordinator import MosaicDataUpdateCoordinator
+from .metrics import APIMetrics, LatencyHistogram
+
+_LOGGER = logging.getLogger(__name__)
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_TOP_FUNCTIONS = 40
+PROFILE_TOP_ALLOCATIONS = 25
+TRACEMALLOC_FRAMES = 10
+
+_MISSING = object()
+
+
+def _entity_roots() -> List[type]:
+    """Return this package's entity classes that don't inherit from one another."""
+    package = f"{__name__.rpartition('.')[0]}."
+    ours = set()
+    seen = set()
+    pending = [Entity]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                pending.append(subclass)
+                if subclass.__module__.startswith(package):
+                    ours.add(subclass)
+    # Patching a subclass as well as its base would count every write twice
+    return [cls for cls in ours if not any(base in ours for base in cls.__mro__[1:])]
+
+
+class MosaicProfiler:
+    """Record one profiling session of the integration.
+
+    Refresh cycles, API requests and entity state writes are counted by
+    patching the class attributes on ``start()`` and restoring them on
+    ``stop()``, so nothing is instrumented while no session is running.
+    State writes are counted at ``_async_write_ha_state`` so listeners bound
+    to ``async_write_ha_state`` before the session are counted too.
+    cProfile covers the event loop thread; cProfile and tracemalloc output
+    is limited to this package's modules. Allocation snapshots cover the
+    whole process, so ``start_tracing()`` and ``stop_tracing()`` are meant
+    for the executor.
+    """
+
+    def __init__(self) -> None:
+        self.refreshes: Dict[str, LatencyHistogram] = {}
+        self.requests = APIMetrics()
+        self.state_writes: Counter = Counter()
+        self.duration = 0.0
+        self._profile = cProfile.Profile()
+        self._patches: List[Tuple[type, str, Any]] = []
+        self._owns_tracemalloc = False
+        self._start_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._end_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started = 0.0
+
+    def start_tracing(self) -> None:
+        """Start tracemalloc if needed and take the starting allocation snapshot."""
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._start_snapshot = self._snapshot()
+
+    def stop_tracing(self) -> None:
+        """Take the final allocation snapshot and stop tracemalloc if we started it."""
+        if tracemalloc.is_tracing():
+            self._end_snapshot = self._snapshot()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        """Install instrumentation and start profiling."""
+        self._patch(MosaicAPIClient, "_request", self._wrap_request)
+        self._patch(MosaicDataUpdateCoordinator, "_async_update_data", self._wrap_refresh)
+        for cls in _entity_roots():
+            self._patch(cls, "_async_write_ha_state", self._wrap_state_write)
+        self._started = time.monotonic()
+        try:
+            self._profile.enable()
+        except ValueError as err:  # Another profiler is active in this thread
+            self.stop()
+            raise HomeAssistantError(f"Cannot start profiling: {err}") from err
+
+    def stop(self) -> None:
+        """Restore the original methods and stop profiling."""
+        self._profile.disable()
+        self.duration = time.monotonic() - self._started
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        """Take an allocation snapshot limited to this package, minus the profiler."""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(True, os.path.join(PACKAGE_DIR, "*")),
+            tracemalloc.Filter(False, os.path.abspath(__file__)),
+        ])
+
+    def _patch(self, owner: type, name: str, wrap: Callable[[Any], Any]) -> None:
+        """Replace owner.name with a wrapped version, remembering how to undo it."""
+        self._patches.append((owner, name, owner.__dict__.get(name, _MISSING)))
+        setattr(owner, name, wrap(getattr(owner, name)))
+
+    def _wrap_request(self, request: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(request)
+        async def _request(client: MosaicAPIClient, method: str, endpoint: str, *args: Any, **kwargs: Any) -> Any:
+            stats = self.requests.stats(method, endpoint)
+            stats.requests += 1
+            start = time.monotonic()
+            try:
+                return await request(client, method, endpoint, *args, **kwargs)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.latency.observe(time.monotonic() - start)
+
+        return _request
+
+    def _wrap_refresh(self, update: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(update)
+        async def _async_update_data(coordinator: MosaicDataUpdateCoordinator) -> Dict[str, Any]:
+            start = time.monotonic()
+            try:
+                return await update(coordinator)
+            finally:
+                histogram = self.refreshes.get(coordinator.name)
+                if histogram is None:
+                    histogram = self.refreshes[coordinator.name] = LatencyHistogram()
+                histogram.observe(time.monotonic() - start)
+
+        return _async_update_data
+
+    def _wrap_state_write(self, write: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(write)  # Also keeps the @callback marker
+        def _async_write_ha_state(entity: Entity) -> None:
+            self.state_writes[entity.entity_id] += 1
+            write(entity)
+
+        return _async_write_ha_state
+
+    def summary(self) -> Dict[str, Any]:
+        """Return session totals."""
+        return {
+            "duration": round(self.duration, 1),
+            "refreshes": sum(histogram.count for histogram in self.refreshes.values()),
+            "requests": sum(stats.requests for stats in self.requests.endpoints.values()),
+            "state_writes": sum(self.state_writes.values()),
+        }
+
+    def write_report(self, path: str) -> None:
+        """Format the session and write it to path; runs in the executor."""
+        out = io.StringIO()
+        out.write(f"Mosaic profile, {self.duration:.1f} s\n")
+
+        out.write("\n== Refresh cycles ==\n")
+        for name, histogram in sorted(self.refreshes.items()):
+            out.write(_histogram_line(name, histogram.count, histogram))
+
+        out.write("\n== Requests ==\n")
+        for template, stats in sorted(self.requests.endpoints.items()):
+            out.write(_histogram_line(template, stats.requests, stats.latency, f" errors={stats.errors}"))
+
+        out.write("\n== Entity state writes ==\n")
+        for entity_id, count in self.state_writes.most_common():
+            out.write(f"{entity_id}: {count}\n")
+
+        out.write("\n== CPU (cProfile, cumulative) ==\n")
+        stats = pstats.Stats(self._profile, stream=out)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(re.escape(PACKAGE_DIR), PROFILE_TOP_FUNCTIONS)
+
+        out.write("\n== Allocations (tracemalloc, growth during the session) ==\n")
+        if self._start_snapshot is not None and self._end_snapshot is not None:
+            for stat in self._end_snapshot.compare_to(self._start_snapshot, "lineno")[:PROFILE_TOP_ALLOCATIONS]:
+                out.write(f"{stat}\n")
+
+        with open(path, "w", encoding="utf-8") as report:
+            report.write(out.getvalue())
+
+
+def _histogram_line(name: str, count: int, histogram: LatencyHistogram, extra: str = "") -> str:
+    """Format one row of count and latency figures."""
+    summary = histogram.as_dict()
+    return (
+        f"{name}: count={count} mean={summary['mean'] * 1000:.1f}ms "
+        f"p95<={summary['p95'] * 1000:.0f}ms max={summary['max'] * 1000:.1f}ms{extra}\n"
+    )
+
+
+async def async_profile(hass: HomeAssistant, seconds: float) -> Dict[str, Any]:
+    """Profile the integration for a number of seconds and write a report file."""
+    if hass.data[DOMAIN].get(DATA_PROFILER) is not None:
+        raise HomeAssistantError("A Mosaic profiling session is already running")
+    profiler = hass.data[DOMAIN][DATA_PROFILER] = MosaicProfiler()
+    try:
+        await hass.async_add_executor_job(profiler.start_tracing)
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+    finally:
+        await hass.async_add_executor_job(profiler.stop_tracing)
+        hass.data[DOMAIN].pop(DATA_PROFILER, None)
+
+    path = hass.config.path(f"mosaic_profile_{time.strftime('%Y%m%d-%H%M%S')}.txt")
+    await hass.async_add_executor_job(profiler.write_report, path)
+    _LOGGER.info(f"Wrote Mosaic profile to {path}")
+    return {"path": path, **profiler.summary()}
@@ -0,0 +1,63 @@
+"""Domain-wide poll scheduling shared by all Mosaic config entries."""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List
+
+from .const import DEFAULT_MAX_REQUESTS
+
+
+class MosaicScheduler:
+    """Stagger polling across entries and cap their combined requests.
+
+    Each registered coordinator gets a slot: an evenly spaced phase within
+    its poll interval. Poll delays are snapped to the coordinator's slot so
+    entries started together don't keep polling in lockstep. All API clients
+    share one semaphore limiting concurrent outbound requests.
+    """
+
+    def __init__(self, max_requests: int = DEFAULT_MAX_REQUESTS):
+        self.max_requests = max(1, max_requests)
+        self.request_limit = asyncio.Semaphore(self.max_requests)
+        self._members: List[Any] = []
+        self._epoch = time.monotonic()
+
+    def register(self, member: Any) -> Callable[[], None]:
+        """Give a coordinator a slot; returns a callback releasing it."""
+        self._members.append(member)
+
+        def _unregister() -> None:
+            if member in self._members:
+                self._members.remove(member)
+
+        return _unregister
+
+    @property
+    def members(self) -> int:
+        """Return the number of registered coordinators."""
+        return len(self._members)
+
+    def phase(self, member: Any) -> float:
+        """Return a member's slot as a fraction of its interval."""
+        if member not in self._members:
+            return 0.0
+        return self._members.index(member) / len(self._members)
+
+    def align(self, member: Any, interval: timedelta) -> timedelta:
+        """Return a delay close to ``interval`` that lands on the member's slot."""
+        seconds = interval.total_seconds()
+        if seconds <= 0 or len(self._members) < 2:
+            return interval
+        slot = self._epoch + self.phase(member) * seconds
+        delay = (slot - time.monotonic()) % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        return timedelta(seconds=delay)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {
+            "coordinators": len(self._members),
+            "max_requests": self.max_requests,
+        }
@@ -2,14 +2,17 @@
 
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DATA_COORDINATOR, DOMAIN
 from .coordinator import MosaicDataUpdateCoordinator
+from .entity import MosaicDisplayEntity, async_track_display_entities
+from .models import DisplaySnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,40 +24,183 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
-    
-    entities = [
-        MosaicCurrentAppSensor(coordinator, display_id)
-        for display_id in coordinator.get_display_ids()
-    ]
-    async_add_entities(entities)
+    async_track_display_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        lambda coordinator, display_id: [
+            MosaicCurrentAppSensor(coordinator, entry.entry_id, display_id),
+            MosaicNotificationQueueSensor(coordinator, entry.entry_id, display_id),
+            MosaicNotificationDroppedSensor(coordinator, entry.entry_id, display_id),
+        ],
+    )
+    async_add_entities([
+        MosaicRefreshDurationSensor(coordinator, entry.entry_id),
+        MosaicRequestLatencySensor(coordinator, entry.entry_id),
+        MosaicRequestErrorsSensor(coordinator, entry.entry_id),
+    ])
 
 
-class MosaicCurrentAppSensor(CoordinatorEntity, SensorEntity):
+class MosaicCurrentAppSensor(MosaicDisplayEntity, SensorEntity):
     """Sensor showing current app."""
 
-    def __init__(self, coordinator: MosaicDataUpdateCoordinator, display_id: str) -> None:
-        super().__init__(coordinator)
-        self._display_id = display_id
-        display = coordinator.get_display(display_id)
-        self._attr_unique_id = f"mosaic_{display_id}_app"
-        self._attr_name = f"{display.get('name', display_id)} Current App"
+    def __init__(
+        self, coordinator: MosaicDataUpdateCoordinator, entry_id: str, display_id: str
+    ) -> None:
+        super().__init__(coordinator, display_id)
+        self._attr_unique_id = f"mosaic_{entry_id}_{display_id}_app"
+        self._attr_name = f"{self._display.name or display_id} Current App"
         self._attr_icon = "mdi:application"
 
-    @property
-    def _display(self) -> dict:
-        return self.coordinator.get_display(self._display_id)
+    def _update_from_snapshot(self, snapshot: DisplaySnapshot) -> None:
+        self._attr_extra_state_attributes = {
+            "display_id": self._display_id,
+            "brightness": snapshot.brightness,
+            "power": snapshot.power,
+            "rotation_enabled": snapshot.rotation_enabled,
+            "width": snapshot.width,
+            "height": snapshot.height,
+        }
 
     @property
     def native_value(self) -> str:
-        return self._display.get("current_app", "unknown")
+        return self._display.current_app or "unknown"
+
+
+class MosaicNotificationQueueSensor(MosaicDisplayEntity, SensorEntity):
+    """Sensor showing the number of pending notifications."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator: MosaicDataUpdateCoordinator, entry_id: str, display_id: str
+    ) -> None:
+        super().__init__(coordinator, display_id)
+        self._notifier = coordinator.get_notifier(display_id)
+        self._attr_unique_id = f"mosaic_{entry_id}_{display_id}_notify_queue"
+        self._attr_name = f"{self._display.name or display_id} Notification Queue"
+        self._attr_icon = "mdi:message-processing"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._notifier.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> int:
+        return self._notifier.depth
 
     @property
     def extra_state_attributes(self) -> dict:
         return {
             "display_id": self._display_id,
-            "brightness": self._display.get("brightness"),
-            "power": self._display.get("power"),
-            "rotation_enabled": self._display.get("rotation_enabled"),
-            "width": self._display.get("width"),
-            "height": self._display.get("height"),
+            "sent": self._notifier.sent,
+            "merged": self._notifier.merged,
+            "deduplicated": self._notifier.deduplicated,
         }
+
+
+class MosaicNotificationDroppedSensor(MosaicDisplayEntity, SensorEntity):
+    """Sensor counting notifications dropped because the queue was full."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(
+        self, coordinator: MosaicDataUpdateCoordinator, entry_id: str, display_id: str
+    ) -> None:
+        super().__init__(coordinator, display_id)
+        self._notifier = coordinator.get_notifier(display_id)
+        self._attr_unique_id = f"mosaic_{entry_id}_{display_id}_notify_dropped"
+        self._attr_name = f"{self._display.name or display_id} Notifications Dropped"
+        self._attr_icon = "mdi:message-alert"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._notifier.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> int:
+        return self._notifier.dropped
+
+
+class MosaicRefreshDurationSensor(CoordinatorEntity, SensorEntity):
+    """Sensor showing how long the last coordinator refresh took."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator: MosaicDataUpdateCoordinator, entry_id: str) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"mosaic_{entry_id}_refresh_duration"
+        self._attr_name = "Mosaic Refresh Duration"
+        self._attr_icon = "mdi:timer-sync"
+
+    @property
+    def native_value(self) -> float:
+        return self.coordinator.refresh_duration.last * 1000
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        histogram = self.coordinator.refresh_duration
+        return {
+            "refreshes": histogram.count,
+            "p95_ms": histogram.quantile(0.95) * 1000,
+            "max_ms": histogram.max * 1000,
+        }
+
+
+class MosaicRequestLatencySensor(CoordinatorEntity, SensorEntity):
+    """Sensor showing the slowest endpoint's 95th percentile request latency."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator: MosaicDataUpdateCoordinator, entry_id: str) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"mosaic_{entry_id}_request_latency"
+        self._attr_name = "Mosaic Request Latency"
+        self._attr_icon = "mdi:timer-outline"
+
+    @property
+    def native_value(self) -> float:
+        endpoints = self.coordinator.api.metrics.endpoints
+        return max((stats.latency.quantile(0.95) for stats in endpoints.values()), default=0.0) * 1000
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {
+            f"{template} p95_ms": stats.latency.quantile(0.95) * 1000
+            for template, stats in self.coordinator.api.metrics.endpoints.items()
+        }
+
+
+class MosaicRequestErrorsSensor(CoordinatorEntity, SensorEntity):
+    """Sensor counting failed and timed-out API requests."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator: MosaicDataUpdateCoordinator, entry_id: str) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"mosaic_{entry_id}_request_errors"
+        self._attr_name = "Mosaic Request Errors"
+        self._attr_icon = "mdi:alert-circle-outline"
+
+    @property
+    def available(self) -> bool:
+        # Errors are most interesting exactly when updates are failing
+        return True
+
+    @property
+    def native_value(self) -> int:
+        return self.coordinator.api.metrics.total_errors
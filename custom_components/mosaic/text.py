@@ -0,0 +1,123 @@
+"""Text measurement and layout for Mosaic notifications."""
+
+import math
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .const import (
+    DEFAULT_FONT,
+    TEXT_ELLIPSIS,
+    TEXT_MAX_DURATION,
+    TEXT_MIN_DURATION,
+    TEXT_SCROLL_SPEED,
+)
+
+# Advance widths in pixels (glyph plus spacing) for the add-on's bitmap fonts:
+# (default advance, {chars: advance} overrides)
+FONT_METRICS: Dict[str, Tuple[int, Dict[str, int]]] = {
+    "tb-8": (6, {" ": 3, "!.,:;'|": 2, "il`": 3, "()[]{}1Ij\"": 4, "mwMW@%&": 7}),
+    "tom-thumb": (4, {" ": 2, "!.,:;'|": 2, "il`()[]": 3, "mwMW@": 5}),
+    "5x8": (5, {}),
+    "6x10": (6, {}),
+    "6x13": (6, {}),
+    "10x20": (10, {}),
+}
+
+
+class TextPage(NamedTuple):
+    """One notification's worth of laid-out text."""
+
+    text: str
+    width: int
+    duration: int
+
+
+@lru_cache(maxsize=None)
+def glyph_widths(font: str) -> Tuple[int, ...]:
+    """Return the advance width of every Latin-1 code point for a font."""
+    default, overrides = FONT_METRICS.get(font, FONT_METRICS[DEFAULT_FONT])
+    widths = [default] * 256
+    for chars, advance in overrides.items():
+        for char in chars:
+            widths[ord(char)] = advance
+    return tuple(widths)
+
+
+@lru_cache(maxsize=512)
+def measure(text: str, font: str = DEFAULT_FONT) -> int:
+    """Return the rendered pixel width of a single line of text."""
+    if not text:
+        return 0
+    widths = glyph_widths(font)
+    # Characters outside Latin-1 are measured as '?', a full-width glyph
+    total = sum(widths[code] for code in text.encode("latin-1", "replace"))
+    return total - 1  # No spacing after the last glyph
+
+
+def scroll_duration(text_width: int, display_width: int, speed: float = TEXT_SCROLL_SPEED) -> int:
+    """Return whole seconds to show text, scrolling it fully across if it doesn't fit."""
+    if text_width <= display_width:
+        return TEXT_MIN_DURATION
+    # Marquee enters from the right edge and leaves past the left edge
+    return max(TEXT_MIN_DURATION, math.ceil((text_width + display_width) / speed))
+
+
+def truncate(text: str, max_width: int, font: str = DEFAULT_FONT) -> str:
+    """Cut text to fit max_width pixels, ending with an ellipsis."""
+    if measure(text, font) <= max_width:
+        return text
+    widths = glyph_widths(font)
+    budget = max_width - measure(TEXT_ELLIPSIS, font) - 1
+    used = 0
+    for index, code in enumerate(text.encode("latin-1", "replace")):
+        used += widths[code]
+        if used - 1 > budget:
+            return text[:index].rstrip() + TEXT_ELLIPSIS
+    return text
+
+
+def layout_text(
+    text: str,
+    display_width: int,
+    font: str = DEFAULT_FONT,
+    max_duration: int = TEXT_MAX_DURATION,
+    split: bool = True,
+    speed: float = TEXT_SCROLL_SPEED,
+) -> List[TextPage]:
+    """Lay out text for a display, returning one page per notification.
+
+    Text that fits is shown statically; longer text scrolls for as long as
+    it takes to cross the display. Text that would scroll longer than
+    ``max_duration`` is split at word boundaries into several pages, or
+    truncated when ``split`` is False.
+    """
+    text = " ".join(text.split())
+    # Longest text that still scrolls through within max_duration
+    max_width = max(display_width, int(max_duration * speed) - display_width)
+    width = measure(text, font)
+    if width <= max_width:
+        return [TextPage(text, width, scroll_duration(width, display_width, speed))]
+    if not split:
+        text = truncate(text, max_width, font)
+        width = measure(text, font)
+        return [TextPage(text, width, scroll_duration(width, display_width, speed))]
+
+    pages: List[TextPage] = []
+    current: Optional[str] = None
+    for word in text.split(" "):
+        if measure(word, font) > max_width:
+            word = truncate(word, max_width, font)
+        candidate = word if current is None else f"{current} {word}"
+        if current is not None and measure(candidate, font) > max_width:
+            pages.append(_page(current, display_width, font, speed))
+            candidate = word
+        current = candidate
+    if current:
+        pages.append(_page(current, display_width, font, speed))
+    return pages
+
+
+def _page(text: str, display_width: int, font: str, speed: float) -> TextPage:
+    """Build a page for text already known to fit."""
+    width = measure(text, font)
+    return TextPage(text, width, scroll_duration(width, display_width, speed))
@@ -0,0 +1,14 @@
+"""Helpers shared by the tests."""
+
+import asyncio
+import time
+from typing import Callable
+
+
+async def async_wait_for(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    """Wait until condition() is true, failing the test after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met in time")
+        await asyncio.sleep(0.005)
@@ -0,0 +1,32 @@
+"""Shared fixtures: a stub add-on and clients pointed at it."""
+
+import pytest_asyncio
+from homeassistant.core import HomeAssistant
+
+from benchmarks.stub_server import StubAddon
+from custom_components.mosaic.api import MosaicAPIClient
+
+
+@pytest_asyncio.fixture
+async def stub():
+    """Serve a simulated add-on with four displays."""
+    addon = StubAddon(displays=4, seed=1)
+    await addon.start()
+    yield addon
+    await addon.stop()
+
+
+@pytest_asyncio.fixture
+async def api(stub):
+    """Return an API client for the stub add-on."""
+    client = MosaicAPIClient(stub.base_url)
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    """Return a bare Home Assistant instance that is stopped afterwards."""
+    instance = HomeAssistant(str(tmp_path))
+    yield instance
+    await instance.async_stop(force=True)
@@ -0,0 +1,34 @@
+"""Tests for the API client."""
+
+import asyncio
+
+import pytest
+
+from custom_components.mosaic.api import MosaicTimeoutError
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_limit_held_until_timed_out_request_ends(stub, api):
+    """A per-request timeout must not free the caller's slot while the request runs."""
+    stub.latency = 0.2
+    limit = asyncio.Semaphore(2)
+    stats = api.metrics.stats("GET", "/api/displays/display_0/rotation")
+    peak = 0
+
+    async def sample() -> None:
+        nonlocal peak
+        while True:
+            peak = max(peak, stats.in_flight)
+            await asyncio.sleep(0.001)
+
+    sampler = asyncio.create_task(sample())
+    results = await asyncio.gather(
+        *(api.get_rotation(display_id, limit, 0.05) for display_id in stub.displays),
+        return_exceptions=True,
+    )
+    sampler.cancel()
+
+    assert all(isinstance(result, MosaicTimeoutError) for result in results)
+    assert peak == 2
+    assert stats.in_flight == 0
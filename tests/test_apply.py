@@ -0,0 +1,100 @@
+"""Tests for applying changes to many displays at once."""
+
+import pytest
+import pytest_asyncio
+
+from benchmarks.stub_server import StubAddon
+from custom_components.mosaic.api import MosaicAPIClient
+from custom_components.mosaic.circuit import CircuitBreaker
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+
+pytestmark = pytest.mark.asyncio
+
+BATCH_ROUTE = "POST /api/displays/batch"
+CHANGES = [
+    {"display_id": "display_0", "brightness": 10},
+    {"display_id": "display_1", "power": False, "rotation_enabled": False},
+    {"display_id": "display_9", "brightness": 20},
+]
+
+
+async def _coordinator(hass, stub: StubAddon):
+    client = MosaicAPIClient(stub.base_url, retries=0)
+    client.circuit_breaker = CircuitBreaker(failure_threshold=1000)
+    coordinator = MosaicDataUpdateCoordinator(hass, client)
+    await coordinator.async_refresh()
+    return coordinator
+
+
+@pytest_asyncio.fixture
+async def coordinator(hass, stub):
+    """Return a refreshed coordinator for an add-on without a batch endpoint."""
+    instance = await _coordinator(hass, stub)
+    yield instance
+    await instance.async_shutdown()
+    await instance.api.close()
+
+
+@pytest_asyncio.fixture
+async def batch_stub():
+    """Serve a simulated add-on with four displays and a batch endpoint."""
+    addon = StubAddon(displays=4, seed=1, batch=True)
+    await addon.start()
+    yield addon
+    await addon.stop()
+
+
+@pytest_asyncio.fixture
+async def batch_coordinator(hass, batch_stub):
+    """Return a refreshed coordinator for the add-on with a batch endpoint."""
+    instance = await _coordinator(hass, batch_stub)
+    yield instance
+    await instance.async_shutdown()
+    await instance.api.close()
+
+
+def _assert_applied(stub: StubAddon, results) -> None:
+    assert results["display_0"] == {"success": True, "error": None}
+    assert results["display_1"] == {"success": True, "error": None}
+    assert results["display_9"]["success"] is False
+    assert results["display_9"]["error"]
+    assert stub.displays["display_0"]["brightness"] == 10
+    assert stub.displays["display_1"]["power"] is False
+    assert stub.rotations["display_1"]["enabled"] is False
+
+
+async def test_batch_endpoint_applies_in_one_request(batch_stub, batch_coordinator):
+    results = await batch_coordinator.async_apply(CHANGES)
+
+    _assert_applied(batch_stub, results)
+    assert batch_stub.requests_by_route[BATCH_ROUTE] == 1
+    assert "PUT /api/displays/{id}/brightness" not in batch_stub.requests_by_route
+    assert batch_coordinator.get_display("display_1")["rotation"]["enabled"] is False
+
+
+async def test_missing_batch_endpoint_falls_back_to_display_writes(stub, coordinator):
+    results = await coordinator.async_apply(CHANGES)
+
+    _assert_applied(stub, results)
+    assert stub.requests_by_route["PUT /api/displays/{id}/brightness"] == 2
+    assert coordinator.get_display("display_1")["rotation"]["enabled"] is False
+
+    # Only the write and the reconciling display list, the batch endpoint isn't retried
+    requests = stub.request_count
+    await coordinator.async_apply([{"display_id": "display_2", "brightness": 30}])
+    assert stub.request_count - requests == 2
+    assert stub.displays["display_2"]["brightness"] == 30
+
+
+async def test_unreachable_addon_fails_every_display_and_journals(batch_stub, batch_coordinator):
+    await batch_stub.stop()
+
+    results = await batch_coordinator.async_apply(CHANGES[:2])
+
+    assert [result["success"] for result in results.values()] == [False, False]
+    journaled = batch_coordinator.journal.pending_writes()
+    assert {(write["display_id"], write["attribute"]) for write in journaled} == {
+        ("display_0", "brightness"),
+        ("display_1", "power"),
+        ("display_1", "rotation_enabled"),
+    }
@@ -0,0 +1,63 @@
+"""Tests for conditional GET caching and single-flight requests."""
+
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_revalidated_get_returns_cached_object(stub, api):
+    first = await api.get_displays()
+    second = await api.get_displays()
+
+    assert second is first
+    assert stub.not_modified_count == 1
+
+
+async def test_write_during_revalidation_refetches(stub, api):
+    await api.get_displays()
+    stub.latency = 0.05
+
+    # The GET's 304 is produced before the write lands but arrives after it started
+    pending = asyncio.ensure_future(api.get_displays())
+    await asyncio.sleep(0.01)
+    await api.set_brightness("display_0", 5)
+    displays = await pending
+
+    assert stub.not_modified_count == 1
+    assert next(display for display in displays if display["id"] == "display_0")["brightness"] == 5
+
+
+async def test_eviction_during_revalidation_serves_cached_body(stub, api):
+    cached = await api.get_displays()
+    stub.latency = 0.05
+
+    pending = asyncio.ensure_future(api.get_displays())
+    await asyncio.sleep(0.01)
+    api._cache.clear()
+
+    assert await pending is cached
+
+
+async def test_identical_gets_share_one_request(stub, api):
+    stub.latency = 0.02
+
+    results = await asyncio.gather(*(api.get_displays() for _ in range(8)))
+
+    assert stub.requests_by_route["GET /api/displays"] == 1
+    assert all(result is results[0] for result in results)
+    assert api.metrics.stats("GET", "/api/displays").shared == 7
+
+
+async def test_get_after_write_is_not_shared_with_earlier_get(stub, api):
+    stub.latency = 0.02
+
+    before = asyncio.ensure_future(api.get_display("display_1"))
+    await asyncio.sleep(0)
+    await api.set_power("display_1", False)
+    after = await api.get_display("display_1")
+    await before
+
+    assert after["power"] is False
+    assert stub.requests_by_route["GET /api/displays/{id}"] == 2
@@ -0,0 +1,98 @@
+"""Tests for the circuit breaker."""
+
+import time
+
+import pytest
+
+from custom_components.mosaic.api import MosaicAPIClient, MosaicAPIError, MosaicCircuitOpenError
+from custom_components.mosaic.circuit import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_after_threshold_and_refuses():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow_request() == (True, None)
+
+    breaker.record_failure()
+
+    assert breaker.state == STATE_OPEN
+    assert breaker.allow_request() == (False, None)
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    _open(breaker)
+
+    allowed, probe = breaker.allow_request()
+    assert allowed and probe is not None
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.allow_request() == (False, None)
+
+    breaker.record_success(probe)
+    assert breaker.state == STATE_CLOSED
+    assert not breaker.probing
+
+
+def test_probe_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    _open(breaker)
+    _, probe = breaker.allow_request()
+
+    breaker.record_failure(probe)
+
+    assert breaker.state == STATE_OPEN
+    assert not breaker.probing
+    assert breaker.opened == 2
+
+
+def test_older_request_cannot_end_the_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    _open(breaker)
+    _, probe = breaker.allow_request()
+
+    # A request sent while the circuit was still closed fails now
+    breaker.record_failure()
+    breaker._opened_at = time.monotonic() - 1
+
+    assert breaker.probing
+    assert breaker.allow_request() == (False, None)
+
+    breaker.record_success(probe)
+    assert breaker.allow_request() == (True, None)
+
+
+def test_stale_probe_token_does_not_release_a_new_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    _open(breaker)
+    _, first = breaker.allow_request()
+    breaker.record_failure(first)
+    _, second = breaker.allow_request()
+
+    breaker.release_probe(first)
+
+    assert breaker.probing
+    breaker.release_probe(second)
+    assert not breaker.probing
+
+
+@pytest.mark.asyncio
+async def test_client_fails_fast_while_open(stub):
+    stub.error_rate = 1.0
+    client = MosaicAPIClient(stub.base_url, retries=0)
+    client.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    try:
+        for _ in range(2):
+            with pytest.raises(MosaicAPIError):
+                await client.get_status()
+        with pytest.raises(MosaicCircuitOpenError):
+            await client.get_status()
+    finally:
+        await client.close()
+
+    assert stub.error_count == 2
@@ -0,0 +1,77 @@
+"""Tests for the command coalescer."""
+
+import asyncio
+
+import pytest
+
+from custom_components.mosaic.api import MosaicAPIClient
+from custom_components.mosaic.coalescer import CommandCoalescer
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_burst_sends_latest_value_once():
+    coalescer = CommandCoalescer(0.01)
+    sent = []
+
+    async def send(value):
+        sent.append(value)
+        return value
+
+    results = await asyncio.gather(
+        *(coalescer.async_submit(("display_0", "brightness"), value, send) for value in range(10))
+    )
+
+    assert sent == [9]
+    assert results == [9] * 10
+    assert not coalescer.is_pending(("display_0", "brightness"))
+
+
+async def test_send_error_reaches_every_caller():
+    coalescer = CommandCoalescer(0.01)
+
+    async def send(value):
+        raise ValueError(value)
+
+    results = await asyncio.gather(
+        *(coalescer.async_submit("key", value, send) for value in range(3)),
+        return_exceptions=True,
+    )
+
+    assert [str(result) for result in results] == ["2", "2", "2"]
+
+
+async def test_shutdown_cancels_writes_in_flight():
+    coalescer = CommandCoalescer(0.01)
+    started = asyncio.Event()
+
+    async def send(value):
+        started.set()
+        await asyncio.sleep(10)
+
+    in_flight = asyncio.ensure_future(coalescer.async_submit("key", 1, send))
+    await started.wait()
+    queued = asyncio.ensure_future(coalescer.async_submit("key", 2, send))
+    await asyncio.sleep(0)
+
+    await coalescer.async_shutdown()
+    done, _ = await asyncio.wait([in_flight, queued], timeout=1)
+
+    assert done == {in_flight, queued}
+    assert in_flight.cancelled() and queued.cancelled()
+
+
+async def test_failed_coalesced_write_is_handled_once(hass, stub, caplog):
+    client = MosaicAPIClient(stub.base_url, retries=0)
+    coordinator = MosaicDataUpdateCoordinator(hass, client)
+    await coordinator.async_refresh()
+    stub.error_rate = 1.0
+
+    await asyncio.gather(*(coordinator.async_set_brightness("display_0", value) for value in range(5)))
+    await coordinator.async_shutdown()
+    await client.close()
+
+    assert sum("Failed to set brightness" in record.message for record in caplog.records) == 1
+    assert stub.requests_by_route["PUT /api/displays/{id}/brightness"] == 1
+    assert stub.requests_by_route["GET /api/displays/{id}"] == 1
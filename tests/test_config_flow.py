@@ -0,0 +1,117 @@
+"""Tests for auto-detecting and discovering the add-on in the config flow."""
+
+import time
+from ipaddress import ip_address
+
+import pytest
+import pytest_asyncio
+from homeassistant import config_entries
+from homeassistant.components.zeroconf import ZeroconfServiceInfo
+from homeassistant.const import CONF_URL
+from homeassistant.data_entry_flow import FlowResultType
+
+from benchmarks.stub_server import StubAddon
+from custom_components.mosaic import config_flow
+from custom_components.mosaic.config_flow import MosaicConfigFlow
+from custom_components.mosaic.const import DOMAIN
+
+pytestmark = pytest.mark.asyncio
+
+UNREACHABLE_URL = "http://127.0.0.1:1"
+
+
+@pytest_asyncio.fixture
+async def flows(hass):
+    """Give the bare instance a config entry manager to track flows in."""
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    return hass.config_entries.flow
+
+
+def _flow(hass, source: str) -> MosaicConfigFlow:
+    """Start a flow the way the flow manager does, without loading the integration."""
+    flow = MosaicConfigFlow()
+    flow.hass = hass
+    flow.handler = DOMAIN
+    flow.flow_id = f"{source}_{id(flow)}"
+    flow.context = {"source": source}
+    hass.config_entries.flow._async_add_flow_progress(flow)
+    return flow
+
+
+def _discovery(stub: StubAddon) -> ZeroconfServiceInfo:
+    return ZeroconfServiceInfo(
+        ip_address=ip_address("127.0.0.1"),
+        ip_addresses=[ip_address("127.0.0.1")],
+        port=stub.port,
+        hostname="mosaic.local.",
+        type="_mosaic._tcp.local.",
+        name="Mosaic._mosaic._tcp.local.",
+        properties={},
+    )
+
+
+async def test_auto_detect_probes_candidates_in_parallel(hass, flows, stub, monkeypatch):
+    slow = StubAddon(displays=1, latency=1.5)
+    await slow.start()
+    candidates = [UNREACHABLE_URL, slow.base_url, stub.base_url]
+    monkeypatch.setattr(config_flow, "AUTO_DETECT_URLS", candidates)
+
+    start = time.monotonic()
+    result = await _flow(hass, config_entries.SOURCE_USER).async_step_user({"auto_detect": True})
+    elapsed = time.monotonic() - start
+    await slow.stop()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_URL] == stub.base_url
+    assert elapsed < 1.0
+
+
+async def test_auto_detect_falls_back_to_manual(hass, flows, monkeypatch):
+    monkeypatch.setattr(config_flow, "AUTO_DETECT_URLS", [UNREACHABLE_URL])
+
+    result = await _flow(hass, config_entries.SOURCE_USER).async_step_user({"auto_detect": True})
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "manual"
+
+
+async def test_zeroconf_discovery_is_confirmed(hass, flows, stub):
+    flow = _flow(hass, config_entries.SOURCE_ZEROCONF)
+
+    result = await flow.async_step_zeroconf(_discovery(stub))
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "zeroconf_confirm"
+
+    result = await flow.async_step_zeroconf_confirm({})
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_URL] == stub.base_url
+
+
+async def test_zeroconf_discovery_that_does_not_answer_aborts(hass, flows, stub):
+    discovery = _discovery(stub)
+    await stub.stop()
+
+    result = await _flow(hass, config_entries.SOURCE_ZEROCONF).async_step_zeroconf(discovery)
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "cannot_connect"
+
+
+async def test_same_discovery_twice_aborts(hass, flows, stub):
+    await _flow(hass, config_entries.SOURCE_ZEROCONF).async_step_zeroconf(_discovery(stub))
+
+    result = await _flow(hass, config_entries.SOURCE_ZEROCONF).async_step_zeroconf(_discovery(stub))
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "already_in_progress"
+
+
+async def test_auto_detect_tries_pending_discoveries(hass, flows, stub, monkeypatch):
+    monkeypatch.setattr(config_flow, "AUTO_DETECT_URLS", [UNREACHABLE_URL])
+    await _flow(hass, config_entries.SOURCE_ZEROCONF).async_step_zeroconf(_discovery(stub))
+
+    result = await _flow(hass, config_entries.SOURCE_USER).async_step_user({"auto_detect": True})
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_URL] == stub.base_url
@@ -0,0 +1,72 @@
+"""Tests for adding and retiring per-display entities."""
+
+import pytest
+import pytest_asyncio
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.mosaic import entity as entity_module
+from custom_components.mosaic.const import DOMAIN
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+from custom_components.mosaic.entity import MosaicDisplayEntity, async_track_display_entities
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def tracked(hass, api):
+    """Track entities of the stub's displays; return the coordinator and registry."""
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+    coordinator = MosaicDataUpdateCoordinator(hass, api)
+    await coordinator.async_refresh()
+    entry = ConfigEntry(
+        version=1, minor_version=1, domain=DOMAIN, title="Mosaic", data={}, source="user"
+    )
+
+    def factory(coordinator, display_id):
+        entity = MosaicDisplayEntity(coordinator, display_id)
+        entity.entity_id = registry.async_get_or_create("sensor", DOMAIN, display_id).entity_id
+        return [entity]
+
+    async_track_display_entities(coordinator, entry, lambda entities: None, factory)
+    yield coordinator, registry
+    await coordinator.async_shutdown()
+
+
+async def test_briefly_missing_display_keeps_its_entities(stub, tracked, monkeypatch):
+    coordinator, registry = tracked
+    monkeypatch.setattr(entity_module, "DISPLAY_RETIRE_AFTER", 0)
+    display = stub.displays.pop("display_3")
+
+    for _ in range(entity_module.DISPLAY_RETIRE_REFRESHES - 1):
+        await coordinator.async_refresh()
+    stub.displays["display_3"] = display
+    await coordinator.async_refresh()
+    del stub.displays["display_3"]
+    for _ in range(entity_module.DISPLAY_RETIRE_REFRESHES - 1):
+        await coordinator.async_refresh()
+
+    assert registry.async_get_entity_id("sensor", DOMAIN, "display_3")
+
+
+async def test_display_missing_for_minutes_keeps_its_entities(stub, tracked):
+    coordinator, registry = tracked
+    del stub.displays["display_3"]
+
+    for _ in range(entity_module.DISPLAY_RETIRE_REFRESHES * 2):
+        await coordinator.async_refresh()
+
+    assert registry.async_get_entity_id("sensor", DOMAIN, "display_3")
+
+
+async def test_display_gone_long_enough_is_retired(stub, tracked, monkeypatch):
+    coordinator, registry = tracked
+    monkeypatch.setattr(entity_module, "DISPLAY_RETIRE_AFTER", 0)
+    del stub.displays["display_3"]
+
+    for _ in range(entity_module.DISPLAY_RETIRE_REFRESHES):
+        await coordinator.async_refresh()
+
+    assert registry.async_get_entity_id("sensor", DOMAIN, "display_3") is None
+    assert registry.async_get_entity_id("sensor", DOMAIN, "display_2")
@@ -0,0 +1,140 @@
+"""Tests for raw frame streaming."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import WSMsgType, web
+
+from custom_components.mosaic import api as api_module
+from custom_components.mosaic.api import MosaicAPIClient, MosaicTimeoutError
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+from custom_components.mosaic.frames import FrameStream
+
+from .common import async_wait_for
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Link:
+    """A send function that records frames and can be held or broken."""
+
+    def __init__(self):
+        self.frames = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.closed = False
+        self.error = None
+
+    async def send(self, frame: memoryview) -> None:
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        self.frames.append(bytes(frame))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _stream(link: _Link) -> FrameStream:
+    return FrameStream("display_0", 2, 1, link.send, fps=60, close=link.close)
+
+
+async def test_buffers_rotate_without_copying():
+    stream = _stream(_Link())
+
+    first = stream.frame_buffer()
+    stream.publish()
+    second = stream.frame_buffer()
+    stream.publish()
+
+    assert first.obj is not second.obj
+    # The back buffer is never the frame waiting to be sent
+    assert stream.frame_buffer().obj is first.obj
+
+
+async def test_frame_published_while_one_waits_replaces_it():
+    link = _Link()
+    stream = _stream(link)
+    stream.start()
+
+    link.gate.clear()
+    stream.publish_from(b"\x01" * 6)
+    await async_wait_for(lambda: not stream._pending)  # Frame 1 is being sent
+    stream.publish_from(b"\x02" * 6)
+    stream.publish_from(b"\x03" * 6)
+    link.gate.set()
+    await async_wait_for(lambda: stream.sent == 2)
+    await asyncio.sleep(0.05)
+    await stream.async_close()
+
+    assert link.frames == [b"\x01" * 6, b"\x03" * 6]
+    assert stream.dropped == 1
+
+
+async def test_send_failure_closes_the_channel_and_notifies():
+    link = _Link()
+    stream = _stream(link)
+    stopped = []
+    stream.async_on_stop(lambda: stopped.append(True))
+    stream.start()
+
+    link.error = ConnectionResetError("gone")
+    stream.publish()
+    await async_wait_for(lambda: stopped)
+
+    assert link.closed
+    assert not stream.running
+    assert isinstance(stream.error, ConnectionResetError)
+
+
+@pytest_asyncio.fixture
+async def frame_server():
+    """Serve a frames endpoint that accepts, then drops the socket after the header."""
+    state = {"handshake_delay": 0.0}
+
+    async def _frames(request: web.Request) -> web.WebSocketResponse:
+        await asyncio.sleep(state["handshake_delay"])
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        message = await ws.receive()
+        assert message.type == WSMsgType.TEXT
+        await ws.close()
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/api/displays/{id}/frames", _frames)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    client = MosaicAPIClient(f"http://127.0.0.1:{runner.addresses[0][1]}")
+    yield client, state
+    await client.close()
+    await runner.cleanup()
+
+
+async def test_slow_handshake_times_out(frame_server, monkeypatch):
+    client, state = frame_server
+    state["handshake_delay"] = 1.0
+    monkeypatch.setattr(api_module, "FRAME_CONNECT_TIMEOUT", 0.05)
+
+    with pytest.raises(MosaicTimeoutError):
+        await client.open_frame_stream("display_0", 2, 1)
+
+
+async def test_dead_stream_is_removed_from_coordinator(hass, frame_server):
+    client, _ = frame_server
+    coordinator = MosaicDataUpdateCoordinator(hass, client)
+    stream = await coordinator.async_open_frame_stream("display_0")
+
+    # The server has closed the socket; keep publishing until a send notices
+    async def _publish_until_stopped():
+        while stream.running:
+            stream.publish()
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_publish_until_stopped(), 2)
+
+    assert "display_0" not in coordinator.frame_streams
+    await coordinator.async_shutdown()
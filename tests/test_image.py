@@ -0,0 +1,149 @@
+"""Tests for local image and animation rendering."""
+
+import base64
+import io
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from homeassistant.exceptions import HomeAssistantError
+from PIL import Image
+
+from custom_components.mosaic import coordinator as coordinator_module
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+from custom_components.mosaic.image import (
+    ImageRenderer,
+    ImageTooLargeError,
+    delta_runs,
+    pack_indices,
+    render_animation,
+    render_image,
+)
+
+
+def _png(image: Image.Image) -> bytes:
+    out = io.BytesIO()
+    image.save(out, "PNG")
+    return out.getvalue()
+
+
+def _gif(frames, durations) -> bytes:
+    out = io.BytesIO()
+    frames[0].save(out, "GIF", save_all=True, append_images=frames[1:], duration=durations, loop=0)
+    return out.getvalue()
+
+
+def _frame(left_color, right_color) -> Image.Image:
+    image = Image.new("RGB", (64, 32), left_color)
+    image.paste(right_color, (32, 0, 64, 32))
+    return image
+
+
+@pytest_asyncio.fixture
+async def image_server():
+    """Serve a large image with and without a Content-Length header."""
+    body = _png(Image.effect_noise((256, 256), 64))
+
+    async def _sized(request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="image/png")
+
+    async def _chunked(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for start in range(0, len(body), 4096):
+            await response.write(body[start:start + 4096])
+        return response
+
+    app = web.Application()
+    app.router.add_get("/sized.png", _sized)
+    app.router.add_get("/chunked.png", _chunked)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    yield f"http://127.0.0.1:{runner.addresses[0][1]}", len(body)
+    await runner.cleanup()
+
+
+def test_pack_indices_msb_first():
+    assert pack_indices(np.array([1, 0, 1, 1, 0, 0, 0, 1], dtype=np.uint8), 1) == bytes([0b10110001])
+    assert pack_indices(np.array([3, 0, 2, 1], dtype=np.uint8), 2) == bytes([0b11001001])
+
+
+def test_image_is_fitted_and_quantized():
+    rendered = render_image(_png(Image.new("RGB", (100, 100), (255, 0, 0))), 64, 32)
+
+    assert (rendered.width, rendered.height, rendered.bits) == (64, 32, 1)
+    assert len(rendered.pixels) == 64 * 32 // 8
+    # A square image is letterboxed: black columns either side of the red square
+    assert {rendered.palette[index:index + 3] for index in range(0, len(rendered.palette), 3)} == {
+        bytes((0, 0, 0)),
+        bytes((255, 0, 0)),
+    }
+    payload = rendered.as_payload()
+    assert base64.b64decode(payload["pixels"]) == rendered.pixels
+
+
+def test_decompression_bomb_is_refused(monkeypatch):
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)
+
+    with pytest.raises(ImageTooLargeError):
+        render_image(_png(Image.new("RGB", (64, 64))), 64, 32)
+
+
+def test_delta_runs_cover_changed_pixels():
+    previous = np.array([0, 0, 1, 1, 0, 0], dtype=np.uint8)
+    current = np.array([0, 2, 2, 1, 0, 3], dtype=np.uint8)
+
+    runs, changed = delta_runs(previous, current)
+
+    assert runs.tolist() == [[1, 2], [5, 1]]
+    assert changed.tolist() == [2, 2, 3]
+
+
+def test_animation_merges_identical_frames_and_encodes_deltas():
+    red, near_red, blue = (255, 0, 0), (250, 0, 0), (0, 0, 255)
+    # The first two frames differ in the source but not once reduced to two colors
+    frames = [_frame(red, red), _frame(near_red, red), _frame(red, blue)]
+    # Only one pixel differs from the previous frame
+    frames.append(frames[2].copy())
+    frames[3].putpixel((0, 0), blue)
+
+    animation = render_animation(_gif(frames, [100, 150, 200, 250]), 64, 32, colors=2)
+
+    assert animation.source_frames == 4
+    assert [frame["duration"] for frame in animation.frames] == [250, 200, 250]
+    assert "runs" not in animation.frames[0]
+    assert "runs" in animation.frames[2]
+    runs = np.frombuffer(animation.frames[2]["runs"], dtype="<u2").reshape(-1, 2)
+    assert runs.tolist() == [[0, 1]]
+    assert animation.as_payload() is animation.as_payload()
+
+
+def test_renderer_caches_by_content_and_geometry():
+    renderer = ImageRenderer(cache_size=2)
+    data = _png(Image.new("RGB", (8, 8), (0, 255, 0)))
+
+    first = renderer.render(data, 64, 32)
+    assert renderer.render(data, 64, 32) is first
+    assert renderer.render(data, 32, 16) is not first
+    assert (renderer.hits, renderer.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/sized.png", "/chunked.png"])
+async def test_oversized_download_fails_the_service_call(hass, api, stub, image_server, monkeypatch, path):
+    base_url, size = image_server
+    coordinator = MosaicDataUpdateCoordinator(hass, api)
+    await coordinator.async_refresh()
+
+    monkeypatch.setattr(coordinator_module, "IMAGE_MAX_BYTES", size - 1)
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_push_image(f"{base_url}{path}", display_id="display_0")
+
+    monkeypatch.setattr(coordinator_module, "IMAGE_MAX_BYTES", size)
+    await coordinator.async_push_image(f"{base_url}{path}", display_id="display_0")
+    await coordinator.async_shutdown()
+    assert [note.get("type") for note in stub.notifications] == ["image"]
@@ -0,0 +1,99 @@
+"""Tests for journaling commands while the add-on is unreachable."""
+
+import pytest
+import pytest_asyncio
+
+from custom_components.mosaic.api import MosaicAPIClient
+from custom_components.mosaic.circuit import CircuitBreaker
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+from custom_components.mosaic.journal import CommandJournal
+
+from .common import async_wait_for
+
+
+@pytest_asyncio.fixture
+async def coordinator(hass, stub):
+    """Return a refreshed coordinator whose client fails fast and never trips open."""
+    client = MosaicAPIClient(stub.base_url, retries=0)
+    client.circuit_breaker = CircuitBreaker(failure_threshold=1000)
+    instance = MosaicDataUpdateCoordinator(hass, client)
+    await instance.async_refresh()
+    yield instance
+    await instance.async_shutdown()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_commands_replay_after_outage(stub, coordinator):
+    await stub.stop()
+    await coordinator.async_set_brightness("display_0", 7)
+    await coordinator.async_set_brightness("display_0", 9)
+    await coordinator.async_set_power("display_1", False)
+    await coordinator.async_push_text("Washer done", 5, display_id="display_2")
+    await async_wait_for(lambda: coordinator.journal.as_dict()["pending_notifications"] == 1)
+    assert coordinator.journal.as_dict()["pending_writes"] == 2
+
+    await stub.start()
+    await coordinator.async_refresh()
+    await async_wait_for(lambda: stub.notifications and not len(coordinator.journal))
+
+    assert stub.displays["display_0"]["brightness"] == 9
+    assert stub.displays["display_1"]["power"] is False
+    assert [note["text"] for note in stub.notifications] == ["Washer done"]
+    assert stub.requests_by_route["PUT /api/displays/{id}/brightness"] == 1
+
+
+@pytest.mark.asyncio
+async def test_replay_skips_writes_superseded_by_live_commands(stub, coordinator, monkeypatch):
+    coordinator.journal.record_write("display_0", "power", True)
+    coordinator.journal.record_write("display_0", "brightness", 10)
+    set_power = coordinator.api.set_power
+
+    async def _set_power_then_user_sets_brightness(display_id, power):
+        await coordinator.async_set_brightness("display_0", 90)
+        return await set_power(display_id, power)
+
+    monkeypatch.setattr(coordinator.api, "set_power", _set_power_then_user_sets_brightness)
+    await coordinator._async_replay_journal()
+
+    assert stub.displays["display_0"]["brightness"] == 90
+    assert coordinator.get_snapshot("display_0").brightness == 90
+    assert not len(coordinator.journal)
+
+
+def test_writes_compact_to_latest_value():
+    journal = CommandJournal()
+    journal.record_write("display_0", "brightness", 10)
+    journal.record_write("display_0", "power", True)
+    journal.record_write("display_0", "brightness", 20)
+
+    assert [(write["attribute"], write["value"]) for write in journal.pending_writes()] == [
+        ("power", True),
+        ("brightness", 20),
+    ]
+
+
+def test_replayed_write_superseded_meanwhile_stays_journaled():
+    journal = CommandJournal()
+    journal.record_write("display_0", "brightness", 10)
+    (replaying,) = journal.pending_writes()
+    journal.record_write("display_0", "brightness", 20)
+
+    journal.complete_write(replaying)
+
+    assert [write["value"] for write in journal.pending_writes()] == [20]
+
+
+def test_expired_and_excess_entries_are_dropped():
+    journal = CommandJournal(max_entries=2, notify_ttl=-1)
+    journal.record_notification("display_0", "stale", 5, "#FFFFFF", "normal")
+    assert journal.take_notifications() == []
+
+    journal = CommandJournal(max_entries=2)
+    journal.record_write("display_0", "power", True)
+    journal.record_notification("display_0", "first", 5, "#FFFFFF", "normal")
+    journal.record_notification("display_0", "second", 5, "#FFFFFF", "normal")
+
+    assert [note["text"] for note in journal.take_notifications()] == ["second"]
+    assert len(journal.pending_writes()) == 1
+    assert journal.dropped == 1
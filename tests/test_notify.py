@@ -0,0 +1,83 @@
+"""Tests for the per-display notification queue."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from custom_components.mosaic.const import NOTIFY_MERGE_SEPARATOR, PRIORITY_HIGH, TEXT_MAX_DURATION
+from custom_components.mosaic.notify import NotificationScheduler
+from custom_components.mosaic.text import layout_text, measure, scroll_duration
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def sent():
+    """Return the list a scheduler's sends are recorded in."""
+    return []
+
+
+@pytest_asyncio.fixture
+async def scheduler(sent):
+    """Return a scheduler for a 64 px display that records what it sends."""
+
+    async def send(text, duration, color, priority, font):
+        sent.append((text, duration))
+
+    instance = NotificationScheduler("display_0", send, display_width=lambda: 64)
+    yield instance
+    await instance.async_shutdown()
+
+
+async def _flush() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_identical_pending_messages_are_dropped(scheduler):
+    assert scheduler.enqueue("hello", 3, "#FFFFFF")
+    assert not scheduler.enqueue("hello", 3, "#FFFFFF")
+
+    assert scheduler.depth == 1
+    assert scheduler.deduplicated == 1
+
+
+async def test_merged_message_stays_long_enough_to_scroll(scheduler, sent):
+    scheduler.enqueue("Front door", 3, "#FFFFFF")
+    scheduler.enqueue("Back door", 3, "#FFFFFF")
+    await _flush()
+
+    merged = f"Front door{NOTIFY_MERGE_SEPARATOR}Back door"
+    assert scheduler.merged == 1
+    assert sent == [(merged, scroll_duration(measure(merged), 64))]
+    assert sent[0][1] > 6
+
+
+async def test_merge_that_would_scroll_too_long_is_refused(scheduler):
+    text = "x" * 58
+    scheduler.enqueue(text, 33, "#FFFFFF", font="10x20")
+    scheduler.enqueue(text.upper(), 33, "#FFFFFF", font="10x20")
+
+    assert scheduler.merged == 0
+    assert scheduler.depth == 2
+    assert scroll_duration(measure(f"{text}{NOTIFY_MERGE_SEPARATOR}{text}", "10x20"), 64) > TEXT_MAX_DURATION
+
+
+async def test_pages_of_one_split_are_not_merged(scheduler):
+    pages = layout_text(" ".join(f"word{index}" for index in range(200)), 64)
+    group = object()
+    for page in pages:
+        scheduler.enqueue(page.text, page.duration, "#FFFFFF", group=group)
+
+    assert len(pages) > 1
+    assert scheduler.merged == 0
+    assert scheduler.depth == len(pages)
+
+
+async def test_high_priority_is_sent_first(scheduler, sent):
+    scheduler.enqueue("later", 3, "#FFFFFF")
+    scheduler.enqueue("now", 3, "#FF0000", PRIORITY_HIGH)
+    await _flush()
+
+    assert sent[0] == ("now", 3)
@@ -0,0 +1,154 @@
+"""Tests for the adaptive poll interval policy and refresh tiers."""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from custom_components.mosaic.api import MosaicAPIClient
+from custom_components.mosaic.const import DEFAULT_STREAM_POLL_INTERVAL
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+from custom_components.mosaic.polling import AdaptivePollPolicy, RefreshTier
+
+
+ROTATION_ROUTE = "GET /api/displays/{id}/rotation"
+
+
+def _policy(**kwargs) -> AdaptivePollPolicy:
+    options = {"interval": 10, "burst_interval": 2, "idle_interval": 60, "max_backoff": 100}
+    return AdaptivePollPolicy(**{**options, **kwargs})
+
+
+def test_active_displays_poll_at_the_base_interval():
+    policy = _policy()
+    policy.note_success(changed=True, all_off=False)
+
+    assert policy.next_interval() == timedelta(seconds=10)
+
+
+def test_command_starts_a_burst_that_ends():
+    policy = _policy()
+    policy.note_command()
+    assert policy.next_interval() == timedelta(seconds=2)
+
+    policy = _policy(burst_duration=0)
+    policy.note_command()
+    assert policy.next_interval() == timedelta(seconds=10)
+
+
+def test_idle_when_all_off_or_unchanged():
+    policy = _policy()
+    policy.note_success(changed=True, all_off=True)
+    assert policy.next_interval() == timedelta(seconds=60)
+
+    policy = _policy(idle_after=0)
+    policy.note_success(changed=False, all_off=False)
+    assert policy.next_interval() == timedelta(seconds=60)
+
+
+def test_failures_back_off_with_jitter_up_to_the_cap():
+    policy = _policy()
+    expected = []
+    for _ in range(6):
+        policy.note_failure()
+        expected.append(min(100, 10 * 2 ** (policy.failures - 1)))
+        seconds = policy.next_interval().total_seconds()
+        assert 0.75 * expected[-1] <= seconds <= 1.25 * expected[-1]
+
+    assert expected == [10, 20, 40, 80, 100, 100]
+    policy.note_success(changed=False, all_off=False)
+    assert policy.failures == 0
+    assert policy.next_interval() == timedelta(seconds=10)
+
+
+def test_streaming_only_keeps_a_safety_poll():
+    policy = _policy()
+    policy.streaming = True
+    policy.note_command()
+
+    assert policy.next_interval() == timedelta(seconds=max(DEFAULT_STREAM_POLL_INTERVAL, 60))
+
+
+def test_intervals_are_ordered_around_the_base():
+    policy = AdaptivePollPolicy(interval=10, burst_interval=30, idle_interval=5, max_backoff=1)
+
+    assert (policy.burst_interval, policy.idle_interval, policy.max_backoff) == (10, 10, 10)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_follows_the_policy(hass, stub):
+    client = MosaicAPIClient(stub.base_url, retries=0)
+    coordinator = MosaicDataUpdateCoordinator(hass, client, poll_policy=_policy())
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=10)
+
+    await coordinator.async_set_brightness("display_0", 50)
+    assert coordinator.update_interval == timedelta(seconds=2)
+
+    await stub.stop()
+    await coordinator.async_refresh()
+    assert coordinator.poll_policy.failures == 1
+    assert 7.5 <= coordinator.update_interval.total_seconds() <= 12.5
+
+    await stub.start()
+    await coordinator.async_refresh()
+    assert coordinator.poll_policy.failures == 0
+    await coordinator.async_shutdown()
+    await client.close()
+
+
+def test_tier_is_due_until_fresh_and_after_its_interval():
+    tier = RefreshTier("rotation", 60)
+    assert tier.is_due("display_0")
+
+    tier.mark_fresh("display_0")
+    assert not tier.is_due("display_0")
+    assert tier.is_due("display_0", now=time.monotonic() + 60)
+
+    tier.invalidate("display_0")
+    assert tier.is_due("display_0")
+
+
+def test_tier_forgets_displays_that_are_gone():
+    tier = RefreshTier("rotation", 60)
+    tier.mark_fresh("display_0")
+    tier.mark_fresh("display_1")
+
+    tier.retain(["display_1"])
+
+    assert tier.age("display_0") is None
+    assert tier.as_dict()["stale"] == []
+    assert list(tier.as_dict()["age"]) == ["display_1"]
+
+
+@pytest.mark.asyncio
+async def test_rotation_is_only_fetched_when_due_or_invalidated(hass, stub, api):
+    coordinator = MosaicDataUpdateCoordinator(hass, api, rotation_interval=600)
+    await coordinator.async_refresh()
+    assert stub.requests_by_route[ROTATION_ROUTE] == 4
+
+    stub.rotations["display_2"]["apps"] = ["clock"]
+    await coordinator.async_refresh()
+    assert stub.requests_by_route[ROTATION_ROUTE] == 4
+    assert coordinator.get_display("display_2")["rotation"]["apps"] != ["clock"]
+
+    coordinator.rotation_tier.invalidate("display_2")
+    await coordinator.async_refresh()
+    assert stub.requests_by_route[ROTATION_ROUTE] == 5
+    assert coordinator.get_display("display_2")["rotation"]["apps"] == ["clock"]
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rotation_write_confirms_the_tier(hass, stub, api):
+    coordinator = MosaicDataUpdateCoordinator(hass, api, rotation_interval=600)
+    await coordinator.async_refresh()
+    coordinator.rotation_tier.invalidate("display_0")
+
+    await coordinator.async_set_rotation_enabled("display_0", False)
+    await coordinator.async_refresh()
+
+    # The PUT answered with the rotation config, no follow-up GET needed
+    assert stub.requests_by_route[ROTATION_ROUTE] == 4
+    assert coordinator.get_display("display_0")["rotation"]["enabled"] is False
+    await coordinator.async_shutdown()
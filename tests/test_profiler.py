@@ -0,0 +1,41 @@
+"""Tests for the on-demand profiler."""
+
+import asyncio
+import os
+import tracemalloc
+
+import pytest
+
+from custom_components.mosaic.const import DATA_PROFILER, DOMAIN
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+from custom_components.mosaic.profiler import async_profile
+from custom_components.mosaic.switch import MosaicPowerSwitch
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_profile_counts_requests_refreshes_and_state_writes(hass, api):
+    hass.data[DOMAIN] = {}
+    coordinator = MosaicDataUpdateCoordinator(hass, api)
+    await coordinator.async_refresh()
+    entity = MosaicPowerSwitch(coordinator, "entry", "display_0")
+    entity.hass = hass
+    entity.entity_id = "switch.display_0_power"
+    # Bound before the session starts, like a listener registered at setup
+    write_state = entity.async_write_ha_state
+
+    async def _exercise():
+        await asyncio.sleep(0.01)
+        await coordinator.async_refresh()
+        await api.get_rotation("display_1", limit=asyncio.Semaphore(1), timeout=5)
+        write_state()
+
+    result, _ = await asyncio.gather(async_profile(hass, 0.1), _exercise())
+    await coordinator.async_shutdown()
+
+    assert result["refreshes"] == 1
+    assert result["requests"] >= 2
+    assert result["state_writes"] == 1
+    assert os.path.exists(result["path"])
+    assert not tracemalloc.is_tracing()
+    assert hass.data[DOMAIN].get(DATA_PROFILER) is None
@@ -0,0 +1,102 @@
+"""Tests for staggering polls and sharing the request limit across entries."""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from benchmarks.stub_server import StubAddon
+from custom_components.mosaic.api import MosaicAPIClient
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+from custom_components.mosaic.polling import AdaptivePollPolicy
+from custom_components.mosaic.scheduler import MosaicScheduler
+
+INTERVAL = timedelta(minutes=10)
+
+
+def _slot(scheduler: MosaicScheduler, delay: timedelta) -> float:
+    """Return where a poll after delay lands, as a fraction of the interval."""
+    elapsed = time.monotonic() + delay.total_seconds() - scheduler._epoch
+    return (elapsed % INTERVAL.total_seconds()) / INTERVAL.total_seconds()
+
+
+def test_single_member_keeps_its_interval():
+    scheduler = MosaicScheduler()
+    scheduler.register("entry_a")
+
+    assert scheduler.align("entry_a", INTERVAL) == INTERVAL
+    assert scheduler.align("entry_a", timedelta(0)) == timedelta(0)
+
+
+def test_members_land_on_evenly_spaced_slots():
+    scheduler = MosaicScheduler()
+    members = ["entry_a", "entry_b", "entry_c", "entry_d"]
+    for member in members:
+        scheduler.register(member)
+
+    for index, member in enumerate(members):
+        delay = scheduler.align(member, INTERVAL)
+        assert INTERVAL / 2 <= delay <= INTERVAL * 1.5
+        assert _slot(scheduler, delay) == pytest.approx(index / len(members), abs=0.01)
+
+
+def test_unregistered_member_frees_its_slot():
+    scheduler = MosaicScheduler()
+    scheduler.register("entry_a")
+    unregister = scheduler.register("entry_b")
+    scheduler.register("entry_c")
+
+    unregister()
+    unregister()
+
+    assert scheduler.members == 2
+    assert scheduler.phase("entry_c") == 0.5
+    assert scheduler.phase("entry_b") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_entries_poll_out_of_step_and_share_the_request_limit(hass):
+    scheduler = MosaicScheduler(max_requests=2)
+    stubs, clients, coordinators = [], [], []
+    for _ in range(2):
+        stub = StubAddon(displays=4, latency=0.05)
+        await stub.start()
+        client = MosaicAPIClient(stub.base_url, request_limit=scheduler.request_limit)
+        policy = AdaptivePollPolicy(interval=INTERVAL.total_seconds())
+        coordinator = MosaicDataUpdateCoordinator(
+            hass, client, poll_policy=policy, scheduler=scheduler
+        )
+        stubs.append(stub)
+        clients.append(client)
+        coordinators.append(coordinator)
+
+    in_flight = peak = 0
+    acquire = scheduler.request_limit.acquire
+    release = scheduler.request_limit.release
+
+    async def _counting_acquire():
+        nonlocal in_flight, peak
+        await acquire()
+        in_flight += 1
+        peak = max(peak, in_flight)
+
+    def _counting_release():
+        nonlocal in_flight
+        in_flight -= 1
+        release()
+
+    scheduler.request_limit.acquire = _counting_acquire
+    scheduler.request_limit.release = _counting_release
+    try:
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+        slots = [_slot(scheduler, coordinator.update_interval) for coordinator in coordinators]
+        assert slots == [pytest.approx(0.0, abs=0.01), pytest.approx(0.5, abs=0.01)]
+        assert peak == 2
+    finally:
+        for coordinator, client, stub in zip(coordinators, clients, stubs):
+            await coordinator.async_shutdown()
+            await client.close()
+            await stub.stop()
+    assert scheduler.members == 0
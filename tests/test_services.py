@@ -0,0 +1,88 @@
+"""Tests for routing services and entities when several add-ons are set up."""
+
+import pytest
+import pytest_asyncio
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+
+from benchmarks.stub_server import StubAddon
+from custom_components.mosaic import _async_migrate_unique_ids, _coordinator_for
+from custom_components.mosaic.api import MosaicAPIClient
+from custom_components.mosaic.const import DATA_COORDINATOR, DOMAIN
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+from custom_components.mosaic.switch import MosaicPowerSwitch
+
+pytestmark = pytest.mark.asyncio
+
+
+def _entry(entry_id: str) -> ConfigEntry:
+    return ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Mosaic",
+        data={},
+        source="user",
+        entry_id=entry_id,
+    )
+
+
+@pytest_asyncio.fixture
+async def two_addons(hass):
+    """Load two add-ons that both have displays display_0 and display_1."""
+    hass.data[DOMAIN] = {}
+    stubs, clients, coordinators = [], [], []
+    for entry_id, displays in (("entry_a", 2), ("entry_b", 3)):
+        stub = StubAddon(displays=displays)
+        await stub.start()
+        client = MosaicAPIClient(stub.base_url)
+        coordinator = MosaicDataUpdateCoordinator(hass, client)
+        await coordinator.async_refresh()
+        hass.data[DOMAIN][entry_id] = {DATA_COORDINATOR: coordinator}
+        stubs.append(stub)
+        clients.append(client)
+        coordinators.append(coordinator)
+    yield coordinators
+    for stub, client, coordinator in zip(stubs, clients, coordinators):
+        await coordinator.async_shutdown()
+        await client.close()
+        await stub.stop()
+
+
+async def test_display_on_one_addon_routes_to_it(hass, two_addons):
+    assert _coordinator_for(hass, "display_2") is two_addons[1]
+
+
+async def test_display_on_several_addons_needs_an_entry(hass, two_addons):
+    with pytest.raises(HomeAssistantError):
+        _coordinator_for(hass, "display_0")
+
+    assert _coordinator_for(hass, "display_0", "entry_b") is two_addons[1]
+    with pytest.raises(HomeAssistantError):
+        _coordinator_for(hass, "display_0", "entry_missing")
+
+
+async def test_unique_ids_are_scoped_to_the_entry(two_addons):
+    first = MosaicPowerSwitch(two_addons[0], "entry_a", "display_0")
+    second = MosaicPowerSwitch(two_addons[1], "entry_b", "display_0")
+
+    assert first.unique_id != second.unique_id
+
+
+async def test_old_unique_ids_are_migrated(hass):
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+    entry = _entry("entry_a")
+    old = registry.async_get_or_create("switch", DOMAIN, "mosaic_default_power", config_entry=entry)
+    registry.async_update_entity(old.entity_id, name="Kitchen sign")
+    current = registry.async_get_or_create(
+        "sensor", DOMAIN, "mosaic_entry_a_refresh_duration", config_entry=entry
+    )
+
+    await _async_migrate_unique_ids(hass, entry)
+
+    migrated = registry.async_get(old.entity_id)
+    assert migrated.unique_id == "mosaic_entry_a_default_power"
+    assert migrated.name == "Kitchen sign"
+    assert registry.async_get(current.entity_id).unique_id == "mosaic_entry_a_refresh_duration"
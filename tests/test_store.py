@@ -0,0 +1,44 @@
+"""Tests for persisting the last known display state."""
+
+import pytest
+from homeassistant.helpers.storage import Store
+
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_state_is_saved_only_when_it_changes(hass, api, stub, monkeypatch):
+    store = Store(hass, 1, "mosaic_test")
+    saves = []
+    # The store calls data_func when the delay expires, after the refresh has set data
+    monkeypatch.setattr(store, "async_delay_save", lambda data_func, delay: saves.append(data_func))
+    coordinator = MosaicDataUpdateCoordinator(hass, api, store=store)
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert len(saves) == 1
+
+    stub.displays["display_0"]["brightness"] = 12
+    await coordinator.async_refresh()
+    assert len(saves) == 2
+    assert saves[-1]()["displays"]["display_0"]["brightness"] == 12
+
+    coordinator._async_apply_event("display", {"id": "display_1", "brightness": 34})
+    assert len(saves) == 3
+    assert saves[-1]()["displays"]["display_1"]["brightness"] == 34
+    await coordinator.async_shutdown()
+
+
+async def test_cached_state_round_trips(hass, api):
+    store = Store(hass, 1, "mosaic_test")
+    coordinator = MosaicDataUpdateCoordinator(hass, api, store=store)
+    await coordinator.async_refresh()
+    await store.async_save(coordinator._data_to_store())
+
+    restored = MosaicDataUpdateCoordinator(hass, api, store=store)
+
+    assert await restored.async_load_cached()
+    assert restored.data == coordinator.data
+    assert not restored.confirmed
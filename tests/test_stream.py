@@ -0,0 +1,72 @@
+"""Tests for the server-sent event stream."""
+
+import pytest
+import pytest_asyncio
+
+from custom_components.mosaic import coordinator as coordinator_module
+from custom_components.mosaic.coordinator import MosaicDataUpdateCoordinator
+
+from .common import async_wait_for
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def fast_backoff(monkeypatch):
+    """Reconnect the stream without the production backoff."""
+    monkeypatch.setattr(coordinator_module, "STREAM_BACKOFF_MIN", 0.01)
+
+
+@pytest_asyncio.fixture
+async def coordinator(hass, api, fast_backoff):
+    """Return a refreshed coordinator, shut down afterwards."""
+    instance = MosaicDataUpdateCoordinator(hass, api)
+    await instance.async_refresh()
+    yield instance
+    await instance.async_shutdown()
+
+
+async def test_stream_updates_and_reconnects(stub, coordinator):
+    coordinator.async_start_stream()
+    await async_wait_for(lambda: coordinator.streaming and stub.stream_clients == 1)
+    streaming_interval = coordinator.update_interval
+
+    stub.publish("display", {"id": "display_0", "brightness": 10})
+    await async_wait_for(lambda: coordinator.get_snapshot("display_0").brightness == 10)
+
+    # The add-on restarts: the stream drops, a refresh catches up, the stream comes back
+    stub.displays["display_1"]["power"] = False
+    stub.disconnect_streams()
+    await async_wait_for(lambda: not coordinator.get_snapshot("display_1").power)
+    await async_wait_for(lambda: coordinator.streaming and stub.stream_clients == 1)
+    assert coordinator.update_interval == streaming_interval
+
+    stub.publish("display_removed", {"id": "display_3"})
+    await async_wait_for(lambda: coordinator.get_snapshot("display_3") is None)
+
+
+async def test_stream_skips_malformed_events(stub, coordinator):
+    coordinator.async_start_stream()
+    await async_wait_for(lambda: stub.stream_clients == 1)
+
+    stub.publish("displays", [1, "display_0"])
+    stub.publish("display", {"id": ["display_0"], "brightness": 1})
+    stub.publish("rotation", {"id": "display_0", "rotation": ["clock"]})
+    stub.publish_raw(b"event: display\ndata: \xff\xfe\n\n")
+    stub.publish("display", {"id": "display_2", "brightness": 33})
+
+    await async_wait_for(lambda: coordinator.get_snapshot("display_2").brightness == 33)
+    assert coordinator.streaming
+    assert coordinator.get_snapshot("display_0").brightness == 80
+    assert set(coordinator.get_display_ids()) == set(stub.displays)
+
+
+async def test_stream_unsupported_falls_back_to_polling(stub, coordinator):
+    stub.events = False
+    polling_interval = coordinator.update_interval
+
+    coordinator.async_start_stream()
+    await async_wait_for(lambda: coordinator._stream_task.done())
+
+    assert not coordinator.streaming
+    assert coordinator.update_interval == polling_interval
@@ -0,0 +1,53 @@
+"""Tests for text measurement and layout."""
+
+from custom_components.mosaic.const import TEXT_ELLIPSIS, TEXT_MAX_DURATION, TEXT_MIN_DURATION
+from custom_components.mosaic.text import layout_text, measure, scroll_duration, truncate
+
+
+def test_measure_uses_per_glyph_widths():
+    assert measure("") == 0
+    assert measure("a") == 5
+    assert measure("il") == 5
+    assert measure("mm") == 13
+    # Characters outside Latin-1 are measured as '?'
+    assert measure("☃") == measure("?")
+
+
+def test_text_that_fits_is_shown_statically():
+    (page,) = layout_text("Hi", 64)
+
+    assert page.duration == TEXT_MIN_DURATION
+    assert page.width == measure("Hi")
+
+
+def test_longer_text_stays_until_it_has_scrolled_through():
+    text = "The washing machine has finished"
+    (page,) = layout_text(text, 64)
+
+    assert page.width > 64
+    assert page.duration == scroll_duration(page.width, 64)
+    assert page.duration * 20 >= page.width + 64
+
+
+def test_long_text_splits_at_word_boundaries():
+    words = [f"word{index}" for index in range(200)]
+    pages = layout_text("  ".join(words), 64)
+
+    assert len(pages) > 1
+    assert all(page.duration <= TEXT_MAX_DURATION for page in pages)
+    assert " ".join(page.text for page in pages).split(" ") == words
+
+
+def test_long_text_is_truncated_without_split():
+    (page,) = layout_text("word " * 200, 64, split=False)
+
+    assert page.text.endswith(TEXT_ELLIPSIS)
+    assert page.duration <= TEXT_MAX_DURATION
+
+
+def test_truncate_fits_max_width():
+    text = truncate("A sentence far too long for a small display", 60)
+
+    assert text.endswith(TEXT_ELLIPSIS)
+    assert measure(text) <= 60
+    assert truncate("short", 60) == "short"